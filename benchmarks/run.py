@@ -0,0 +1,435 @@
+"""Benchmarks for the timer's hot paths.
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --baseline results.json --threshold 0.2
+
+Runs without a display or sound card: customtkinter and pygame are replaced
+by the stand-ins in stubs.py when they can't be imported (or always, with
+--stubs). Results are JSON; with --baseline each metric's p50 is compared
+and the exit status is 1 if any got slower than the threshold allows.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+BENCHMARKS = {}
+
+
+def benchmark(func):
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def summarize(samples, unit):
+    ordered = sorted(samples)
+    return {
+        "unit": unit,
+        "n": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+    }
+
+
+def time_calls(func, count):
+    samples = []
+    for i in range(count):
+        started = time.perf_counter()
+        func(i)
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+class FakeAudio:
+    def play_tick(self): pass
+    def stop_alarm(self): pass
+    def play_alarm_loop(self): pass
+
+
+def _sound_file(kind):
+    return next(p for p in (ROOT / "assets" / "audio" / kind).iterdir() if p.is_file())
+
+
+# --- Benchmarks ---
+@benchmark
+def timer_jitter(args):
+    """Lateness of every tick with `--timers` countdowns on one engine."""
+    from timer_app.timer_engine import TimerEngine
+
+    lateness = []
+    lock = threading.Lock()
+    timers = {}
+    done = threading.Event()
+    remaining = [args.timers]
+
+    def on_tick(name, h, m, s):
+        with lock:
+            lateness.append(timers[name].last_lateness * 1000)
+
+    def on_finish(name):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                done.set()
+
+    engine = TimerEngine(on_tick=on_tick, on_finish=on_finish)
+    with lock:
+        for i in range(args.timers):
+            timers[f"t{i}"] = engine.start(f"t{i}", args.seconds)
+    done.wait(args.seconds + 5)
+    return {"tick_lateness": summarize(lateness, "ms")}
+
+
+@benchmark
+def update_display(args):
+    """TimerPage.update_display per tick, outside and inside the last minute."""
+    import customtkinter
+    from timer_app.timer_logic import TimerLogic
+    from timer_app.ui.timer_page import TimerPage
+
+    page = TimerPage(customtkinter.CTk(), FakeAudio(), TimerLogic(), lambda: None)
+    normal = time_calls(lambda i: page.update_display(1, i % 60, i % 60), args.iterations)
+    last_minute = time_calls(lambda i: page.update_display(0, 0, i % 60), args.iterations)
+    return {
+        "update_display": summarize(normal, "us"),
+        "update_display_last_minute": summarize(last_minute, "us"),
+    }
+
+
+@benchmark
+def display_render(args):
+    """Big countdown per tick: the CTkEntry update TimerPage used to do against its DigitDisplay.
+
+    Each tick ends with update_idletasks(), so under a real Tk the redraw is
+    included; with the stand-ins only the Python side is measured.
+    """
+    import customtkinter
+    from timer_app.timer_logic import TimerLogic
+    from timer_app.ui.timer_page import FLASH_COLOR, RUNNING_COLOR, TimerPage
+
+    root = customtkinter.CTk()
+    page = TimerPage(root, FakeAudio(), TimerLogic(), lambda: None)
+    page.pack(expand=True, fill="both")
+    root.update()
+
+    def text(i):
+        hours, rest = divmod(7200 - i % 7200, 3600)
+        return f"{hours:02}:{rest // 60:02}:{rest % 60:02}"
+
+    def entry_tick(i, flash):
+        page.time_var.set(text(i))
+        page.time_entry.configure(text_color=FLASH_COLOR if flash and i % 2 else RUNNING_COLOR)
+        root.update_idletasks()
+
+    def display_tick(i, flash):
+        page.display.show(text(i))
+        page.display.set_color(FLASH_COLOR if flash and i % 2 else RUNNING_COLOR)
+        root.update_idletasks()
+
+    count = min(args.iterations, 2000)
+    result = {
+        "render_entry_tick": summarize(time_calls(lambda i: entry_tick(i, False), count), "us"),
+        "render_entry_tick_flashing": summarize(time_calls(lambda i: entry_tick(i, True), count), "us"),
+    }
+    page.time_entry.grid_remove()
+    page.display.grid()
+    root.update()
+    result["render_display_tick"] = summarize(time_calls(lambda i: display_tick(i, False), count), "us")
+    result["render_display_tick_flashing"] = summarize(time_calls(lambda i: display_tick(i, True), count), "us")
+    root.destroy()
+    return result
+
+
+@benchmark
+def timer_list_frame(args):
+    """TimerListPage frame with --list-timers timers: steady state and after the set changes."""
+    import customtkinter
+    from timer_app.timer_engine import TimerEngine
+    from timer_app.ui.timer_list_page import TimerListPage
+
+    engine = TimerEngine()
+    for i in range(args.list_timers):
+        engine.start(f"timer {i}", 3600 + i)
+    page = TimerListPage(customtkinter.CTk(), engine, lambda: None)
+    page._draw_rows()
+    updates = [0]
+    itemconfigure = page.canvas.itemconfigure
+
+    def counting_itemconfigure(item, **kwargs):
+        updates[0] += 1
+        itemconfigure(item, **kwargs)
+
+    page.canvas.itemconfigure = counting_itemconfigure
+    count = min(args.iterations, 1000)
+    steady = time_calls(lambda i: page._draw_rows(), count)
+    steady_updates = updates[0]
+
+    def change_and_draw(i):
+        engine.cancel(f"timer {i}")
+        page._draw_rows()
+
+    changed = time_calls(change_and_draw, min(count, 200))
+    for name in engine.names():
+        engine.cancel(name)
+
+    result = {
+        "timer_list_frame": summarize(steady, "us"),
+        "timer_list_frame_after_change": summarize(changed, "us"),
+    }
+    result["timer_list_frame"]["cell_updates_per_frame"] = steady_updates / count
+    return result
+
+
+@benchmark
+def frame_render(args):
+    """Cost of one frame-paced frame (stopwatch and millisecond countdown) against its budget."""
+    import customtkinter
+    from timer_app.frame_pacer import FramePacer
+    from timer_app.settings_manager import SettingsManager
+    from timer_app.timer_logic import TimerLogic
+    from timer_app.ui.stopwatch_page import StopwatchPage
+    from timer_app.ui.timer_page import TimerPage
+
+    budget_us = FramePacer(None, None, fps=60).period / 2 * 1e6
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = SettingsManager(Path(tmp) / "settings.json")
+        settings.set("high_resolution", True)
+        root = customtkinter.CTk()
+
+        stopwatch_page = StopwatchPage(root, settings, lambda: None)
+        stopwatch_page._toggle_running()
+        stopwatch = time_calls(lambda i: stopwatch_page._render(), args.iterations)
+        stopwatch_page._reset()
+
+        timer_logic = TimerLogic()
+        timer_page = TimerPage(root, FakeAudio(), timer_logic, lambda: None, settings_manager=settings)
+        timer_logic.start(3600)
+        timer_page._show_running()
+        countdown = time_calls(lambda i: timer_page._render_precise(), args.iterations)
+        timer_page.pacer.stop()
+        timer_logic.stop()
+
+    result = {
+        "frame_render_stopwatch": summarize(stopwatch, "us"),
+        "frame_render_countdown": summarize(countdown, "us"),
+    }
+    for name, samples in (("frame_render_stopwatch", stopwatch), ("frame_render_countdown", countdown)):
+        result[name]["budget"] = budget_us
+        result[name]["over_budget"] = sum(sample > budget_us for sample in samples)
+    return result
+
+
+@benchmark
+def settings_io(args):
+    """Synchronous save() cost, and the write-behind path a slider drag takes."""
+    from timer_app.settings_manager import SettingsManager
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sync = SettingsManager(Path(tmp) / "sync.json")
+        saves = time_calls(lambda i: sync.set("tick_volume", i / args.iterations), min(args.iterations, 500))
+
+        behind = SettingsManager(Path(tmp) / "behind.json", write_behind=True, debounce=0.05)
+        writes = [0]
+        write_atomic = behind._write_atomic
+
+        def counting_write(data):
+            writes[0] += 1
+            write_atomic(data)
+
+        behind._write_atomic = counting_write
+        drag = time_calls(lambda i: behind.set("tick_volume", i / args.iterations), args.iterations)
+        behind.close()
+
+    result = {
+        "settings_set_sync": summarize(saves, "us"),
+        "settings_set_write_behind": summarize(drag, "us"),
+    }
+    result["settings_set_write_behind"]["disk_writes"] = writes[0]
+    return result
+
+
+@benchmark
+def audio_load(args):
+    """AudioManager._load_sound: cold decode, in-memory hit and mmap'ed disk hit."""
+    import timer_app.audio_manager as audio_manager
+    from timer_app.sound_cache import SoundCache
+
+    root = __import__("customtkinter").CTk()
+    path = _sound_file("alarm_sounds")
+    samples = {"cold": [], "memory": [], "disk": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(args.repeat):
+            manager = audio_manager.AudioManager(root)
+            cache_dir = Path(tmp) / str(i)
+            manager.sound_cache = SoundCache(cache_dir)
+            samples["cold"] += time_calls(lambda _: manager._load_sound(path, is_tick=False), 1)
+            samples["memory"] += time_calls(lambda _: manager._load_sound(path, is_tick=False), 1)
+            manager.sound_cache = SoundCache(cache_dir)
+            samples["disk"] += time_calls(lambda _: manager._load_sound(path, is_tick=False), 1)
+    return {f"audio_load_{kind}": summarize(values, "us") for kind, values in samples.items()}
+
+
+@benchmark
+def mixer(args):
+    """SoftwareMixer block cost with 1 and --timers alarms ringing at once (null output)."""
+    import numpy as np
+    from timer_app.mixer import NullOutput, SoftwareMixer
+
+    output = NullOutput()
+    mixer = SoftwareMixer(output)
+    block_us = output.block_frames / output.sample_rate * 1e6
+    tone = np.sin(np.arange(output.sample_rate) * 2 * np.pi * 440 / output.sample_rate).astype(np.float32)
+    samples = np.repeat(tone[:, None], output.channels, axis=1)
+
+    result = {}
+    for voices in (1, args.timers):
+        for _ in range(voices):
+            mixer.play(samples, gain=1.0 / voices, loops=-1)
+        name = f"mixer_block_{voices}_voices"
+        result[name] = summarize(time_calls(lambda i: mixer.render(), min(args.iterations, 500)), "us")
+        result[name]["realtime_fraction"] = result[name]["p50"] / block_us
+        mixer.stop_all()
+        mixer.render()
+    return result
+
+
+@benchmark
+def history_queries(args):
+    """HistoryStore with --history-runs runs: daily totals, overrun distribution, newest runs."""
+    import random
+    from timer_app.history import HistoryStore
+
+    rng = random.Random(0)
+    now = time.time()
+    span = 365 * 86400
+    rows = []
+    for i in range(args.history_runs):
+        started = now - span + i * span / args.history_runs
+        cancelled = rng.random() < 0.1
+        rows.append((rng.choice(("main", "tea", "focus")), 1500, started, started + 1500,
+                     750 if cancelled else 1500, rng.expovariate(200), int(cancelled)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistoryStore(Path(tmp) / "history.sqlite3")
+        started = time.perf_counter()
+        store.record_many(rows)
+        insert_ms = (time.perf_counter() - started) * 1000
+        count = min(args.iterations, 200)
+        result = {
+            "history_daily_totals_14_days": summarize(
+                time_calls(lambda i: store.daily_totals(since=now - 14 * 86400), count), "us"),
+            "history_daily_totals_all_one_label": summarize(
+                time_calls(lambda i: store.daily_totals(label="tea"), count), "us"),
+            "history_overrun_distribution": summarize(
+                time_calls(lambda i: store.overrun_distribution(), count), "us"),
+            "history_newest_100_runs": summarize(
+                time_calls(lambda i: list(store.runs(newest_first=True, limit=100)), count), "us"),
+        }
+    result["history_daily_totals_14_days"]["insert_ms"] = insert_ms
+    return result
+
+
+@benchmark
+def app_startup(args):
+    """App construction up to the first idle pass (time_to_first_frame)."""
+    from timer_app.app import App
+
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(args.repeat):
+            app = App(settings_path=Path(tmp) / "user_settings.json")
+            app.update()
+            samples.append(app.time_to_first_frame * 1000)
+            app.on_close()
+    return {"app_time_to_first_frame": summarize(samples, "ms")}
+
+
+@benchmark
+def headless_cold_start(args):
+    """Fresh interpreter importing the headless CLI."""
+    samples = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import timer_app.cli"], cwd=SRC, check=True)
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"headless_cold_start": summarize(samples, "ms")}
+
+
+# --- Baseline comparison ---
+def compare(results, baseline, threshold):
+    regressions = []
+    print(f"{'metric':40} {'baseline p50':>14} {'current p50':>14} {'change':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        change = (current["p50"] - previous["p50"]) / previous["p50"] if previous["p50"] else 0.0
+        flag = " !" if change > threshold else ""
+        print(f"{name:40} {previous['p50']:>11.3f} {previous['unit']:2} {current['p50']:>11.3f} "
+              f"{current['unit']:2} {change:>+7.1%}{flag}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Run only these benchmarks.")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file.")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previous --output file.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown (0.2 = 20%%).")
+    parser.add_argument("--stubs", action="store_true", help="Always use the Tk/pygame stand-ins.")
+    parser.add_argument("--timers", type=int, default=200)
+    parser.add_argument("--seconds", type=int, default=3)
+    parser.add_argument("--list-timers", type=int, default=10000)
+    parser.add_argument("--history-runs", type=int, default=200000)
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    import stubs
+    stubbed = stubs.install(force=args.stubs)
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        print(f"running {name}...", file=sys.stderr)
+        results.update(BENCHMARKS[name](args))
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "stubbed": stubbed,
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=4))
+    else:
+        print(json.dumps(report, indent=4))
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressed: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+"""Stand-ins for customtkinter and pygame so benchmarks run without a display or sound card.
+
+They record nothing and draw nothing; timings taken against them measure the
+app's own Python-side cost, not Tk rendering or SDL decoding.
+"""
+import sys
+import types
+
+
+class StringVar:
+    def __init__(self, master=None, value=""):
+        self._value = value
+        self._traces = []
+
+    def trace_add(self, mode, callback):
+        self._traces.append(callback)
+
+    def set(self, value):
+        self._value = value
+        for callback in list(self._traces):
+            callback("var", "", "write")
+
+    def get(self):
+        return self._value
+
+
+class CTkFont:
+    def __init__(self, *args, **kwargs):
+        self.options = kwargs
+
+    def measure(self, text):
+        return len(text) * self.options.get("size", 12)
+
+    def metrics(self, key=None):
+        size = self.options.get("size", 12)
+        return {"linespace": size, "ascent": size, "descent": 0} if key is None else size
+
+
+class AppearanceModeTracker:
+    mode = "Light"
+    callbacks = []
+
+    @classmethod
+    def set_appearance_mode(cls, mode):
+        mode = "Dark" if mode == "Dark" else "Light"
+        if mode != cls.mode:
+            cls.mode = mode
+            for callback in list(cls.callbacks):
+                callback(mode)
+
+
+class CTkAppearanceModeBaseClass:
+    def __init__(self):
+        AppearanceModeTracker.callbacks.append(self._set_appearance_mode)
+        self.__dark = AppearanceModeTracker.mode == "Dark"
+
+    def destroy(self):
+        AppearanceModeTracker.callbacks.remove(self._set_appearance_mode)
+
+    def _set_appearance_mode(self, mode_string):
+        self.__dark = mode_string == "Dark"
+
+    def _apply_appearance_mode(self, color):
+        return color[1 if self.__dark else 0] if isinstance(color, (tuple, list)) else color
+
+
+class ThemeManager:
+    theme = {"CTk": {"fg_color": ["gray92", "gray14"]}, "CTkLabel": {"text_color": ["gray14", "gray84"]}}
+
+
+class Widget:
+    def __init__(self, master=None, **kwargs):
+        self.master = master
+        self._options = dict(kwargs)
+        self._after_seq = 0
+        self._idle = []
+
+    def configure(self, **kwargs):
+        self._options.update(kwargs)
+
+    config = configure
+
+    def cget(self, key):
+        return self._options.get(key)
+
+    def grid(self, **kwargs): pass
+    def grid_forget(self): pass
+    def grid_remove(self): pass
+    def pack(self, **kwargs): pass
+    def pack_forget(self): pass
+    def place(self, **kwargs): pass
+    def grid_rowconfigure(self, *args, **kwargs): pass
+    def grid_columnconfigure(self, *args, **kwargs): pass
+    def bind(self, *args, **kwargs): pass
+    def focus_set(self): pass
+    def index(self, what): return 0
+    def icursor(self, index): pass
+    def set(self, value): self._options["value"] = value
+    def get(self): return self._options.get("value")
+    def winfo_ismapped(self): return True
+    def winfo_height(self): return 720
+    def winfo_width(self): return 1280
+
+    def after(self, ms, func=None, *args):
+        self._after_seq += 1
+        return f"after#{self._after_seq}"
+
+    def after_cancel(self, after_id): pass
+
+    def after_idle(self, func, *args):
+        self._idle.append((func, args))
+
+    def update_idletasks(self): pass
+
+    def update(self):
+        idle, self._idle = self._idle, []
+        for func, args in idle:
+            func(*args)
+
+
+class CTkBaseClass(Widget, CTkAppearanceModeBaseClass):
+    def __init__(self, master=None, **kwargs):
+        Widget.__init__(self, master, **kwargs)
+        CTkAppearanceModeBaseClass.__init__(self)
+
+
+class CTkCanvas(Widget):
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self._items = 0
+        # Options last set per item id or tag.
+        self.item_options = {}
+
+    def create_text(self, *args, **kwargs):
+        self._items += 1
+        return self._items
+
+    create_rectangle = create_line = create_text
+
+    def itemconfigure(self, item, **kwargs):
+        self.item_options.setdefault(item, {}).update(kwargs)
+
+    def destroy(self): pass
+    def coords(self, item, *args): pass
+    def delete(self, *items): pass
+
+
+class CTkScrollbar(CTkBaseClass):
+    def set(self, first, last): self._options["span"] = (first, last)
+
+
+class CTkSwitch(CTkBaseClass):
+    def select(self): self._options["value"] = 1
+    def deselect(self): self._options["value"] = 0
+    def get(self): return self._options.get("value", 0)
+
+
+class CTkTextbox(CTkBaseClass):
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self._text = ""
+
+    def insert(self, index, text): self._text += text
+    def delete(self, start, end=None): self._text = ""
+    def get(self, start="1.0", end="end"): return self._text
+    def see(self, index): pass
+
+
+class CTk(CTkBaseClass):
+    def title(self, text): pass
+    def geometry(self, spec): pass
+    def protocol(self, name, func): pass
+    def mainloop(self): pass
+    def destroy(self): pass
+
+
+def install_tk():
+    module = types.ModuleType("customtkinter")
+    module.StringVar = StringVar
+    module.CTkFont = CTkFont
+    for name in ("CTkFrame", "CTkEntry", "CTkButton", "CTkLabel", "CTkSlider",
+                 "CTkOptionMenu", "CTkScrollableFrame", "CTkToplevel"):
+        setattr(module, name, type(name, (CTkBaseClass,), {}))
+    module.CTkCanvas = CTkCanvas
+    module.CTkScrollbar = CTkScrollbar
+    module.CTkSwitch = CTkSwitch
+    module.CTkTextbox = CTkTextbox
+    module.CTk = CTk
+    module.CTkAppearanceModeBaseClass = CTkAppearanceModeBaseClass
+    module.ThemeManager = ThemeManager
+    module.set_appearance_mode = AppearanceModeTracker.set_appearance_mode
+    module.get_appearance_mode = lambda: AppearanceModeTracker.mode
+    sys.modules["customtkinter"] = module
+    return module
+
+
+class Channel:
+    def __init__(self):
+        self._busy = True
+
+    def get_busy(self): return self._busy
+    def stop(self): self._busy = False
+    def fadeout(self, ms): self._busy = False
+    def set_volume(self, *volume): pass
+    def play(self, sound, loops=0): self._busy = True
+    def queue(self, sound): pass
+    def get_queue(self): return None
+
+
+class Sound:
+    decodes = 0
+
+    def __init__(self, file=None, buffer=None):
+        if buffer is None:
+            # "Decode" by reading and expanding the file the way PCM would be.
+            Sound.decodes += 1
+            with open(file, "rb") as f:
+                data = f.read()
+            self._raw = data * 10
+        else:
+            self._raw = bytearray(buffer)
+        self._volume = 1.0
+
+    def get_raw(self): return bytes(self._raw)
+    def get_length(self): return len(self._raw) / (44100 * 4)
+    def set_volume(self, value): self._volume = value
+    def get_volume(self): return self._volume
+    def play(self, loops=0, maxtime=0, fade_ms=0): return Channel()
+    def stop(self): pass
+
+
+def install_pygame():
+    pygame = types.ModuleType("pygame")
+    mixer = types.ModuleType("pygame.mixer")
+    mixer.init = lambda *args, **kwargs: None
+    mixer.quit = lambda: None
+    mixer.get_init = lambda: (44100, -16, 2)
+    mixer.Sound = Sound
+    mixer.Channel = lambda index=0: Channel()
+    mixer.set_num_channels = lambda count: None
+    mixer.set_reserved = lambda count: None
+    music = types.ModuleType("pygame.mixer.music")
+    for name in ("load", "play", "stop", "set_volume"):
+        setattr(music, name, lambda *args, **kwargs: None)
+    music.get_busy = lambda: False
+    mixer.music = music
+    sndarray = types.ModuleType("pygame.sndarray")
+    # A writable view of the Sound's own bytes, like the real sndarray.samples().
+    sndarray.samples = lambda sound: __import__("numpy").frombuffer(sound._raw, dtype="int16")
+    pygame.mixer = mixer
+    pygame.sndarray = sndarray
+    sys.modules["pygame"] = pygame
+    sys.modules["pygame.mixer"] = mixer
+    sys.modules["pygame.sndarray"] = sndarray
+    return pygame
+
+
+def install(force=False):
+    """Install stand-ins for whichever of customtkinter/pygame is missing (or both, with force)."""
+    installed = []
+    for name, installer in (("customtkinter", install_tk), ("pygame", install_pygame)):
+        if force or not _importable(name):
+            installer()
+            installed.append(name)
+    return installed
+
+
+def _importable(name):
+    try:
+        __import__(name)
+        return True
+    except Exception:
+        return False
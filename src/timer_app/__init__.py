@@ -0,0 +1,3 @@
+from .timer_engine import TimerEngine
+from .timer_logic import TimerLogic
+from .settings_manager import SettingsManager
@@ -1,5 +1,26 @@
-from .app import App
+import sys
+from .cli import COMMANDS
 
-if __name__ == "__main__":
-    app = App()
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        # Headless commands never import the GUI or audio stack.
+        from .cli import main as cli_main
+        return cli_main(argv)
+
+    # A second launch hands its arguments to the running instance instead.
+    from .control import forward_to_running_instance
+    reply = forward_to_running_instance(argv)
+    if reply is not None:
+        if not reply.get("ok"):
+            print(f"Timer app: {reply.get('error')}", file=sys.stderr)
+            return 1
+        return 0
+
+    from .app import App
+    app = App(argv=argv)
     app.mainloop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
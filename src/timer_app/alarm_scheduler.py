@@ -0,0 +1,430 @@
+from bisect import bisect_right
+from datetime import datetime, timedelta
+import heapq
+import itertools
+import re
+import threading
+import time
+
+from .cli import parse_duration
+
+# Headless like cli.py: rules and the scheduler don't need the GUI.
+
+_WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_DAY_GROUPS = {
+    "daily": "mon-sun",
+    "everyday": "mon-sun",
+    "weekdays": "mon-fri",
+    "weekends": "sat-sun",
+}
+_CRON_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+# Far enough ahead for "Feb 29 on a Monday"; anything rarer never fires.
+_SEARCH_DAYS = 366 * 28
+# Missed occurrences are counted up to this many per alarm.
+MAX_MISSED_COUNT = 1000
+
+
+class IntervalRule:
+    """Every `seconds`, counted from `anchor` (a wall-clock timestamp)."""
+
+    def __init__(self, seconds, anchor):
+        if seconds <= 0:
+            raise ValueError("Interval must be at least one second")
+        self.seconds = seconds
+        self.anchor = anchor
+
+    def next_after(self, ts):
+        if ts < self.anchor:
+            return self.anchor
+        return self.anchor + ((ts - self.anchor) // self.seconds + 1) * self.seconds
+
+    def count_between(self, start, end):
+        """Occurrences in (start, end]."""
+        first = self.next_after(start)
+        if first > end:
+            return 0
+        return int((end - first) // self.seconds) + 1
+
+
+class CronRule:
+    """Minute, hour, day of month, month and weekday sets, in local time.
+
+    As in cron, when both day of month and weekday are restricted a day
+    matching either one counts.
+    """
+
+    def __init__(self, minutes, hours, days, months, weekdays, any_day=True, any_weekday=True):
+        self.minutes = sorted(minutes)
+        self.hours = sorted(hours)
+        self.days = set(days)
+        self.months = set(months)
+        self.weekdays = set(weekdays)
+        self.any_day = any_day
+        self.any_weekday = any_weekday
+
+    def _day_matches(self, day):
+        if day.month not in self.months:
+            return False
+        in_days = day.day in self.days
+        # cron counts Sunday as 0; datetime.weekday() has Monday as 0.
+        in_weekdays = (day.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def next_after(self, ts):
+        start = datetime.fromtimestamp(ts).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.replace(hour=0, minute=0)
+        for offset in range(_SEARCH_DAYS):
+            if self._day_matches(day):
+                first_day = offset == 0
+                for hour in self.hours:
+                    if first_day and hour < start.hour:
+                        continue
+                    for minute in self.minutes:
+                        if first_day and hour == start.hour and minute < start.minute:
+                            continue
+                        fire = day.replace(hour=hour, minute=minute).timestamp()
+                        if fire > ts:
+                            return fire
+            day += timedelta(days=1)
+        return None
+
+    def count_between(self, start, end):
+        # Counted a day at a time from the minute fields rather than by
+        # stepping through every fire time; "* * * * *" over a day is 1440.
+        if end <= start:
+            return 0
+        first = datetime.fromtimestamp(start)
+        last = datetime.fromtimestamp(end)
+        day = first.date()
+        count = 0
+        while day <= last.date() and count < MAX_MISSED_COUNT:
+            if self._day_matches(day):
+                after = first.hour * 60 + first.minute if day == first.date() else -1
+                until = last.hour * 60 + last.minute if day == last.date() else 24 * 60 - 1
+                count += self._count_in_day(after, until)
+            day += timedelta(days=1)
+        return min(count, MAX_MISSED_COUNT)
+
+    def _count_in_day(self, after, until):
+        """Fire times in one day whose minute of the day is in (after, until]."""
+        count = 0
+        for hour in self.hours:
+            base = hour * 60
+            if base > until:
+                break
+            count += max(0, bisect_right(self.minutes, until - base) - bisect_right(self.minutes, after - base))
+        return count
+
+
+def _cron_field(text, low, high, names=None):
+    values = set()
+    for part in text.lower().split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"Invalid step in {text!r}")
+        if part == "*":
+            first, last = low, high
+        elif "-" in part:
+            first, last = (_cron_value(value, names) for value in part.split("-", 1))
+        else:
+            first = _cron_value(part, names)
+            last = high if step > 1 else first
+        if not low <= first <= high or not low <= last <= high:
+            raise ValueError(f"{text!r} is outside {low}-{high}")
+        if first <= last:
+            values.update(range(first, last + 1, step))
+        else:
+            # Wrapping ranges such as "fri-mon" or "sat-sun" (sun is 0).
+            values.update(range(first, high + 1, step))
+            values.update(range(low, last + 1, step))
+    return values
+
+
+def _cron_value(text, names):
+    if names and text[:3] in names:
+        return names.index(text[:3])
+    return int(text)
+
+
+_CRON_WEEKDAYS = ("sun", "mon", "tue", "wed", "thu", "fri", "sat")
+
+
+def parse_rule(text, anchor=None):
+    """Parse a recurrence rule.
+
+    Accepts "every 25m" (any parse_duration() duration), a day list and a
+    time such as "weekdays 07:00", "daily 6:30", "mon,wed,fri 18:15" or
+    "sat-sun 09:00", or a five-field cron expression like "*/15 9-17 * * 1-5".
+    `anchor` is when an interval starts counting from (default: now).
+    """
+    text = " ".join(text.strip().lower().split())
+    if text.startswith("every "):
+        return IntervalRule(parse_duration(text[6:]), time.time() if anchor is None else anchor)
+
+    match = re.fullmatch(r"([a-z,\-]+) (\d{1,2}):(\d{2})", text)
+    if match:
+        days, hour, minute = match.group(1), int(match.group(2)), int(match.group(3))
+        if hour > 23 or minute > 59:
+            raise ValueError(f"Invalid time in {text!r}")
+        days = _DAY_GROUPS.get(days, days)
+        if any(part[:3] not in _WEEKDAYS for part in re.split(r"[,\-]", days)):
+            raise ValueError(f"Unknown days {match.group(1)!r}")
+        weekdays = _cron_field(days, 0, 6, _CRON_WEEKDAYS)
+        return CronRule({minute}, {hour}, range(1, 32), range(1, 13), weekdays)
+
+    fields = text.split(" ")
+    if len(fields) == 5:
+        minutes, hours, days, months, weekdays = (
+            _cron_field(field, low, high, _CRON_WEEKDAYS if index == 4 else None)
+            for index, (field, (low, high)) in enumerate(zip(fields, _CRON_RANGES))
+        )
+        return CronRule(
+            minutes, hours, days, months, weekdays,
+            any_day=fields[2] == "*", any_weekday=fields[4] == "*"
+        )
+    raise ValueError(f"Invalid schedule: {text!r}")
+
+
+class Alarm:
+    __slots__ = ("name", "text", "rule", "created", "enabled", "next_fire", "generation")
+
+    def __init__(self, name, text, rule, created, enabled=True):
+        self.name = name
+        self.text = text
+        self.rule = rule
+        self.created = created
+        self.enabled = enabled
+        self.next_fire = None
+        self.generation = 0
+
+    def to_dict(self):
+        return {"name": self.name, "rule": self.text, "created": self.created, "enabled": self.enabled}
+
+
+class AlarmScheduler:
+    """Fires recurring alarms from a heap of next-fire times.
+
+    Adding, removing or firing an alarm costs O(log n); removal just marks
+    the heap entry stale, as in TimerEngine. The scheduler thread sleeps
+    until the earliest fire time, so thousands of alarms cost nothing
+    between fires. Deadlines are wall-clock times: the thread re-checks at
+    least every `max_sleep` seconds so a suspend or clock change is noticed.
+
+    Alarms are stored in the settings under "alarms". Rather than rewrite
+    that list on every fire, only "alarms_checked_at" is updated: every
+    occurrence up to that time has been handled, so whatever fell between
+    it and startup was missed while the app was closed.
+    """
+
+    def __init__(self, settings_manager=None, on_fire=None, clock=time.time, max_sleep=30.0):
+        self.settings = settings_manager
+        self.on_fire = on_fire or (lambda alarm, fire_time: None)
+        self.clock = clock
+        self.max_sleep = max_sleep
+        self.checked_at = None
+        self._alarms = {}
+        # What goes in the settings, per alarm; kept so saving is a list copy.
+        self._stored = {}
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closed = False
+        # Cleared while load_in_background() runs; see there.
+        self._loaded = threading.Event()
+        self._loaded.set()
+
+    def load_in_background(self, on_loaded):
+        """Run load() on a worker thread and pass its result to on_loaded there.
+
+        Counting what was missed can take a while with many alarms, so the
+        GUI doesn't wait for it. Until it is done, add(), remove(),
+        set_enabled() and close() block, so nothing changed meanwhile is
+        overwritten by the stored list.
+        """
+        self._loaded.clear()
+
+        def run():
+            missed = []
+            try:
+                missed = self.load()
+            except Exception as e:
+                print(f"Failed to load alarms: {e}")
+            finally:
+                self._loaded.set()
+            on_loaded(missed)
+
+        threading.Thread(target=run, name="AlarmLoad", daemon=True).start()
+
+    def load(self, now=None):
+        """Schedule the stored alarms; returns [(alarm, missed_count)] for the ones missed."""
+        now = self.clock() if now is None else now
+        stored = self.settings.get("alarms", []) if self.settings is not None else []
+        checked_at = self.settings.get("alarms_checked_at") if self.settings is not None else None
+        checked_at = now if checked_at is None else checked_at
+
+        alarms = {}
+        missed = []
+        # One pass over every alarm and a single heapify, instead of n pushes.
+        for data in stored:
+            try:
+                created = data.get("created", now)
+                alarm = Alarm(
+                    data["name"], data["rule"], parse_rule(data["rule"], anchor=created),
+                    created, data.get("enabled", True)
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"Failed to load alarm {data!r}: {e}")
+                continue
+            if alarm.enabled:
+                count = alarm.rule.count_between(max(checked_at, created), now)
+                if count:
+                    missed.append((alarm, count))
+                alarm.next_fire = alarm.rule.next_after(now)
+            alarms[alarm.name] = alarm
+
+        with self._cond:
+            self._alarms = alarms
+            self._stored = {name: alarm.to_dict() for name, alarm in alarms.items()}
+            self._heap = [
+                (alarm.next_fire, next(self._seq), alarm.generation, alarm)
+                for alarm in alarms.values() if alarm.next_fire is not None
+            ]
+            heapq.heapify(self._heap)
+            self.checked_at = now
+            self._ensure_thread()
+            self._cond.notify()
+        self._save_checked_at()
+        return missed
+
+    def add(self, name, text, enabled=True):
+        """Add or replace the alarm `name`; raises ValueError for a bad rule."""
+        self._loaded.wait()
+        created = self.clock()
+        alarm = Alarm(name, text, parse_rule(text, anchor=created), created, enabled)
+        with self._cond:
+            old = self._alarms.get(name)
+            if old is not None:
+                old.generation += 1
+            self._alarms[name] = alarm
+            self._stored[name] = alarm.to_dict()
+            if enabled:
+                self._push(alarm, created)
+            self._ensure_thread()
+            self._cond.notify()
+        self._save_alarms()
+        return alarm
+
+    def remove(self, name):
+        self._loaded.wait()
+        with self._cond:
+            alarm = self._alarms.pop(name, None)
+            if alarm is None:
+                return False
+            del self._stored[name]
+            alarm.generation += 1
+            self._cond.notify()
+        self._save_alarms()
+        return True
+
+    def set_enabled(self, name, enabled):
+        self._loaded.wait()
+        with self._cond:
+            alarm = self._alarms.get(name)
+            if alarm is None or alarm.enabled == enabled:
+                return False
+            alarm.enabled = enabled
+            self._stored[name] = alarm.to_dict()
+            alarm.generation += 1
+            alarm.next_fire = None
+            if enabled:
+                self._push(alarm, self.clock())
+            self._cond.notify()
+        self._save_alarms()
+        return True
+
+    def get(self, name):
+        return self._alarms.get(name)
+
+    def upcoming(self, limit=None):
+        """Enabled alarms in fire order."""
+        with self._cond:
+            alarms = [alarm for alarm in self._alarms.values() if alarm.next_fire is not None]
+        if limit is None:
+            return sorted(alarms, key=lambda alarm: alarm.next_fire)
+        return heapq.nsmallest(limit, alarms, key=lambda alarm: alarm.next_fire)
+
+    def __len__(self):
+        return len(self._alarms)
+
+    def close(self):
+        self._loaded.wait()
+        with self._cond:
+            self._closed = True
+            self.checked_at = self.clock()
+            self._cond.notify()
+        self._save_checked_at()
+
+    def _push(self, alarm, after):
+        alarm.next_fire = alarm.rule.next_after(after)
+        if alarm.next_fire is not None:
+            heapq.heappush(self._heap, (alarm.next_fire, next(self._seq), alarm.generation, alarm))
+
+    def _save_alarms(self):
+        if self.settings is not None:
+            with self._cond:
+                data = list(self._stored.values())
+            self.settings.set("alarms", data)
+
+    def _save_checked_at(self):
+        if self.settings is not None:
+            self.settings.set("alarms_checked_at", self.checked_at)
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="AlarmScheduler", daemon=True)
+            self._thread.start()
+
+    def _next_due(self):
+        with self._cond:
+            while not self._closed:
+                while self._heap and self._heap[0][2] != self._heap[0][3].generation:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                now = self.clock()
+                fire_time = self._heap[0][0]
+                if now < fire_time:
+                    self._cond.wait(min(fire_time - now, self.max_sleep))
+                    continue
+                _, _, _, alarm = heapq.heappop(self._heap)
+                # After a suspend, ring once and carry on from now rather than
+                # replaying every occurrence that was slept through.
+                self._push(alarm, max(fire_time, now))
+                # Everything before the next due entry has been handled; an
+                # alarm due at the same moment must still count as missed
+                # if the app stops before it rings.
+                if self._heap and self._heap[0][0] <= now:
+                    self.checked_at = self._heap[0][0] - 0.001
+                else:
+                    self.checked_at = now
+                return alarm, fire_time
+            return None
+
+    def _run(self):
+        while True:
+            due = self._next_due()
+            if due is None:
+                return
+            alarm, fire_time = due
+            self._save_checked_at()
+            try:
+                self.on_fire(alarm, fire_time)
+            except Exception as e:
+                print(f"Alarm callback for {alarm.name!r} failed: {e}")
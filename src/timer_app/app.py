@@ -1,50 +1,330 @@
 import customtkinter
+import math
+import os
+import time
 from .audio_manager import AudioManager
 from .timer_logic import TimerLogic
+from .timer_engine import TimerEngine
 from .ui.timer_page import TimerPage
 from .ui.settings_page import SettingsPage
+from .ui.timer_list_page import TimerListPage
+from .ui.stopwatch_page import StopwatchPage
+from .ui.alarm_page import AlarmPage
+from .ui.history_page import HistoryPage
 from pathlib import Path
-from .settings_manager import SettingsManager
+from .settings_manager import APPEARANCE_MODES, SettingsManager
+from .metrics import Metrics, EventLoopMonitor
+from .async_timer import TkAsyncBridge
+from .journal import TimerJournal
+from .alarm_scheduler import AlarmScheduler
+from .notifications import Notifier, sinks_from_settings
+from .history import HistoryStore
+from . import control
+from .cli import parse_duration
+
+MAIN_TIMER = "main"
 
 class App(customtkinter.CTk):
-    def __init__(self):
+    def __init__(self, settings_path=None, argv=None):
+        self._init_started = time.perf_counter()
+        self.time_to_first_frame = None
         super().__init__()
         self.title("Timer")
         self.geometry("1280x720")
 
-        settings_path = Path(__file__).resolve().parents[2] / "user_settings.json"
-        self.settings_manager = SettingsManager(settings_path)
+        if settings_path is None:
+            settings_path = Path(__file__).resolve().parents[2] / "user_settings.json"
+        self.settings_manager = SettingsManager(settings_path, write_behind=True)
 
         appearance_mode = self.settings_manager.get("appearance_mode", "System")
-        if appearance_mode not in ["Light", "Dark", "System"]:
+        if appearance_mode not in APPEARANCE_MODES:
             appearance_mode = "System"
         customtkinter.set_appearance_mode(appearance_mode)
 
-        self.audio_manager = AudioManager(self, settings_manager=self.settings_manager)
-        self.timer_logic = TimerLogic(
+        # None unless TIMER_APP_METRICS_FILE / TIMER_APP_METRICS_PORT is set.
+        self.metrics = Metrics.from_env()
+        if self.metrics:
+            self.event_loop_monitor = EventLoopMonitor(self, self.metrics.event_loop_lag)
+            self.event_loop_monitor.start()
+
+        self.audio_manager = AudioManager(
+            self, settings_manager=self.settings_manager, load_async=True, metrics=self.metrics
+        )
+        # Commands, log files/FIFOs and webhooks to tell when a timer finishes.
+        self.notifier = Notifier(sinks_from_settings(self.settings_manager.get("notifications", [])))
+        # Running timers are journaled next to the settings so they survive a restart.
+        self.journal = TimerJournal(Path(settings_path).with_name("timers.journal"))
+        journaled_timers = self.journal.replay()
+        # Every finished or cancelled run, for the history page and `history` export.
+        self.history = HistoryStore(Path(settings_path).with_name("history.sqlite3"))
+        # Ticks and finishes reach the UI through this, coalesced per frame.
+        self.async_bridge = TkAsyncBridge(self)
+        # Set up for real further down; the engine's callbacks (including
+        # _restore_timers() ringing expired timers) check it from the start.
+        self.control_server = None
+
+        self.timer_engine = TimerEngine(
             on_tick=self.on_tick_update,
-            on_finish=self.on_timer_finished
+            on_finish=self.on_timer_finished,
+            journal=self.journal,
+            history=self.history
+        )
+        self.timer_logic = TimerLogic(
+            on_tick=lambda h, m, s: self.on_tick_update(MAIN_TIMER, h, m, s),
+            on_finish=lambda: self.on_timer_finished(MAIN_TIMER),
+            engine=self.timer_engine,
+            name=MAIN_TIMER
         )
 
-        self.timer_page = TimerPage(self, self.audio_manager, self.timer_logic, self.show_settings)
-        self.settings_page = SettingsPage(self, self.audio_manager, self.settings_manager, self.show_timer)
+        frame_histogram = self.metrics.frame_render if self.metrics else None
+        self.timer_page = TimerPage(
+            self, self.audio_manager, self.timer_logic, self.show_settings,
+            switch_to_timers=self.show_timers,
+            switch_to_stopwatch=self.show_stopwatch,
+            settings_manager=self.settings_manager,
+            frame_histogram=frame_histogram,
+            switch_to_alarms=self.show_alarms,
+            switch_to_history=self.show_history
+        )
+        # Built on first visit by the show_*() methods below.
+        self.settings_page = None
+        self.timer_list_page = None
+        self.stopwatch_page = None
+        self.alarm_page = None
+        self.history_page = None
+        self.current_page = self.timer_page
         self.timer_page.pack(expand=True, fill="both")
+        # While minimized or withdrawn nothing is redrawn; see _on_unmap().
+        self.window_hidden = False
+        self._hidden_display = None
+        self.bind("<Unmap>", self._on_unmap, add="+")
+        self.bind("<Map>", self._on_map, add="+")
+        self._restore_timers(journaled_timers)
+
+        self.alarm_scheduler = AlarmScheduler(self.settings_manager, on_fire=self.on_alarm_fired)
+        self.missed_alarms = []
+        self.alarm_scheduler.load_in_background(
+            lambda missed: missed and self.after(0, lambda: self._report_missed_alarms(missed))
+        )
+
+        # Edits to user_settings.json by anything else apply without a restart.
+        self.settings_manager.watch(lambda changed: self.after(0, lambda: self._apply_settings(changed)))
+
+        if control.is_supported():
+            self.control_server = control.ControlServer(
+                self.timer_engine,
+                scheduler=self.alarm_scheduler,
+                on_forward=lambda args: self.after(0, lambda: self.handle_args(args)),
+                reserved_names=(MAIN_TIMER,)
+            )
+            try:
+                self.control_server.start()
+            except (OSError, RuntimeError) as e:
+                print(f"Control socket unavailable: {e}")
+                self.control_server = None
+
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.after_idle(self._record_first_frame)
+        if argv:
+            self.handle_args(argv)
+
+    def handle_args(self, argv):
+        """Command-line arguments, from this launch or forwarded by a later one."""
+        self.deiconify()
+        self.lift()
+        if not argv:
+            return
+        try:
+            total_seconds = parse_duration(argv[0])
+        except ValueError:
+            print(f"Ignoring unknown arguments: {' '.join(argv)}")
+            return
+        self.timer_page.start_countdown(total_seconds)
+
+    def _restore_timers(self, entries):
+        now = time.time()
+        for entry in entries.values():
+            remaining = entry.remaining(now)
+            if remaining <= 0:
+                # Ran out while the app was closed: ring now.
+                self.journal.record_finish(entry.name)
+                self.history.record(
+                    entry.name, entry.total_seconds, entry.end_time - entry.total_seconds, now,
+                    entry.total_seconds, overrun=now - entry.end_time
+                )
+                self.on_timer_finished(entry.name)
+                continue
+            try:
+                if entry.name == MAIN_TIMER:
+                    self.timer_logic.restore(entry.total_seconds, remaining, paused=entry.paused)
+                    hours, rest = divmod(math.ceil(remaining), 3600)
+                    self.timer_page.timer_restored(hours, *divmod(rest, 60))
+                else:
+                    self.timer_engine.restore(entry.name, entry.total_seconds, remaining, paused=entry.paused)
+            except ValueError as e:
+                print(f"Failed to restore timer {entry.name!r}: {e}")
+
+    def _apply_settings(self, changed):
+        if "appearance_mode" in changed:
+            customtkinter.set_appearance_mode(changed["appearance_mode"])
+        self.audio_manager.apply_settings(changed)
+        if self.settings_page is not None:
+            self.settings_page.settings_changed(changed)
+
+    def _record_first_frame(self):
+        self.update_idletasks()
+        self.time_to_first_frame = time.perf_counter() - self._init_started
+        if os.environ.get("TIMER_APP_TRACE_STARTUP"):
+            print(f"Time to first frame: {self.time_to_first_frame * 1000:.1f} ms")
+
+    def _on_unmap(self, event):
+        # Child widgets' events reach the toplevel's bindings too.
+        if event.widget is not self or self.window_hidden:
+            return
+        self.window_hidden = True
+        if not self.settings_manager.get("background_ticks", False):
+            # No ticks to play or show: let the engine sleep until the alarm.
+            self.timer_logic.set_quiet(True)
+        self._page_visibility(self.current_page, "on_hide")
+
+    def _on_map(self, event):
+        if event.widget is not self or not self.window_hidden:
+            return
+        self.window_hidden = False
+        if self._hidden_display is not None:
+            # E.g. the final 00:00:00 when the alarm went off while hidden.
+            self.timer_page.show_time(*self._hidden_display)
+            self._hidden_display = None
+        # Leaving quiet mode fires one catch-up tick, which redraws the display.
+        self.timer_logic.set_quiet(False)
+        self._page_visibility(self.current_page, "on_show")
+
+    def on_close(self):
+        self.async_bridge.close()
+        self.alarm_scheduler.close()
+        self.notifier.close()
+        self.settings_manager.close()
+        self.audio_manager.close()
+        self.journal.close()
+        self.history.close()
+        if self.control_server:
+            self.control_server.close()
+        if self.metrics:
+            self.metrics.close()
+        self.destroy()
+
+    def _switch_page(self, page):
+        if page is self.current_page:
+            return
+        self.current_page.pack_forget()
+        self._page_visibility(self.current_page, "on_hide")
+        page.pack(expand=True, fill="both")
+        self.current_page = page
+        self._page_visibility(page, "on_show")
+
+    @staticmethod
+    def _page_visibility(page, hook):
+        # Pages with a refresh loop of their own pause it while out of view.
+        callback = getattr(page, hook, None)
+        if callback:
+            callback()
 
     def show_timer(self):
-        self.settings_page.pack_forget()
-        self.timer_page.pack(expand=True, fill="both")
+        self._switch_page(self.timer_page)
         self.audio_manager.stop_alarm()
 
     def show_settings(self):
-        self.timer_page.pack_forget()
-        self.settings_page.pack(expand=True, fill="both")
+        if self.settings_page is None:
+            self.settings_page = SettingsPage(self, self.audio_manager, self.settings_manager, self.show_timer)
+        self._switch_page(self.settings_page)
+
+    def show_timers(self):
+        if self.timer_list_page is None:
+            self.timer_list_page = TimerListPage(self, self.timer_engine, self.show_timer)
+        self._switch_page(self.timer_list_page)
+
+    def show_stopwatch(self):
+        if self.stopwatch_page is None:
+            frame_histogram = self.metrics.frame_render if self.metrics else None
+            self.stopwatch_page = StopwatchPage(
+                self, self.settings_manager, self.show_timer, histogram=frame_histogram
+            )
+        self._switch_page(self.stopwatch_page)
 
-    def on_tick_update(self, h, m, s):
-        self.after(0, lambda: self.timer_page.update_display(h, m, s))
-        
-    def on_timer_finished(self):
+    def show_alarms(self):
+        if self.alarm_page is None:
+            self.alarm_page = AlarmPage(
+                self, self.alarm_scheduler, self.audio_manager, self.show_timer, missed=self.missed_alarms
+            )
+        self._switch_page(self.alarm_page)
+
+    def show_history(self):
+        if self.history_page is None:
+            self.history_page = HistoryPage(self, self.history, self.show_timer)
+        self._switch_page(self.history_page)
+
+    def on_tick_update(self, name, h, m, s):
+        if self.control_server and self.control_server.has_subscribers:
+            self.control_server.publish({"event": "tick", "name": name, "remaining": h * 3600 + m * 60 + s})
+        if name == MAIN_TIMER:
+            run_id = self.timer_logic.run_id
+            # Only the latest tick is drawn if several queue up before Tk gets to them.
+            if self.metrics:
+                deadline = self.timer_logic.last_deadline
+                self.async_bridge.post(("tick", name), lambda: self._update_display_timed(run_id, deadline, h, m, s))
+            else:
+                self.async_bridge.post(("tick", name), lambda: self._update_display(run_id, h, m, s))
+
+    def _update_display_timed(self, run_id, deadline, h, m, s):
+        if self._is_current_run(run_id):
+            self.metrics.tick_to_display.observe(time.monotonic() - deadline)
+            self._update_display(run_id, h, m, s)
+
+    def _update_display(self, run_id, h, m, s):
+        if not self._is_current_run(run_id):
+            return
+        if not self.window_hidden:
+            self.timer_page.update_display(h, m, s)
+            return
+        self._hidden_display = (h, m, s)
+        if self.settings_manager.get("background_ticks", False):
+            self.audio_manager.play_tick()
+
+    def on_timer_finished(self, name):
+        if self.control_server:
+            self.control_server.publish({"event": "finished", "name": name})
+        self.notifier.notify({"event": "finished", "name": name, "time": time.time()})
+        run_id = self.timer_logic.run_id
         def handle_finish():
-            self.audio_manager.play_alarm_loop()
-            self.timer_page.timer_finished()
-        self.after(0, handle_finish)
+            if name == MAIN_TIMER:
+                if not self._is_current_run(run_id):
+                    return
+                self.timer_page.timer_finished()
+            self.audio_manager.play_alarm_loop(name)
+        self.async_bridge.post(("finish", name), handle_finish)
+
+    def on_alarm_fired(self, alarm, fire_time):
+        if self.control_server:
+            self.control_server.publish({"event": "alarm", "name": alarm.name, "time": fire_time})
+        self.notifier.notify({"event": "alarm", "name": alarm.name, "time": fire_time})
+        def handle_alarm():
+            self.audio_manager.play_alarm_loop(f"alarm:{alarm.name}")
+            if self.alarm_page is not None:
+                self.alarm_page.alarm_fired(alarm.name)
+        self.after(0, handle_alarm)
+
+    def _report_missed_alarms(self, missed):
+        # One ring for everything missed while closed, not one per occurrence.
+        self.missed_alarms = missed
+        if self.control_server:
+            for alarm, count in missed:
+                self.control_server.publish({"event": "missed", "name": alarm.name, "count": count})
+        self.audio_manager.play_alarm()
+        if self.alarm_page is not None:
+            self.alarm_page.show_missed(missed)
+        self.show_alarms()
+
+    def _is_current_run(self, run_id):
+        # Ticks queued with after() can land after the user already stopped or restarted.
+        return run_id == self.timer_logic.run_id
 
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+
+class AsyncTimer:
+    """asyncio counterpart of TimerLogic: no thread, just loop.call_at deadlines.
+
+        timer = AsyncTimer(90)
+        async for h, m, s in timer.ticks():
+            ...
+        await timer          # or just await it to wait for the finish
+    """
+
+    def __init__(self, total_seconds, name=None, on_tick=None, on_finish=None):
+        self.loop = asyncio.get_running_loop()
+        self.total_seconds = total_seconds
+        self.name = name
+        self.on_tick = on_tick
+        self.on_finish = on_finish
+        self.tick = 0
+        self.start = self.loop.time()
+        self.end_datetime = datetime.now() + timedelta(seconds=total_seconds)
+        self.last_lateness = 0.0
+        self.max_lateness = 0.0
+        self.remaining = (0, 0, 0)
+        self._queues = []
+        self._done = self.loop.create_future()
+        self._handle = self.loop.call_at(self.start, self._fire)
+
+    @property
+    def done(self):
+        return self._done.done()
+
+    def __await__(self):
+        return asyncio.shield(self._done).__await__()
+
+    async def ticks(self):
+        """Yield (h, m, s) for every tick from now until the timer ends or is cancelled."""
+        queue = asyncio.Queue()
+        self._queues.append(queue)
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                yield item
+        finally:
+            self._queues.remove(queue)
+
+    def cancel(self):
+        if self._done.done():
+            return False
+        self._handle.cancel()
+        self._done.cancel()
+        self._close_queues()
+        return True
+
+    def _fire(self):
+        now = self.loop.time()
+        deadline = self.start + self.tick
+        # Ticks we slept through entirely are dropped instead of replayed.
+        missed = int(now - deadline)
+        if missed:
+            self.tick = min(self.tick + missed, self.total_seconds)
+            deadline = self.start + self.tick
+        self.last_lateness = now - deadline
+        self.max_lateness = max(self.max_lateness, self.last_lateness)
+
+        remaining = self.total_seconds - self.tick
+        hours, rest = divmod(remaining, 3600)
+        minutes, seconds = divmod(rest, 60)
+        self.remaining = (hours, minutes, seconds)
+        for queue in self._queues:
+            queue.put_nowait(self.remaining)
+        if self.on_tick:
+            self.on_tick(hours, minutes, seconds)
+
+        if remaining == 0:
+            self._done.set_result(True)
+            self._close_queues()
+            if self.on_finish:
+                self.on_finish()
+            return
+        self.tick += 1
+        self._handle = self.loop.call_at(self.start + self.tick, self._fire)
+
+    def _close_queues(self):
+        for queue in self._queues:
+            queue.put_nowait(None)
+
+
+class TkAsyncBridge:
+    """Runs an asyncio loop inside Tk's mainloop and applies UI updates once per frame.
+
+    Each frame drains whatever is ready on the asyncio loop, then runs the
+    updates posted during it. Updates are keyed, so a timer that ticked twice
+    between frames is only redrawn once. The frame loop only runs once
+    start() is called (create_task() and create_timer() do that); until then
+    a post() schedules a single flush, so nothing wakes Tk while idle.
+    """
+
+    def __init__(self, root, loop=None, frame_ms=16):
+        self.root = root
+        self.loop = loop or asyncio.new_event_loop()
+        self.frame_ms = frame_ms
+        self._pending = {}
+        # post() is called from the engine's thread as well as from Tk.
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
+        self._after_id = None
+
+    def start(self):
+        if self._after_id is None:
+            self._after_id = self.root.after(0, self._frame)
+
+    def stop(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def close(self):
+        self.stop()
+        for task in asyncio.all_tasks(self.loop):
+            task.cancel()
+        self._run_ready()
+        self.loop.close()
+
+    def post(self, key, update):
+        """Queue `update()` for the next frame, replacing any earlier update for `key`.
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            self._pending[key] = update
+            if self._after_id is not None or self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        # Outside the lock: from another thread this waits on the Tk thread.
+        self.root.after(0, self._flush)
+
+    def create_task(self, coro):
+        self.start()
+        return self.loop.create_task(coro)
+
+    def create_timer(self, total_seconds, name=None, render=None, on_finish=None):
+        """Start an AsyncTimer on the bridged loop; `render(h, m, s)` runs batched per frame."""
+        async def make():
+            on_tick = None
+            if render:
+                on_tick = lambda h, m, s: self.post(("timer", id(timer)), lambda: render(h, m, s))
+            timer = AsyncTimer(total_seconds, name=name, on_tick=on_tick, on_finish=on_finish)
+            return timer
+
+        # Must be called from Tk, between frames, while the loop isn't running.
+        self.start()
+        return self.loop.run_until_complete(make())
+
+    def _run_ready(self):
+        # One pass over the loop: run ready callbacks and due timers without blocking.
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+    def _flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._flush_scheduled = False
+        for update in pending.values():
+            try:
+                update()
+            except Exception as e:
+                print(f"UI update failed: {e}")
+
+    def _frame(self):
+        self._run_ready()
+        self._flush()
+        self._after_id = self.root.after(self.frame_ms, self._frame)
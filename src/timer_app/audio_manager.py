@@ -1,60 +1,197 @@
-from .config import TICK_SOUND, ALARM_SOUND
+from .config import TICK_SOUND, ALARM_SOUND, SOUND_CACHE_DIR
+from .sound_cache import SoundCache
+from .mixer import SoftwareMixer, PygameOutput, samples_from_sound
+from .audio_stream import WavStream, can_stream_wav
+from .clock import SYSTEM_CLOCK
 import pygame
+import threading
+import time
 from pathlib import Path
 
 class AudioManager:
-    def __init__(self, root, settings_manager=None):
-        pygame.mixer.init()
+    def __init__(self, root, settings_manager=None, load_async=False, metrics=None, clock=SYSTEM_CLOCK):
         self.root = root
+        self.clock = clock
         self.settings = settings_manager
-
-        self.tick_volume = 0.5
-        self.alarm_volume = 0.5
-
-        tick_path_str = self.settings.get("tick_sound_path") if self.settings else None
-        alarm_path_str = self.settings.get("alarm_sound_path") if self.settings else None
-
-        tick_path = Path(tick_path_str) if tick_path_str and Path(tick_path_str).exists() else TICK_SOUND
-        alarm_path = Path(alarm_path_str) if alarm_path_str and Path(alarm_path_str).exists() else ALARM_SOUND
-
-        self.tick_sound = pygame.mixer.Sound(str(tick_path))
-        self.alarm_sound = pygame.mixer.Sound(str(alarm_path))
+        self.metrics = metrics
 
         self.tick_volume = self.settings.get("tick_volume", 0.5) if self.settings else 0.5
         self.alarm_volume = self.settings.get("alarm_volume", 0.5) if self.settings else 0.5
 
-        self._apply_volume()
+        cache_mb = self.settings.get("sound_cache_mb", 64) if self.settings else 64
+        self.sound_cache = SoundCache(SOUND_CACHE_DIR, max_bytes=int(cache_mb * 1024 * 1024))
+
+        self.tick_sound = None
+        self.alarm_sound = None
 
         self.tick_channel = None
         self.alarm_channel = None
 
         self._tick_stop_after_id = None
 
+        # With the software mixer every sound is a voice mixed into one reserved
+        # channel, so any number of alarms can ring at once; without it, sounds
+        # go straight to pygame channels as before.
+        self.mixer = None
+        self.tick_samples = None
+        self.alarm_samples = None
+        self._tick_voice = None
+        self._alarm_voices = {}
+
+        # Alarm files above stream_threshold_mb are never decoded whole: WAVs are
+        # streamed through the mixer, anything else through pygame.mixer.music.
+        self.alarm_stream_path = None
+        self._alarm_wav_stream = False
+
+        # Until the mixer is up, ticks are dropped and a requested alarm is held back.
+        self.ready = threading.Event()
+        self._ready_lock = threading.Lock()
+        self._alarm_pending = set()
+
+        if load_async:
+            threading.Thread(target=self._initialize, name="AudioLoader", daemon=True).start()
+        else:
+            self._initialize()
+
+    def _initialize(self):
+        try:
+            pygame.mixer.init()
+            if not self.settings or self.settings.get("software_mixer", True):
+                self._start_mixer()
+            self.tick_sound = self._load_sound(self._configured_path("tick_sound_path", TICK_SOUND), is_tick=True)
+            self._load_alarm(self._configured_path("alarm_sound_path", ALARM_SOUND))
+        except Exception as e:
+            print(f"Failed to initialize audio: {e}")
+            return
+
+        with self._ready_lock:
+            self._apply_volume()
+            self.ready.set()
+            alarm_pending = self._alarm_pending
+            self._alarm_pending = set()
+        for key in alarm_pending:
+            self.play_alarm_loop(key)
+
+    def _start_mixer(self):
+        try:
+            self.mixer = SoftwareMixer(PygameOutput())
+            self.mixer.start()
+        except Exception as e:
+            print(f"Failed to start software mixer: {e}")
+            self.mixer = None
+
+    def close(self):
+        if self.mixer:
+            self.mixer.close()
+
+    def _configured_path(self, key, default):
+        path_str = self.settings.get(key) if self.settings else None
+        return Path(path_str) if path_str and Path(path_str).exists() else default
+
     def _apply_volume(self):
-        self.tick_sound.set_volume(self.tick_volume)
-        self.alarm_sound.set_volume(self.alarm_volume)
+        if self.tick_sound:
+            self.tick_sound.set_volume(self.tick_volume)
+        if self.alarm_sound:
+            self.alarm_sound.set_volume(self.alarm_volume)
+        if self.mixer:
+            for voice in list(self._alarm_voices.values()):
+                self.mixer.set_gain(voice, self.alarm_volume)
+        if self.alarm_stream_path:
+            pygame.mixer.music.set_volume(self.alarm_volume)
+
+    def _should_stream(self, path):
+        threshold_mb = self.settings.get("stream_threshold_mb", 4) if self.settings else 4
+        try:
+            return Path(path).stat().st_size > threshold_mb * 1024 * 1024
+        except OSError:
+            return False
+
+    def _load_alarm(self, path):
+        if not self._should_stream(path):
+            self.alarm_stream_path = None
+            self.alarm_sound = self._load_sound(path, is_tick=False)
+            return
+        self.alarm_stream_path = Path(path)
+        self.alarm_sound = None
+        self.alarm_samples = None
+        self._alarm_wav_stream = self.mixer is not None and can_stream_wav(path)
+        if not self._alarm_wav_stream:
+            pygame.mixer.music.load(str(path))
+            pygame.mixer.music.set_volume(self.alarm_volume)
 
     def _load_sound(self, path, is_tick=True):
-        sound = pygame.mixer.Sound(str(path))
+        normalize_to = None
+        if self.settings and self.settings.get("normalize_loudness", False):
+            normalize_to = self.settings.get("loudness_target_db", -20.0)
+        sound = self.sound_cache.load(path, normalize_to=normalize_to)
         volume = self.tick_volume if is_tick else self.alarm_volume
         sound.set_volume(volume)
+        if self.mixer:
+            samples = samples_from_sound(sound, self.mixer.channels)
+            if is_tick:
+                self.tick_samples = samples
+            else:
+                self.alarm_samples = samples
         return sound
 
+    def reload_sounds(self):
+        """Reload both sounds, e.g. after the normalization setting changed."""
+        if not self.ready.is_set():
+            return
+        self.tick_sound = self._load_sound(self._configured_path("tick_sound_path", TICK_SOUND), is_tick=True)
+        self.stop_alarm()
+        self._load_alarm(self._configured_path("alarm_sound_path", ALARM_SOUND))
+        self.tick_channel = None
+
+    def apply_settings(self, changed):
+        """Pick up settings edited outside the app (see SettingsManager.watch)."""
+        if "tick_volume" in changed or "alarm_volume" in changed:
+            self.tick_volume = float(self.settings.get("tick_volume", 0.5))
+            self.alarm_volume = float(self.settings.get("alarm_volume", 0.5))
+            self._apply_volume()
+        if changed.keys() & {"tick_sound_path", "alarm_sound_path", "normalize_loudness", "loudness_target_db"}:
+            self.reload_sounds()
+
     def set_tick_volume(self, value):
         self.tick_volume = value
-        self.tick_sound.set_volume(value)
+        if self.tick_sound:
+            self.tick_sound.set_volume(value)
         if self.settings:
             self.settings.set("tick_volume", value)
 
     def set_alarm_volume(self, value):
         self.alarm_volume = value
-        self.alarm_sound.set_volume(value)
+        if self.alarm_sound:
+            self.alarm_sound.set_volume(value)
+        if self.mixer:
+            for voice in list(self._alarm_voices.values()):
+                self.mixer.set_gain(voice, value)
+        if self.alarm_stream_path:
+            pygame.mixer.music.set_volume(value)
         if self.settings:
             self.settings.set("alarm_volume", value)
 
     def play_tick(self):
+        if self.metrics:
+            started = time.perf_counter()
+            self._play_tick()
+            self.metrics.play_tick.observe(time.perf_counter() - started)
+        else:
+            self._play_tick()
+
+    def _play_tick(self):
+        if not self.ready.is_set():
+            return
+        if self.mixer:
+            # The mixer cuts the tick off after a second itself; no Tk after() needed.
+            if self._tick_voice is not None:
+                self.mixer.stop(self._tick_voice, fade_ms=5)
+            self._tick_voice = self.mixer.play(
+                self.tick_samples, gain=self.tick_volume, max_ms=1300, fade_out_ms=300
+            )
+            return
         if self._tick_stop_after_id is not None:
-            self.root.after_cancel(self._tick_stop_after_id)
+            self.clock.after_cancel(self.root, self._tick_stop_after_id)
             self._tick_stop_after_id = None
 
         if self.tick_channel is None or not self.tick_channel.get_busy():
@@ -69,23 +206,76 @@ class AudioManager:
                 self.tick_channel = None
             self._tick_stop_after_id = None
 
-        self._tick_stop_after_id = self.root.after(1000, stop_tick)
+        self._tick_stop_after_id = self.clock.after(self.root, 1000, stop_tick)
 
     def play_alarm(self):
-        if self.alarm_channel is None or not self.alarm_channel.get_busy():
+        if not self.ready.is_set():
+            return
+        if self.alarm_stream_path:
+            self._play_alarm_stream("test", loop=False)
+        elif self.mixer:
+            self._play_alarm_voice("test", loops=0)
+        elif self.alarm_channel is None or not self.alarm_channel.get_busy():
             self.alarm_channel = self.alarm_sound.play()
 
-    def play_alarm_loop(self):
-        if self.alarm_channel is None or not self.alarm_channel.get_busy():
+    def play_alarm_loop(self, key=None):
+        """Ring until stop_alarm(); with the software mixer each `key` (timer) rings on its own."""
+        with self._ready_lock:
+            if not self.ready.is_set():
+                self._alarm_pending.add(key)
+                return
+        if self.alarm_stream_path:
+            self._play_alarm_stream(key, loop=True)
+        elif self.mixer:
+            self._play_alarm_voice(key, loops=-1)
+        elif self.alarm_channel is None or not self.alarm_channel.get_busy():
             self.alarm_channel = self.alarm_sound.play(loops=-1)
 
+    def _play_alarm_voice(self, key, loops):
+        voice = self._alarm_voices.get(key)
+        if voice is None or voice.done:
+            self._alarm_voices[key] = self.mixer.play(self.alarm_samples, gain=self.alarm_volume, loops=loops)
+
+    def _play_alarm_stream(self, key, loop):
+        if self._alarm_wav_stream:
+            voice = self._alarm_voices.get(key)
+            if voice is None or voice.done:
+                stream = WavStream(self.alarm_stream_path, self.mixer.sample_rate, self.mixer.channels, loop=loop)
+                self._alarm_voices[key] = self.mixer.play(stream, gain=self.alarm_volume)
+        elif not pygame.mixer.music.get_busy():
+            # There is only one music stream, so every ringing timer shares it.
+            pygame.mixer.music.play(loops=-1 if loop else 0)
+
+    def play_preview(self, path):
+        """Play a short library preview clip once, at the alarm volume."""
+        if not self.ready.is_set():
+            return
+        try:
+            sound = pygame.mixer.Sound(str(path))
+        except Exception as e:
+            print(f"Failed to play preview: {e}")
+            return
+        if self.mixer:
+            self.mixer.play(samples_from_sound(sound, self.mixer.channels), gain=self.alarm_volume)
+        else:
+            sound.set_volume(self.alarm_volume)
+            sound.play()
+
     def stop_alarm(self):
+        self._alarm_pending = set()
+        if self.alarm_stream_path and not self._alarm_wav_stream:
+            pygame.mixer.music.stop()
+        if self.mixer:
+            for voice in self._alarm_voices.values():
+                self.mixer.stop(voice, fade_ms=20)
+            self._alarm_voices = {}
         if self.alarm_channel:
             self.alarm_channel.stop()
             self.alarm_channel = None
 
     def change_tick_sound(self, file_path):
-        self.tick_sound = self._load_sound(file_path, is_tick=True)
+        if self.ready.is_set():
+            self.tick_sound = self._load_sound(file_path, is_tick=True)
         if self.settings:
             default_path = str(TICK_SOUND.resolve())
             new_path = str(Path(file_path).resolve())
@@ -96,7 +286,9 @@ class AudioManager:
         self.tick_channel = None
 
     def change_alarm_sound(self, file_path):
-        self.alarm_sound = self._load_sound(file_path, is_tick=False)
+        if self.ready.is_set():
+            self.stop_alarm()
+            self._load_alarm(file_path)
         if self.settings:
             default_path = str(ALARM_SOUND.resolve())
             new_path = str(Path(file_path).resolve())
@@ -107,6 +299,9 @@ class AudioManager:
         self.alarm_channel = None
         
     def stop_tick(self):
+        if self.mixer and self._tick_voice is not None:
+            self.mixer.stop(self._tick_voice, fade_ms=5)
+            self._tick_voice = None
         if self.tick_channel:
             self.tick_channel.stop()
             self.tick_channel = None
@@ -0,0 +1,140 @@
+from collections import deque
+import threading
+import wave
+
+import numpy as np
+
+
+def can_stream_wav(path):
+    """True if `path` is a PCM WAV that WavStream can decode chunk by chunk."""
+    try:
+        with wave.open(str(path), "rb") as wav:
+            return wav.getsampwidth() in (1, 2) and wav.getnchannels() in (1, 2)
+    except (OSError, EOFError, wave.Error):
+        return False
+
+
+class WavStream:
+    """Decodes a WAV file a chunk at a time into a small ring of float32 blocks.
+
+    A decoder thread keeps up to `ring_chunks` chunks ready, converted to the
+    mixer's rate and channel count; read() never blocks, so a slow disk
+    shows up as counted underruns (silence) rather than a stalled mixer.
+    With `loop`, the file rewinds at the end and playback carries straight on.
+    Memory use is the ring, whatever the length of the file.
+    """
+
+    def __init__(self, path, sample_rate, channels, loop=True, chunk_frames=4096, ring_chunks=8):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.loop = loop
+        self.chunk_frames = chunk_frames
+        self.underruns = 0
+        self._wav = wave.open(str(path), "rb")
+        self._source_channels = self._wav.getnchannels()
+        self._sample_width = self._wav.getsampwidth()
+        self._step = self._wav.getframerate() / sample_rate
+        self._carry = np.zeros((1, channels), dtype=np.float32)
+        self._phase = 0.0
+        self._ring = deque()
+        self._ring_chunks = ring_chunks
+        self._current = None
+        self._offset = 0
+        self._cond = threading.Condition()
+        self._eof = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._decode_loop, name="WavStream", daemon=True)
+        self._thread.start()
+
+    def read(self, frames):
+        """Up to `frames` frames; fewer only once a non-looping stream has ended."""
+        parts = []
+        needed = frames
+        while needed:
+            if self._current is None or self._offset >= len(self._current):
+                with self._cond:
+                    if not self._ring:
+                        if self._eof:
+                            break
+                        self.underruns += 1
+                        parts.append(np.zeros((needed, self.channels), dtype=np.float32))
+                        break
+                    self._current = self._ring.popleft()
+                    self._offset = 0
+                    self._cond.notify()
+            take = min(needed, len(self._current) - self._offset)
+            parts.append(self._current[self._offset:self._offset + take])
+            self._offset += take
+            needed -= take
+        if not parts:
+            return np.zeros((0, self.channels), dtype=np.float32)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
+    def _decode_loop(self):
+        try:
+            while True:
+                with self._cond:
+                    while len(self._ring) >= self._ring_chunks and not self._closed:
+                        self._cond.wait()
+                    if self._closed:
+                        return
+                chunk = self._decode_chunk()
+                with self._cond:
+                    if chunk is None:
+                        self._eof = True
+                        return
+                    if len(chunk):
+                        self._ring.append(chunk)
+        except Exception as e:
+            print(f"Failed to stream {self.path}: {e}")
+            with self._cond:
+                self._eof = True
+        finally:
+            self._wav.close()
+
+    def _decode_chunk(self):
+        raw = self._wav.readframes(self.chunk_frames)
+        if not raw:
+            if not self.loop:
+                return None
+            self._wav.rewind()
+            raw = self._wav.readframes(self.chunk_frames)
+            if not raw:
+                return None
+        if self._sample_width == 1:
+            data = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+        else:
+            data = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+        data = data.reshape(-1, self._source_channels)
+        if self._source_channels != self.channels:
+            if self.channels == 1:
+                data = data.mean(axis=1, keepdims=True)
+            else:
+                data = np.repeat(data, self.channels, axis=1)
+        return self._resample(data)
+
+    def _resample(self, data):
+        # Linear interpolation, carrying the last frame and the fractional
+        # position across chunks (and across the loop point) so there is no seam.
+        if self._step == 1.0:
+            return data
+        data = np.concatenate([self._carry, data])
+        count = int((len(data) - 1 - self._phase) / self._step) + 1
+        if count <= 0:
+            self._phase -= len(data) - 1
+            self._carry = data[-1:]
+            return data[:0]
+        positions = self._phase + np.arange(count) * self._step
+        index = positions.astype(np.int64)
+        fraction = (positions - index).astype(np.float32)[:, None]
+        upper = np.minimum(index + 1, len(data) - 1)
+        out = data[index] * (1.0 - fraction) + data[upper] * fraction
+        self._phase = positions[-1] + self._step - (len(data) - 1)
+        self._carry = data[-1:]
+        return out
@@ -0,0 +1,212 @@
+import argparse
+import csv
+from datetime import datetime, timedelta
+from pathlib import Path
+import json
+import re
+import sys
+import threading
+
+from .config import HISTORY_DB
+from .timer_logic import TimerLogic
+
+# Must stay free of customtkinter/pygame imports: this is the headless entry point.
+
+COMMANDS = {"run", "ctl", "history"}
+
+_DURATION_PART = re.compile(r"(\d+)\s*([hms])", re.IGNORECASE)
+_UNIT_SECONDS = {"h": 3600, "m": 60, "s": 1}
+
+
+def parse_duration(text):
+    """Accept "90", "10m", "1h30m", "1h 5m 10s", "MM:SS" or "HH:MM:SS"."""
+    text = text.strip()
+    if re.fullmatch(r"\d+", text):
+        return int(text)
+    if re.fullmatch(r"\d+(:\d+){1,2}", text):
+        seconds = 0
+        for part in text.split(":"):
+            seconds = seconds * 60 + int(part)
+        return seconds
+    if re.fullmatch(r"(\s*\d+\s*[hms]\s*)+", text, re.IGNORECASE):
+        return sum(int(n) * _UNIT_SECONDS[unit.lower()] for n, unit in _DURATION_PART.findall(text))
+    raise ValueError(f"Invalid duration: {text!r}")
+
+
+def _duration(text):
+    try:
+        seconds = parse_duration(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError("duration must be at least 1 second")
+    return seconds
+
+
+def run_timer(args):
+    done = threading.Event()
+
+    def on_tick(h, m, s):
+        if not args.quiet:
+            print(f"\r{h:02}:{m:02}:{s:02}", end="", flush=True)
+
+    timer = TimerLogic(on_tick=on_tick, on_finish=done.set)
+    timer.start(args.duration)
+    print(f"Ends at {timer.end_datetime.strftime('%H:%M:%S')}")
+    try:
+        # Wait in slices so Ctrl+C is delivered promptly.
+        while not done.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        timer.cancel()
+        print("\nCancelled")
+        return 130
+
+    print("\nFinished" + ("" if args.silent else "\a"))
+    return 0
+
+
+def control(args):
+    from .control import ControlClient
+
+    try:
+        client = ControlClient(args.socket)
+    except OSError as e:
+        print(f"No running timer app to talk to: {e}", file=sys.stderr)
+        return 1
+
+    with client:
+        if args.action == "watch":
+            try:
+                for event in client.events():
+                    print(json.dumps(event), flush=True)
+            except KeyboardInterrupt:
+                pass
+            return 0
+
+        if args.action == "batch":
+            # One JSON command per stdin line, sent in batches.
+            failed = False
+            batch = []
+            for line in sys.stdin:
+                if line.strip():
+                    batch.append(json.loads(line))
+                if len(batch) >= args.batch_size:
+                    failed |= _send_batch(client, batch)
+                    batch = []
+            if batch:
+                failed |= _send_batch(client, batch)
+            return 1 if failed else 0
+
+        command = {"cmd": args.action}
+        if args.action not in ("list", "alarms"):
+            command["name"] = args.name
+        if args.action == "start":
+            command["seconds"] = args.duration
+        if args.action == "schedule":
+            command["rule"] = args.rule
+        reply = client.request(command)
+
+    if args.action == "list" and reply.get("ok"):
+        for timer in reply["timers"]:
+            state = "paused" if timer["paused"] else f"ends {timer['ends_at']}"
+            print(f"{timer['name']}\t{timer['remaining']:.0f}s\t{state}")
+    elif args.action == "alarms" and reply.get("ok"):
+        for alarm in reply["alarms"]:
+            print(f"{alarm['name']}\t{alarm['next']}\t{alarm['rule']}")
+    else:
+        print(json.dumps(reply))
+    return 0 if reply.get("ok") else 1
+
+
+def _date(text):
+    try:
+        return datetime.strptime(text, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date: {text!r} (expected YYYY-MM-DD)")
+
+
+def export_history(args):
+    from .history import COLUMNS, HistoryStore
+
+    if not args.db.exists():
+        print(f"No history at {args.db}", file=sys.stderr)
+        return 1
+    store = HistoryStore(args.db)
+    since = args.since.timestamp() if args.since else None
+    # --until is inclusive: everything up to the end of that day.
+    until = (args.until + timedelta(days=1)).timestamp() - 0.001 if args.until else None
+
+    if args.daily:
+        for day, runs, cancelled, counted in store.daily_totals(since, until, args.label):
+            print(f"{day}\t{runs} runs\t{cancelled} cancelled\t{counted / 3600:.2f} h")
+    elif args.overruns:
+        for bound, count in store.overrun_distribution(since, until):
+            print(f"{'<= ' + str(bound) + ' s' if bound is not None else 'longer'}\t{count}")
+    elif args.format == "jsonl":
+        for run in store.runs(since, until, args.label):
+            print(json.dumps(run))
+    else:
+        writer = csv.writer(sys.stdout)
+        writer.writerow(COLUMNS)
+        for run in store.runs(since, until, args.label):
+            writer.writerow(run.values())
+    return 0
+
+
+def _send_batch(client, batch):
+    replies = client.request(batch)
+    for reply in replies:
+        print(json.dumps(reply))
+    return any(not reply.get("ok") for reply in replies)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m timer_app", description="Headless timer commands.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Count down in the terminal.")
+    run.add_argument("duration", type=_duration, help='e.g. 90, 10m, 1h30m or 01:30:00')
+    run.add_argument("--silent", action="store_true", help="Don't ring the terminal bell when finished.")
+    run.add_argument("--quiet", action="store_true", help="Don't print the countdown.")
+    run.set_defaults(handler=run_timer)
+
+    ctl = commands.add_parser("ctl", help="Control timers in the running app.")
+    ctl.add_argument("--socket", help="Control socket path (default: per-user runtime dir).")
+    ctl.set_defaults(handler=control)
+    actions = ctl.add_subparsers(dest="action", required=True)
+    start = actions.add_parser("start", help="Start a named timer.")
+    start.add_argument("name")
+    start.add_argument("duration", type=_duration)
+    for action in ("stop", "pause", "resume"):
+        actions.add_parser(action, help=f"{action.capitalize()} a named timer.").add_argument("name")
+    actions.add_parser("list", help="List running timers.")
+    schedule = actions.add_parser("schedule", help="Add or replace a recurring alarm.")
+    schedule.add_argument("name")
+    schedule.add_argument("rule", help='e.g. "weekdays 07:00", "every 25m" or "*/15 9-17 * * 1-5"')
+    actions.add_parser("unschedule", help="Remove a recurring alarm.").add_argument("name")
+    actions.add_parser("alarms", help="List recurring alarms, next first.")
+    actions.add_parser("watch", help="Print tick and finish events as JSON lines.")
+    batch = actions.add_parser("batch", help="Send JSON commands read from stdin.")
+    batch.add_argument("--batch-size", type=int, default=1000)
+
+    history = commands.add_parser("history", help="Export past runs, streamed from the history store.")
+    history.add_argument("--db", type=Path, default=HISTORY_DB, help="History database path.")
+    history.add_argument("--since", type=_date, help="YYYY-MM-DD")
+    history.add_argument("--until", type=_date, help="YYYY-MM-DD, inclusive")
+    history.add_argument("--label", help="Only runs of this timer name.")
+    history.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    summary = history.add_mutually_exclusive_group()
+    summary.add_argument("--daily", action="store_true", help="Time counted down per day instead of runs.")
+    summary.add_argument("--overruns", action="store_true", help="How late runs ended, as a histogram.")
+    history.set_defaults(handler=export_history)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
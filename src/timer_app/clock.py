@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+import heapq
+import itertools
+import time
+
+
+class SystemClock:
+    """The real clocks, and Tk's after() for delayed calls."""
+
+    # TimerEngine runs its own scheduler thread against this clock.
+    manual = False
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def time(self):
+        return time.time()
+
+    def now(self):
+        return datetime.now()
+
+    def after(self, root, ms, func):
+        return root.after(ms, func)
+
+    def after_cancel(self, root, after_id):
+        root.after_cancel(after_id)
+
+
+SYSTEM_CLOCK = SystemClock()
+
+
+class VirtualClock:
+    """A clock that only moves when advance() or advance_to() is called.
+
+    monotonic() starts at 0 and wall time at `start`. Calls scheduled with
+    after() run from inside advance_to(), each with the clock set to exactly
+    its due time, so a day of simulated time takes as long as the work done
+    in it. A TimerEngine on this clock starts no thread: whoever advances
+    the clock calls engine.run_pending() (see simulation.Simulation).
+    """
+
+    manual = True
+
+    def __init__(self, start=None):
+        self.start = start if start is not None else datetime(2000, 1, 1)
+        self._now = 0.0
+        self._calls = []
+        self._cancelled = set()
+        self._seq = itertools.count()
+
+    def monotonic(self):
+        return self._now
+
+    def time(self):
+        return self.start.timestamp() + self._now
+
+    def now(self):
+        return self.start + timedelta(seconds=self._now)
+
+    def after(self, root, ms, func):
+        after_id = next(self._seq)
+        heapq.heappush(self._calls, (self._now + ms / 1000, after_id, func))
+        return after_id
+
+    def after_cancel(self, root, after_id):
+        self._cancelled.add(after_id)
+
+    def next_call(self):
+        """Due time of the earliest pending after() call, or None."""
+        while self._calls and self._calls[0][1] in self._cancelled:
+            self._cancelled.discard(heapq.heappop(self._calls)[1])
+        return self._calls[0][0] if self._calls else None
+
+    def advance(self, seconds):
+        self.advance_to(self._now + seconds)
+
+    def advance_to(self, target):
+        if target < self._now:
+            raise ValueError("a virtual clock can't go backwards")
+        while True:
+            due = self.next_call()
+            if due is None or due > target:
+                break
+            _, _, func = heapq.heappop(self._calls)
+            self._now = max(self._now, due)
+            func()
+        self._now = target
@@ -4,5 +4,13 @@ ROOT_DIR = Path(__file__).resolve().parents[2]
 ASSETS_DIR = ROOT_DIR / "assets"
 AUDIO_DIR = ASSETS_DIR / "audio"
 
-TICK_SOUND = AUDIO_DIR / "tick_sounds" / "DefaultTickSound.mp3"
-ALARM_SOUND = AUDIO_DIR / "alarm_sounds" / "DefaultAlarmSound.mp3"
+TICK_SOUND = AUDIO_DIR / "tick_sounds" / "DefaultTickSound.MP3"
+ALARM_SOUND = AUDIO_DIR / "alarm_sounds" / "DefaultAlarmSound.MP3"
+
+CACHE_DIR = ROOT_DIR / ".cache"
+SOUND_CACHE_DIR = CACHE_DIR / "sounds"
+SOUND_INDEX = CACHE_DIR / "sound_index.json"
+PREVIEW_DIR = CACHE_DIR / "previews"
+
+# Next to user_settings.json, like the timer journal.
+HISTORY_DB = ROOT_DIR / "history.sqlite3"
@@ -0,0 +1,416 @@
+from contextlib import nullcontext
+from datetime import datetime
+from pathlib import Path
+import json
+import math
+import os
+import selectors
+import socket
+import tempfile
+import threading
+
+from .cli import parse_duration
+from .journal import MAX_TOTAL_SECONDS
+
+# Headless like cli.py: the GUI process runs the server, scripts only need the client.
+
+_MAX_SUBSCRIBER_BACKLOG = 1024 * 1024
+# Timer and alarm names arrive from anyone who can reach the socket.
+MAX_NAME_LENGTH = 256
+
+
+def default_socket_path():
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "timer_app.sock"
+    return Path(tempfile.gettempdir()) / f"timer_app-{os.getuid()}.sock"
+
+
+def is_supported():
+    return hasattr(socket, "AF_UNIX")
+
+
+class _Connection:
+    __slots__ = ("sock", "inbuf", "outbuf", "subscribed")
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()
+        self.subscribed = False
+
+
+class ControlServer:
+    """Line-delimited JSON control socket for a running TimerEngine.
+
+    Each line is one command object or a list of them (a batch); the reply is
+    one line holding the matching result object or list. Connections that
+    send {"cmd": "subscribe"} also receive tick/finish events as they happen.
+    Everything runs on one selector thread, however many clients connect.
+    """
+
+    def __init__(self, engine, path=None, on_forward=None, reserved_names=(), scheduler=None):
+        self.engine = engine
+        self.scheduler = scheduler
+        self.path = Path(path) if path else default_socket_path()
+        self.on_forward = on_forward
+        self.reserved_names = set(reserved_names)
+        self._selector = selectors.DefaultSelector()
+        self._listener = None
+        self._wake_r = None
+        self._wake_w = None
+        self._connections = {}
+        self._subscribers = 0
+        self._events = []
+        self._events_lock = threading.Lock()
+        self._closed = False
+        self._thread = None
+
+    @property
+    def has_subscribers(self):
+        return self._subscribers > 0
+
+    def start(self):
+        if self.path.exists():
+            if ControlClient.probe(self.path):
+                raise RuntimeError(f"Another instance is listening on {self.path}")
+            self.path.unlink()
+
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(str(self.path))
+        os.chmod(self.path, 0o600)
+        self._listener.listen(128)
+        self._listener.setblocking(False)
+        self._selector.register(self._listener, selectors.EVENT_READ, None)
+
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+
+        self._thread = threading.Thread(target=self._serve, name="ControlServer", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        if self._closed or self._listener is None:
+            return
+        self._closed = True
+        self._wake()
+        self._thread.join(timeout=1)
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+    def publish(self, event):
+        """Send an event to every subscriber. Safe to call from any thread."""
+        if not self._subscribers:
+            return
+        line = json.dumps(event, separators=(",", ":")).encode() + b"\n"
+        with self._events_lock:
+            self._events.append(line)
+            if len(self._events) > 1:
+                return
+        self._wake()
+
+    # --- Commands ---
+    def handle(self, request, connection=None):
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "expected an object"}
+        try:
+            command = request.get("cmd")
+            handler = getattr(self, f"_cmd_{command}", None)
+            if handler is None:
+                return {"ok": False, "error": f"unknown command {command!r}"}
+            return handler(request, connection)
+        except (KeyError, TypeError, ValueError) as e:
+            return {"ok": False, "error": str(e)}
+        except Exception as e:
+            # One bad request must not take the server thread down with it.
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    @staticmethod
+    def _name(request):
+        name = request["name"]
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("name must be a non-empty string")
+        if len(name) > MAX_NAME_LENGTH:
+            raise ValueError(f"name is longer than {MAX_NAME_LENGTH} characters")
+        if not name.isprintable():
+            raise ValueError("name contains control characters")
+        return name
+
+    def _timer_name(self, request):
+        name = self._name(request)
+        if name in self.reserved_names:
+            raise ValueError(f"timer name {name!r} is reserved")
+        return name
+
+    def _cmd_ping(self, request, connection):
+        return {"ok": True}
+
+    def _cmd_start(self, request, connection):
+        name = self._timer_name(request)
+        seconds = request["seconds"]
+        if isinstance(seconds, str):
+            seconds = parse_duration(seconds)
+        if (isinstance(seconds, bool) or not isinstance(seconds, (int, float)) or not math.isfinite(seconds)
+                or seconds != int(seconds) or not 0 < seconds <= MAX_TOTAL_SECONDS):
+            return {"ok": False, "error": f"seconds must be a whole number from 1 to {MAX_TOTAL_SECONDS}"}
+        timer = self.engine.start(name, int(seconds))
+        if timer is None:
+            return {"ok": False, "error": f"timer {name!r} is already running"}
+        return {"ok": True, "name": name, "ends_at": timer.end_datetime.isoformat(timespec="seconds")}
+
+    def _cmd_stop(self, request, connection):
+        return {"ok": self.engine.cancel(self._timer_name(request))}
+
+    _cmd_cancel = _cmd_stop
+
+    def _cmd_pause(self, request, connection):
+        return {"ok": self.engine.pause(self._timer_name(request))}
+
+    def _cmd_resume(self, request, connection):
+        return {"ok": self.engine.resume(self._timer_name(request))}
+
+    def _cmd_list(self, request, connection):
+        now = self.engine.clock.monotonic()
+        timers = []
+        for name in self.engine.names():
+            timer = self.engine.get(name)
+            if timer is None:
+                continue
+            timers.append({
+                "name": name,
+                "remaining": round(timer.remaining(now), 3),
+                "paused": timer.paused,
+                "ends_at": timer.end_datetime.isoformat(timespec="seconds"),
+            })
+        return {"ok": True, "timers": timers}
+
+    def _cmd_schedule(self, request, connection):
+        if self.scheduler is None:
+            return {"ok": False, "error": "alarms are not supported"}
+        alarm = self.scheduler.add(self._name(request), str(request["rule"]))
+        next_fire = None
+        if alarm.next_fire is not None:
+            next_fire = datetime.fromtimestamp(alarm.next_fire).isoformat(timespec="seconds")
+        return {"ok": True, "name": alarm.name, "next": next_fire}
+
+    def _cmd_unschedule(self, request, connection):
+        if self.scheduler is None:
+            return {"ok": False, "error": "alarms are not supported"}
+        return {"ok": self.scheduler.remove(str(request["name"]))}
+
+    def _cmd_alarms(self, request, connection):
+        if self.scheduler is None:
+            return {"ok": False, "error": "alarms are not supported"}
+        alarms = [
+            {
+                "name": alarm.name,
+                "rule": alarm.text,
+                "next": datetime.fromtimestamp(alarm.next_fire).isoformat(timespec="seconds"),
+            }
+            for alarm in self.scheduler.upcoming(request.get("limit"))
+        ]
+        return {"ok": True, "alarms": alarms}
+
+    def _cmd_subscribe(self, request, connection):
+        if connection is not None and not connection.subscribed:
+            connection.subscribed = True
+            self._subscribers += 1
+        return {"ok": True}
+
+    def _cmd_forward(self, request, connection):
+        if self.on_forward is None:
+            return {"ok": False, "error": "forwarding is not supported"}
+        argv = request.get("argv", [])
+        if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+            return {"ok": False, "error": "argv must be a list of strings"}
+        if argv:
+            # Checked here rather than after the hand-over to the Tk thread,
+            # so the launch that forwarded it hears when nothing would happen.
+            seconds = parse_duration(argv[0])
+            if not 0 < seconds <= MAX_TOTAL_SECONDS:
+                return {"ok": False, "error": f"seconds must be a whole number from 1 to {MAX_TOTAL_SECONDS}"}
+            running = [name for name in self.reserved_names if name in self.engine]
+            if running:
+                return {
+                    "ok": False,
+                    "error": f"the {running[0]} timer is already running; use `ctl start NAME {argv[0]}` for another"
+                }
+        self.on_forward(argv)
+        return {"ok": True}
+
+    # --- Event loop ---
+    def _wake(self):
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def _serve(self):
+        while not self._closed:
+            for key, mask in self._selector.select():
+                sock = key.fileobj
+                if sock is self._listener:
+                    self._accept()
+                elif sock is self._wake_r:
+                    self._drain_wake()
+                else:
+                    connection = key.data
+                    if mask & selectors.EVENT_READ:
+                        self._read(connection)
+                    if mask & selectors.EVENT_WRITE and connection.sock in self._connections:
+                        self._flush(connection)
+        for connection in list(self._connections.values()):
+            self._drop(connection)
+        self._selector.close()
+        self._listener.close()
+        self._wake_r.close()
+        self._wake_w.close()
+
+    def _accept(self):
+        try:
+            sock, _ = self._listener.accept()
+        except BlockingIOError:
+            return
+        sock.setblocking(False)
+        connection = _Connection(sock)
+        self._connections[sock] = connection
+        self._selector.register(sock, selectors.EVENT_READ, connection)
+
+    def _drain_wake(self):
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+        with self._events_lock:
+            events, self._events = self._events, []
+        if not events:
+            return
+        payload = b"".join(events)
+        for connection in list(self._connections.values()):
+            if not connection.subscribed:
+                continue
+            if len(connection.outbuf) > _MAX_SUBSCRIBER_BACKLOG:
+                # A subscriber that stopped reading is cut off rather than buffered forever.
+                self._drop(connection)
+                continue
+            connection.outbuf += payload
+            self._flush(connection)
+
+    def _read(self, connection):
+        try:
+            data = connection.sock.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(connection)
+            return
+
+        connection.inbuf += data
+        *lines, rest = connection.inbuf.split(b"\n")
+        connection.inbuf = bytearray(rest)
+        for line in lines:
+            if line.strip():
+                connection.outbuf += self._respond(line, connection)
+        self._flush(connection)
+
+    def _respond(self, line, connection):
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            reply = {"ok": False, "error": f"invalid JSON: {e}"}
+        else:
+            if isinstance(request, list):
+                journal = getattr(self.engine, "journal", None)
+                with journal.batch() if journal else nullcontext():
+                    reply = [self.handle(item, connection) for item in request]
+            elif isinstance(request, dict):
+                reply = self.handle(request, connection)
+            else:
+                reply = {"ok": False, "error": "expected an object or a list of objects"}
+        return json.dumps(reply, separators=(",", ":")).encode() + b"\n"
+
+    def _flush(self, connection):
+        if connection.outbuf:
+            try:
+                sent = connection.sock.send(connection.outbuf)
+                del connection.outbuf[:sent]
+            except BlockingIOError:
+                pass
+            except OSError:
+                self._drop(connection)
+                return
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if connection.outbuf else 0)
+        self._selector.modify(connection.sock, events, connection)
+
+    def _drop(self, connection):
+        if self._connections.pop(connection.sock, None) is None:
+            return
+        if connection.subscribed:
+            self._subscribers -= 1
+        self._selector.unregister(connection.sock)
+        connection.sock.close()
+
+
+class ControlClient:
+    def __init__(self, path=None, timeout=5.0):
+        self.path = Path(path) if path else default_socket_path()
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(str(self.path))
+        self._reader = self.sock.makefile("rb")
+
+    @classmethod
+    def probe(cls, path=None):
+        """True if an instance is listening on `path`."""
+        try:
+            with cls(path, timeout=1.0) as client:
+                return client.request({"cmd": "ping"}).get("ok", False)
+        except (OSError, ValueError):
+            return False
+
+    def request(self, command):
+        """Send one command (or a list of commands as a batch) and return the reply."""
+        self.sock.sendall(json.dumps(command).encode() + b"\n")
+        return self._read_line()
+
+    def events(self):
+        """Subscribe and yield tick/finish events until the server goes away."""
+        self.request({"cmd": "subscribe"})
+        self.sock.settimeout(None)
+        while True:
+            event = self._read_line()
+            if event is None:
+                return
+            yield event
+
+    def _read_line(self):
+        line = self._reader.readline()
+        return json.loads(line) if line else None
+
+    def close(self):
+        self._reader.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def forward_to_running_instance(argv, path=None):
+    """Hand `argv` to an already running app and return its reply, or None if none is listening."""
+    if not is_supported():
+        return None
+    try:
+        with ControlClient(path, timeout=1.0) as client:
+            return client.request({"cmd": "forward", "argv": list(argv)})
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,122 @@
+from pathlib import Path
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CLOEXEC = 0o2000000
+# wd, mask, cookie, name length; the name follows, NUL padded.
+_EVENT = struct.Struct("iIII")
+
+
+def _inotify():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class FileWatcher:
+    """Calls `on_change()` from a background thread when `path` is written or replaced.
+
+    On Linux the file's directory is watched with inotify, which sees both
+    in-place writes and atomic renames onto the path and costs nothing
+    until something happens. Elsewhere, or if inotify can't be set up, the
+    file is stat()ed every `interval` seconds and a new mtime or size counts
+    once it has held for one interval.
+    """
+
+    def __init__(self, path, on_change, interval=1.0):
+        self.path = Path(path)
+        self.on_change = on_change
+        self.interval = interval
+        self.using_inotify = False
+        self._fd = None
+        self._wake_r = None
+        self._wake_w = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        libc = _inotify()
+        if libc is not None:
+            fd = libc.inotify_init1(_IN_CLOEXEC)
+            if fd >= 0:
+                # Finished writes and renames only; IN_MODIFY fires mid-write.
+                mask = _IN_CLOSE_WRITE | _IN_MOVED_TO
+                if libc.inotify_add_watch(fd, str(self.path.parent).encode(), mask) >= 0:
+                    self._fd = fd
+                    self._wake_r, self._wake_w = os.pipe()
+                    self.using_inotify = True
+                else:
+                    os.close(fd)
+        target = self._watch_inotify if self.using_inotify else self._watch_polling
+        self._thread = threading.Thread(target=target, name="FileWatcher", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self._wake_w is not None:
+            os.write(self._wake_w, b"\0")
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+
+    def _notify(self):
+        try:
+            self.on_change()
+        except Exception as e:
+            print(f"Failed to handle change to {self.path}: {e}")
+
+    def _watch_inotify(self):
+        name = self.path.name.encode()
+        try:
+            while not self._stop.is_set():
+                ready, _, _ = select.select([self._fd, self._wake_r], [], [])
+                if self._wake_r in ready:
+                    return
+                data = os.read(self._fd, 64 * 1024)
+                changed = False
+                offset = 0
+                while offset + _EVENT.size <= len(data):
+                    _, _, _, length = _EVENT.unpack_from(data, offset)
+                    event_name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+                    offset += _EVENT.size + length
+                    if event_name == name:
+                        changed = True
+                if changed:
+                    self._notify()
+        finally:
+            os.close(self._fd)
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+
+    def _watch_polling(self):
+        last = seen = self._stat()
+        while not self._stop.wait(self.interval):
+            current = self._stat()
+            # Only once it has stayed put for an interval, so a file that
+            # is being rewritten in place isn't read half done.
+            if current == seen and current != last:
+                last = current
+                if current is not None:
+                    self._notify()
+            seen = current
+
+    def _stat(self):
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,76 @@
+import math
+import time
+
+
+class FramePacer:
+    """Calls `render()` from Tk's event loop at `fps` frames per second.
+
+    Frames sit on a fixed grid measured from start(), so after()'s whole-ms
+    rounding and the render time itself never accumulate as drift. When the
+    UI thread falls behind, the frames whose slot already passed are skipped
+    (and counted) instead of being queued up behind each other.
+    """
+
+    def __init__(self, root, render, fps=60, budget=None, histogram=None):
+        self.root = root
+        self.render = render
+        self.histogram = histogram
+        self.set_fps(fps)
+        # Render time allowed per frame; defaults to half the frame period.
+        self.budget = budget
+        self.frames = 0
+        self.skipped = 0
+        self.over_budget = 0
+        self.last_cost = 0.0
+        self.max_cost = 0.0
+        self._origin = 0.0
+        self._slot = 0
+        self._after_id = None
+
+    @property
+    def running(self):
+        return self._after_id is not None
+
+    def set_fps(self, fps):
+        self.fps = max(1, int(fps))
+        self.period = 1.0 / self.fps
+
+    def start(self):
+        if self._after_id is None:
+            self._origin = time.perf_counter()
+            self._slot = 0
+            self._after_id = self.root.after(0, self._frame)
+
+    def stop(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def reset_stats(self):
+        self.frames = self.skipped = self.over_budget = 0
+        self.last_cost = self.max_cost = 0.0
+
+    def _frame(self):
+        started = time.perf_counter()
+        try:
+            self.render()
+        except Exception as e:
+            print(f"Frame render failed: {e}")
+        finished = time.perf_counter()
+
+        cost = finished - started
+        self.frames += 1
+        self.last_cost = cost
+        self.max_cost = max(self.max_cost, cost)
+        budget = self.budget if self.budget is not None else self.period / 2
+        if cost > budget:
+            self.over_budget += 1
+        if self.histogram:
+            self.histogram.observe(cost)
+
+        slot = max(self._slot + 1, int((finished - self._origin) / self.period) + 1)
+        self.skipped += slot - self._slot - 1
+        self._slot = slot
+        # Rounded up: firing a hair early would render the same slot twice.
+        delay_ms = math.ceil((self._origin + slot * self.period - finished) * 1000)
+        self._after_id = self.root.after(max(1, delay_ms), self._frame)
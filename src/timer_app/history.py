@@ -0,0 +1,196 @@
+from bisect import bisect_left
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+import sqlite3
+import threading
+import time
+
+from .metrics import DEFAULT_BUCKETS
+
+# Headless like cli.py: `python -m timer_app history` reads this without the GUI.
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    label TEXT NOT NULL,
+    requested REAL NOT NULL,
+    started REAL NOT NULL,
+    ended REAL NOT NULL,
+    counted REAL NOT NULL,
+    overrun REAL NOT NULL,
+    cancelled INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_started ON runs (started);
+CREATE INDEX IF NOT EXISTS runs_label ON runs (label, started);
+CREATE TABLE IF NOT EXISTS daily (
+    day TEXT NOT NULL,
+    label TEXT NOT NULL,
+    runs INTEGER NOT NULL,
+    cancelled INTEGER NOT NULL,
+    counted REAL NOT NULL,
+    PRIMARY KEY (day, label)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS overruns (
+    day TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (day, bucket)
+) WITHOUT ROWID;
+"""
+
+COLUMNS = ("label", "requested", "started", "ended", "counted", "overrun", "cancelled")
+
+
+def _day(timestamp):
+    return datetime.fromtimestamp(timestamp).date().isoformat()
+
+
+class HistoryStore:
+    """Every finished or cancelled run, in SQLite (WAL mode).
+
+    record() only queues the row; a writer thread commits whatever has
+    queued up every `batch_window` seconds in one transaction, so the tick
+    thread and the Tk loop never wait on the disk. Alongside the raw rows
+    the same transaction keeps per-day totals and per-day overrun bucket
+    counts up to date, so daily totals and the overrun distribution are
+    read from a few rows per day however many runs are stored.
+    """
+
+    def __init__(self, path, batch_window=0.5):
+        self.path = Path(path)
+        self.batch_window = batch_window
+        self._pending = []
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closed = False
+        with closing(self._connect()) as db:
+            db.executescript(_SCHEMA)
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(self.path, timeout=5.0)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    # --- Writing ---
+    def record(self, label, requested, started, ended, counted, overrun=0.0, cancelled=False):
+        with self._cond:
+            if self._closed:
+                return
+            self._pending.append((label, requested, started, ended, counted, overrun, int(cancelled)))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write_loop, name="HistoryWriter", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def record_many(self, rows):
+        """Write `rows` (tuples in COLUMNS order) right away, on this thread."""
+        with closing(self._connect()) as db:
+            self._write(db, rows)
+
+    def flush(self):
+        with self._cond:
+            rows, self._pending = self._pending, []
+        if rows:
+            self.record_many(rows)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.flush()
+
+    def _write_loop(self):
+        db = self._connect()
+        try:
+            while True:
+                with self._cond:
+                    while not self._pending and not self._closed:
+                        self._cond.wait()
+                    if self._closed:
+                        return
+                # Let a burst of finishing timers land in the same transaction.
+                time.sleep(self.batch_window)
+                with self._cond:
+                    rows, self._pending = self._pending, []
+                try:
+                    self._write(db, rows)
+                except sqlite3.Error as e:
+                    print(f"Failed to save timer history: {e}")
+        finally:
+            db.close()
+
+    @staticmethod
+    def _write(db, rows):
+        daily = {}
+        overruns = {}
+        for label, requested, started, ended, counted, overrun, cancelled in rows:
+            day = _day(started)
+            totals = daily.setdefault((day, label), [0, 0, 0.0])
+            totals[0] += 1
+            totals[1] += cancelled
+            totals[2] += counted
+            if not cancelled:
+                key = (day, bisect_left(DEFAULT_BUCKETS, overrun))
+                overruns[key] = overruns.get(key, 0) + 1
+        with db:
+            db.executemany(f"INSERT INTO runs ({', '.join(COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            db.executemany(
+                "INSERT INTO daily VALUES (?, ?, ?, ?, ?) ON CONFLICT (day, label) DO UPDATE SET "
+                "runs = runs + excluded.runs, cancelled = cancelled + excluded.cancelled, "
+                "counted = counted + excluded.counted",
+                [(day, label, *totals) for (day, label), totals in daily.items()]
+            )
+            db.executemany(
+                "INSERT INTO overruns VALUES (?, ?, ?) ON CONFLICT (day, bucket) DO UPDATE SET "
+                "count = count + excluded.count",
+                [(day, bucket, count) for (day, bucket), count in overruns.items()]
+            )
+
+    # --- Reading (safe from any thread; each call has its own connection) ---
+    def daily_totals(self, since=None, until=None, label=None):
+        """[(day, runs, cancelled, seconds counted down)] per day, oldest first."""
+        sql = "SELECT day, SUM(runs), SUM(cancelled), SUM(counted) FROM daily WHERE day >= ? AND day <= ?"
+        params = [_day(since) if since else "", _day(until) if until else "9999"]
+        if label is not None:
+            sql += " AND label = ?"
+            params.append(label)
+        with self._reader() as db:
+            return db.execute(sql + " GROUP BY day ORDER BY day", params).fetchall()
+
+    def overrun_distribution(self, since=None, until=None):
+        """[(upper bound in seconds or None for beyond the last, count)] of how late runs ended."""
+        with self._reader() as db:
+            counts = dict(db.execute(
+                "SELECT bucket, SUM(count) FROM overruns WHERE day >= ? AND day <= ? GROUP BY bucket",
+                (_day(since) if since else "", _day(until) if until else "9999")
+            ))
+        bounds = DEFAULT_BUCKETS + (None,)
+        return [(bound, counts.get(index, 0)) for index, bound in enumerate(bounds)]
+
+    def runs(self, since=None, until=None, label=None, newest_first=False, limit=None, chunk=1000):
+        """Yield run rows as dicts, fetched `chunk` at a time rather than all at once."""
+        sql = f"SELECT {', '.join(COLUMNS)} FROM runs WHERE started >= ? AND started < ?"
+        params = [since or 0.0, until or float("inf")]
+        if label is not None:
+            sql += " AND label = ?"
+            params.append(label)
+        sql += " ORDER BY started DESC" if newest_first else " ORDER BY started"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._reader() as db:
+            cursor = db.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(chunk)
+                if not rows:
+                    return
+                for row in rows:
+                    yield dict(zip(COLUMNS, row))
+
+    def _reader(self):
+        return closing(sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, timeout=5.0))
@@ -0,0 +1,251 @@
+from contextlib import contextmanager
+from pathlib import Path
+import os
+import struct
+import threading
+import time
+import zlib
+
+START, PAUSE, RESUME, CANCEL, FINISH = range(1, 6)
+
+_MAGIC = b"TJ01"
+# event, wall-clock end time, total seconds, remaining seconds (paused), name length
+_RECORD = struct.Struct("<BdIdH")
+_CRC = struct.Struct("<I")
+# Largest duration and longest (UTF-8) name a record can hold.
+MAX_TOTAL_SECONDS = 2 ** 32 - 1
+MAX_NAME_BYTES = 2 ** 16 - 1
+
+
+class JournalEntry:
+    __slots__ = ("name", "total_seconds", "end_time", "paused_remaining")
+
+    def __init__(self, name, total_seconds, end_time, paused_remaining=None):
+        self.name = name
+        self.total_seconds = total_seconds
+        self.end_time = end_time
+        self.paused_remaining = paused_remaining
+
+    @property
+    def paused(self):
+        return self.paused_remaining is not None
+
+    def remaining(self, now=None):
+        if self.paused_remaining is not None:
+            return self.paused_remaining
+        now = time.time() if now is None else now
+        return max(0.0, self.end_time - now)
+
+
+class TimerJournal:
+    """Append-only log of timer start/pause/resume/cancel/finish events.
+
+    Deadlines are stored as wall-clock times so they survive a reboot. The
+    live state is mirrored in memory, and after `compact_every` appends the
+    file is rewritten with just the live timers, which keeps the file (and so
+    replay time) proportional to the number of running timers, not uptime.
+    Each record carries a CRC so a torn final write is ignored on replay.
+
+    The record_*() calls only encode the record and queue it, so callers
+    holding a lock (TimerEngine does) never wait on the disk. A writer thread
+    appends whatever has queued and fsyncs once for all of it; records that
+    arrive during an fsync go out together in the next one.
+    """
+
+    def __init__(self, path, compact_every=256, durable=True):
+        self.path = Path(path)
+        self.compact_every = compact_every
+        self.durable = durable
+        self.entries = {}
+        self._appended = 0
+        self._batch_depth = 0
+        self._queue = []
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        # Held by whichever of the writer thread, replay() and close() is
+        # touching the file, so the queue lock is never held across I/O.
+        self._io_lock = threading.Lock()
+        self._writer = None
+        self._writing = False
+        self._closed = False
+        self._file = None
+
+    def replay(self):
+        """Load the journal and return the live timers as {name: JournalEntry}."""
+        with self._io_lock, self._lock:
+            self.entries = {}
+            try:
+                data = self.path.read_bytes()
+            except FileNotFoundError:
+                data = b""
+            if data.startswith(_MAGIC):
+                for event, name, end_time, total, remaining in self._parse(data):
+                    self._apply(event, name, end_time, total, remaining)
+            self._rewrite(self._snapshot())
+            return dict(self.entries)
+
+    def record_start(self, name, total_seconds, end_time):
+        self._append(START, name, end_time, total_seconds)
+
+    def record_pause(self, name, remaining):
+        self._append(PAUSE, name, remaining=remaining)
+
+    def record_resume(self, name, end_time):
+        self._append(RESUME, name, end_time)
+
+    def record_cancel(self, name):
+        self._append(CANCEL, name)
+
+    def record_finish(self, name):
+        self._append(FINISH, name)
+
+    @contextmanager
+    def batch(self):
+        """Hold back the writer so the appends made inside the block share one fsync."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                self._cond.notify_all()
+
+    def flush(self):
+        """Wait until everything recorded so far is on disk."""
+        with self._lock:
+            while (self._queue or self._writing) and self._writer is not None and self._writer.is_alive():
+                self._cond.wait(0.1)
+
+    def compact(self):
+        self.flush()
+        with self._io_lock:
+            with self._lock:
+                chunks = self._snapshot()
+            self._rewrite(chunks)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._cond.notify_all()
+        if self._writer is not None:
+            self._writer.join(timeout=5)
+        with self._io_lock:
+            # Whatever the writer didn't get to (or everything, if it never ran).
+            with self._lock:
+                records, self._queue = self._queue, []
+                chunks = self._snapshot()
+            if records:
+                if self._file:
+                    self._write(records)
+                else:
+                    self._rewrite(chunks)
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def _append(self, event, name, end_time=0.0, total=0, remaining=0.0):
+        with self._lock:
+            # Encoded first, so a record that can't be written changes nothing.
+            record = self._encode(event, name, end_time, total, remaining)
+            self._apply(event, name, end_time, total, remaining)
+            if self._closed:
+                return
+            self._queue.append(record)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="TimerJournal", daemon=True)
+                self._writer.start()
+            self._cond.notify_all()
+
+    def _write_loop(self):
+        while True:
+            with self._lock:
+                while (not self._queue or self._batch_depth) and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                records, self._queue = self._queue, []
+                self._appended += len(records)
+                # Taken together with the queue, so a rewrite holds exactly
+                # the records handed over here and nothing later.
+                rewrite = self._appended >= self.compact_every or self._file is None
+                chunks = self._snapshot() if rewrite else None
+                self._writing = True
+            try:
+                with self._io_lock:
+                    if rewrite:
+                        self._rewrite(chunks)
+                    else:
+                        self._write(records)
+            except OSError as e:
+                print(f"Failed to write timer journal: {e}")
+            finally:
+                with self._lock:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    def _write(self, records):
+        self._file.write(b"".join(records))
+        self._file.flush()
+        if self.durable:
+            os.fsync(self._file.fileno())
+
+    def _apply(self, event, name, end_time, total, remaining):
+        if event == START:
+            self.entries[name] = JournalEntry(name, total, end_time)
+        elif event in (CANCEL, FINISH):
+            self.entries.pop(name, None)
+        elif name in self.entries:
+            entry = self.entries[name]
+            if event == PAUSE:
+                entry.paused_remaining = remaining
+            elif event == RESUME:
+                entry.paused_remaining = None
+                entry.end_time = end_time
+
+    def _snapshot(self):
+        # The live timers as records; called with self._lock held.
+        chunks = [_MAGIC]
+        for entry in self.entries.values():
+            chunks.append(self._encode(START, entry.name, entry.end_time, entry.total_seconds, 0.0))
+            if entry.paused:
+                chunks.append(self._encode(PAUSE, entry.name, 0.0, 0, entry.paused_remaining))
+        return chunks
+
+    def _rewrite(self, chunks):
+        if self._file:
+            self._file.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(chunks))
+            f.flush()
+            if self.durable:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, "ab")
+        self._appended = 0
+
+    @staticmethod
+    def _encode(event, name, end_time, total, remaining):
+        name_bytes = name.encode("utf-8")
+        if len(name_bytes) > MAX_NAME_BYTES:
+            raise ValueError(f"timer name is longer than {MAX_NAME_BYTES} bytes")
+        body = _RECORD.pack(event, end_time, int(total), remaining, len(name_bytes)) + name_bytes
+        return body + _CRC.pack(zlib.crc32(body))
+
+    @staticmethod
+    def _parse(data):
+        offset = len(_MAGIC)
+        while offset + _RECORD.size <= len(data):
+            event, end_time, total, remaining, name_len = _RECORD.unpack_from(data, offset)
+            end = offset + _RECORD.size + name_len
+            if end + _CRC.size > len(data):
+                return
+            body = data[offset:end]
+            (crc,) = _CRC.unpack_from(data, end)
+            if crc != zlib.crc32(body):
+                return
+            name = body[_RECORD.size:].decode("utf-8", errors="replace")
+            yield event, name, end_time, total, remaining
+            offset = end + _CRC.size
@@ -0,0 +1,38 @@
+import numpy as np
+
+# Blocks quieter than this don't count towards loudness, so a short beep
+# followed by seconds of silence isn't boosted into a blast.
+GATE_DB = -70.0
+BLOCK_SECONDS = 0.4
+
+
+def loudness_db(samples, frequency):
+    """Gated RMS level in dBFS of float (frames, channels) samples in [-1, 1]."""
+    power = np.mean(np.square(samples, dtype=np.float64), axis=1)
+    block = max(1, int(frequency * BLOCK_SECONDS))
+    blocks = len(power) // block
+    if blocks:
+        block_power = power[:blocks * block].reshape(blocks, block).mean(axis=1)
+    else:
+        block_power = power.mean(keepdims=True)
+    gated = block_power[block_power > 10 ** (GATE_DB / 10)]
+    if not gated.size:
+        return None
+    return 10 * np.log10(gated.mean())
+
+
+def normalized_pcm(buffer, frequency, channels, target_db, ceiling_db=-1.0):
+    """Return 16-bit PCM `buffer` scaled to `target_db`, without peaks above `ceiling_db`."""
+    raw = np.frombuffer(buffer, dtype=np.int16)
+    raw = raw[:len(raw) - len(raw) % channels].reshape(-1, channels)
+    samples = raw.astype(np.float32) / 32768.0
+    level = loudness_db(samples, frequency)
+    if level is None:
+        return bytes(buffer)
+    peak = float(np.abs(samples).max())
+    gain = 10 ** ((target_db - level) / 20)
+    # Quiet files are only raised as far as their peaks allow.
+    gain = min(gain, 10 ** (ceiling_db / 20) / peak)
+    samples *= gain * 32768.0
+    np.clip(samples, -32768, 32767, out=samples)
+    return samples.astype(np.int16).tobytes()
@@ -0,0 +1,155 @@
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import os
+import threading
+import time
+
+# Upper bounds in seconds, shared by every histogram so exports line up.
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5
+)
+
+
+class Histogram:
+    __slots__ = ("name", "help", "bounds", "counts", "sum", "count")
+
+    def __init__(self, name, help="", bounds=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def to_prometheus(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{self.name}_sum {self.sum}")
+        lines.append(f"{self.name}_count {self.count}")
+        return "\n".join(lines)
+
+
+class Metrics:
+    """Opt-in latency histograms for the tick -> Tk -> display path.
+
+    Call sites hold `None` instead of a Metrics when instrumentation is off,
+    so the disabled cost is a single truthiness check.
+    """
+
+    def __init__(self):
+        self.histograms = {}
+        self.tick_to_display = self.histogram(
+            "timer_tick_to_display_seconds", "Tick deadline to TimerPage.update_display running.")
+        self.event_loop_lag = self.histogram(
+            "timer_tk_event_loop_lag_seconds", "How late Tk after() callbacks fire.")
+        self.play_tick = self.histogram(
+            "timer_play_tick_seconds", "Time spent in AudioManager.play_tick.")
+        self.frame_render = self.histogram(
+            "timer_frame_render_seconds", "Render time of each frame-paced (millisecond) frame.")
+        self._server = None
+        self._metrics_file = None
+
+    @classmethod
+    def from_env(cls):
+        """Enabled by TIMER_APP_METRICS_FILE and/or TIMER_APP_METRICS_PORT; else None."""
+        metrics_file = os.environ.get("TIMER_APP_METRICS_FILE")
+        metrics_port = os.environ.get("TIMER_APP_METRICS_PORT")
+        if not metrics_file and not metrics_port:
+            return None
+        metrics = cls()
+        if metrics_file:
+            metrics.export_to_file(metrics_file)
+        if metrics_port:
+            metrics.serve(int(metrics_port))
+        return metrics
+
+    def histogram(self, name, help=""):
+        histogram = Histogram(name, help)
+        self.histograms[name] = histogram
+        return histogram
+
+    def to_prometheus(self):
+        return "\n".join(h.to_prometheus() for h in self.histograms.values()) + "\n"
+
+    def write_file(self, path):
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+    def export_to_file(self, path, interval=10.0):
+        self._metrics_file = path
+
+        def export_loop():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.write_file(path)
+                except OSError as e:
+                    print(f"Failed to write metrics: {e}")
+
+        threading.Thread(target=export_loop, name="MetricsExporter", daemon=True).start()
+
+    def serve(self, port):
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        # Bound to loopback only; this is a local debugging aid.
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        threading.Thread(target=self._server.serve_forever, name="MetricsServer", daemon=True).start()
+
+    def close(self):
+        if self._metrics_file:
+            try:
+                self.write_file(self._metrics_file)
+            except OSError as e:
+                print(f"Failed to write metrics: {e}")
+        if self._server:
+            self._server.shutdown()
+            self._server = None
+
+
+class EventLoopMonitor:
+    """Re-arms a Tk after() every `interval_ms` and records how late it fires."""
+
+    def __init__(self, root, histogram, interval_ms=100):
+        self.root = root
+        self.histogram = histogram
+        self.interval_ms = interval_ms
+        self._expected = None
+        self._after_id = None
+
+    def start(self):
+        self._expected = time.monotonic() + self.interval_ms / 1000
+        self._after_id = self.root.after(self.interval_ms, self._fire)
+
+    def stop(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _fire(self):
+        self.histogram.observe(max(0.0, time.monotonic() - self._expected))
+        self.start()
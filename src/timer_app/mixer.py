@@ -0,0 +1,303 @@
+import threading
+import time
+import wave
+
+import numpy as np
+
+
+def samples_from_sound(sound, channels):
+    """float32 (frames, channels) copy of a 16-bit pygame Sound, ready to mix."""
+    raw = sound.get_raw()
+    frame_bytes = 2 * channels
+    raw = raw[:len(raw) - len(raw) % frame_bytes]
+    return np.frombuffer(raw, dtype=np.int16).reshape(-1, channels).astype(np.float32) / 32768.0
+
+
+class Voice:
+    """One playing source. Handed back by SoftwareMixer.play() as a handle."""
+
+    __slots__ = ("samples", "gain", "target_gain", "gain_step", "position", "loops",
+                 "frames_left", "fade_out_frames", "stopping", "done")
+
+    def __init__(self, samples, gain, loops, frames_left, fade_out_frames):
+        self.samples = samples
+        self.gain = gain
+        self.target_gain = gain
+        self.gain_step = 0.0
+        self.position = 0
+        self.loops = loops
+        self.frames_left = frames_left
+        self.fade_out_frames = fade_out_frames
+        self.stopping = False
+        self.done = False
+
+    def ramp_to(self, gain, frames):
+        self.target_gain = gain
+        if frames <= 0:
+            self.gain = gain
+            self.gain_step = 0.0
+        else:
+            self.gain_step = (gain - self.gain) / frames
+
+
+class SoftwareMixer:
+    """Mixes any number of voices into one stream of fixed-size 16-bit blocks.
+
+    All mixing happens in buffers allocated up front, so a block costs the
+    same whether it is the first or the ten-thousandth, and every voice adds
+    only a multiply-add over the block. Latency is bounded by the block size
+    and the output's queue depth. With start(), a thread feeds the output
+    while anything is playing and sleeps otherwise; without it, render()
+    produces one block on demand, which is how the null and WAV outputs are
+    driven in benchmarks.
+    """
+
+    def __init__(self, output):
+        self.output = output
+        self.sample_rate = output.sample_rate
+        self.channels = output.channels
+        self.block_frames = output.block_frames
+        self._mix = np.zeros((self.block_frames, self.channels), dtype=np.float32)
+        self._scratch = np.zeros((self.block_frames, self.channels), dtype=np.float32)
+        self._ramp = np.zeros(self.block_frames, dtype=np.float32)
+        self._steps = np.arange(1, self.block_frames + 1, dtype=np.float32)
+        self._voices = []
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def frames(self, ms):
+        return int(self.sample_rate * ms / 1000)
+
+    # --- Voices (safe from any thread) ---
+    def play(self, samples, gain=1.0, loops=0, fade_in_ms=0, max_ms=None, fade_out_ms=0):
+        """Start `samples`; loops=-1 repeats until stopped. Returns the Voice.
+
+        `samples` is a float32 (frames, channels) array, or a stream with
+        read(frames) and close() (see audio_stream.WavStream), which does
+        its own looping.
+        """
+        frames_left = None if max_ms is None else self.frames(max_ms)
+        voice = Voice(samples, 0.0 if fade_in_ms else gain, loops, frames_left, self.frames(fade_out_ms))
+        if fade_in_ms:
+            voice.ramp_to(gain, self.frames(fade_in_ms))
+        with self._cond:
+            self._voices.append(voice)
+            self._cond.notify()
+        return voice
+
+    def stop(self, voice, fade_ms=0):
+        with self._cond:
+            if fade_ms:
+                voice.stopping = True
+                voice.ramp_to(0.0, self.frames(fade_ms))
+            else:
+                voice.done = True
+
+    def stop_all(self, fade_ms=0):
+        with self._cond:
+            voices = list(self._voices)
+        for voice in voices:
+            self.stop(voice, fade_ms)
+
+    def set_gain(self, voice, gain, fade_ms=10):
+        # A short ramp instead of a jump avoids zipper noise while dragging a slider.
+        with self._cond:
+            if not voice.stopping:
+                voice.ramp_to(gain, self.frames(fade_ms))
+
+    @property
+    def active(self):
+        return len(self._voices)
+
+    # --- Output ---
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="SoftwareMixer", daemon=True)
+            self._thread.start()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+        self.output.close()
+
+    def render(self):
+        """Mix and hand one block to the output; returns how many voices played in it."""
+        block = self.output.acquire()
+        played = self._mix_block(block)
+        self.output.commit(block)
+        return played
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._voices and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+            try:
+                self.render()
+            except Exception as e:
+                print(f"Audio mixing failed: {e}")
+                time.sleep(0.1)
+
+    def _mix_block(self, block):
+        mix = self._mix
+        mix.fill(0.0)
+        with self._cond:
+            voices = list(self._voices)
+        for voice in voices:
+            if not voice.done:
+                self._mix_voice(voice)
+        with self._cond:
+            finished = [voice for voice in self._voices if voice.done]
+            self._voices = [voice for voice in self._voices if not voice.done]
+        for voice in finished:
+            if hasattr(voice.samples, "close"):
+                voice.samples.close()
+
+        np.clip(mix, -1.0, 1.0, out=mix)
+        mix *= 32767.0
+        np.copyto(block, mix, casting="unsafe")
+        return len(voices)
+
+    def _mix_voice(self, voice):
+        frames = self.block_frames
+        if voice.frames_left is not None:
+            if voice.frames_left <= voice.fade_out_frames and not voice.stopping:
+                voice.stopping = True
+                voice.ramp_to(0.0, voice.frames_left)
+            frames = min(frames, max(0, voice.frames_left))
+            voice.frames_left -= frames
+
+        filled = 0
+        samples = voice.samples
+        if hasattr(samples, "read"):
+            chunk = samples.read(frames)
+            if len(chunk):
+                self._add(voice, chunk, 0, len(chunk))
+            if len(chunk) < frames:
+                voice.done = True
+            frames = 0
+        while filled < frames:
+            take = min(frames - filled, len(samples) - voice.position)
+            if take <= 0:
+                if voice.loops == 0:
+                    voice.done = True
+                    break
+                if voice.loops > 0:
+                    voice.loops -= 1
+                voice.position = 0
+                continue
+            self._add(voice, samples[voice.position:voice.position + take], filled, take)
+            voice.position += take
+            filled += take
+
+        if voice.frames_left is not None and voice.frames_left <= 0:
+            voice.done = True
+        if voice.stopping and voice.gain == 0.0:
+            voice.done = True
+
+    def _add(self, voice, chunk, offset, frames):
+        scratch = self._scratch[:frames]
+        if voice.gain_step == 0.0:
+            np.multiply(chunk, voice.gain, out=scratch)
+        else:
+            ramp = self._ramp[:frames]
+            np.multiply(self._steps[:frames], voice.gain_step, out=ramp)
+            ramp += voice.gain
+            if voice.gain_step > 0:
+                np.minimum(ramp, voice.target_gain, out=ramp)
+            else:
+                np.maximum(ramp, voice.target_gain, out=ramp)
+            np.multiply(chunk, ramp[:, None], out=scratch)
+            voice.gain = float(ramp[-1])
+            if abs(voice.gain - voice.target_gain) < 1e-6:
+                voice.gain = voice.target_gain
+                voice.gain_step = 0.0
+        self._mix[offset:offset + frames] += scratch
+
+
+class NullOutput:
+    """Discards blocks; counts them. For benchmarks and headless runs."""
+
+    def __init__(self, sample_rate=44100, channels=2, block_frames=1024):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.block_frames = block_frames
+        self.frames_written = 0
+        self.peak = 0
+        self._block = np.zeros((block_frames, channels), dtype=np.int16)
+
+    def acquire(self):
+        return self._block
+
+    def commit(self, block):
+        self.frames_written += len(block)
+        self.peak = max(self.peak, int(np.abs(block).max()))
+
+    def close(self):
+        pass
+
+
+class WavOutput(NullOutput):
+    """Writes the mixed stream to a 16-bit WAV file."""
+
+    def __init__(self, path, sample_rate=44100, channels=2, block_frames=1024):
+        super().__init__(sample_rate, channels, block_frames)
+        self._wave = wave.open(str(path), "wb")
+        self._wave.setnchannels(channels)
+        self._wave.setsampwidth(2)
+        self._wave.setframerate(sample_rate)
+
+    def commit(self, block):
+        super().commit(block)
+        self._wave.writeframes(block.tobytes())
+
+    def close(self):
+        self._wave.close()
+
+
+class PygameOutput:
+    """Feeds one reserved pygame channel from a ring of pre-allocated Sounds.
+
+    Each block is mixed straight into a Sound's own sample buffer, then
+    queued behind the one playing. At most one block waits in the queue, so
+    latency stays within two blocks.
+    """
+
+    def __init__(self, block_frames=1024, ring=3):
+        import pygame
+        import pygame.sndarray
+
+        self.sample_rate, size, self.channels = pygame.mixer.get_init()
+        if size != -16:
+            raise RuntimeError(f"unsupported mixer sample format {size}")
+        self.block_frames = block_frames
+        pygame.mixer.set_reserved(1)
+        self.channel = pygame.mixer.Channel(0)
+        self._sounds = [pygame.mixer.Sound(buffer=bytes(block_frames * self.channels * 2)) for _ in range(ring)]
+        self._buffers = [
+            pygame.sndarray.samples(sound).reshape(block_frames, self.channels) for sound in self._sounds
+        ]
+        self._next = 0
+        self._poll = block_frames / self.sample_rate / 8
+
+    def acquire(self):
+        while self.channel.get_queue() is not None:
+            time.sleep(self._poll)
+        return self._buffers[self._next]
+
+    def commit(self, block):
+        sound = self._sounds[self._next]
+        self._next = (self._next + 1) % len(self._sounds)
+        if self.channel.get_busy():
+            self.channel.queue(sound)
+        else:
+            self.channel.play(sound)
+
+    def close(self):
+        self.channel.stop()
@@ -0,0 +1,206 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import json
+import os
+import shlex
+import subprocess
+import threading
+import time
+import urllib.request
+
+# Headless: sinks only need the standard library.
+
+
+class Sink:
+    """Somewhere finished-timer events are delivered to, a batch at a time.
+
+    Subclasses provide send(events), called with a list of event dicts. It
+    must give up within roughly `timeout` seconds and raise on failure; it
+    is retried up to `retries` times with a growing delay.
+    """
+
+    def __init__(self, name, timeout=5.0, retries=2, max_pending=1000):
+        self.name = name
+        self.timeout = timeout
+        self.retries = retries
+        self.max_pending = max_pending
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+
+
+class CommandSink(Sink):
+    """Runs a command per batch, with the events as JSON lines on stdin."""
+
+    def __init__(self, command, **kwargs):
+        if isinstance(command, str):
+            command = shlex.split(command)
+        if not command:
+            raise ValueError("empty command")
+        super().__init__(kwargs.pop("name", f"command {command[0]}"), **kwargs)
+        self.command = list(command)
+
+    def send(self, events):
+        payload = "".join(json.dumps(event) + "\n" for event in events)
+        subprocess.run(
+            self.command, input=payload, text=True, timeout=self.timeout, check=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+
+class FileSink(Sink):
+    """Appends JSON lines to a log file or a FIFO.
+
+    A FIFO is opened non-blocking, so with no reader on the other end the
+    write fails (and is retried) instead of hanging the worker.
+    """
+
+    def __init__(self, path, **kwargs):
+        super().__init__(kwargs.pop("name", f"file {path}"), **kwargs)
+        self.path = Path(path)
+
+    def send(self, events):
+        data = "".join(json.dumps(event) + "\n" for event in events).encode()
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_NONBLOCK", 0)
+        fd = os.open(self.path, flags, 0o600)
+        try:
+            deadline = time.monotonic() + self.timeout
+            view = memoryview(data)
+            while view:
+                try:
+                    view = view[os.write(fd, view):]
+                except BlockingIOError:
+                    # A full FIFO: wait for the reader, up to the timeout.
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"{self.path} is not being read")
+                    time.sleep(0.01)
+        finally:
+            os.close(fd)
+
+
+class WebhookSink(Sink):
+    """POSTs each batch as a JSON array."""
+
+    def __init__(self, url, **kwargs):
+        super().__init__(kwargs.pop("name", f"webhook {url}"), **kwargs)
+        self.url = url
+
+    def send(self, events):
+        request = urllib.request.Request(
+            self.url, data=json.dumps(events).encode(), method="POST",
+            headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+_SINK_TYPES = {"command": CommandSink, "file": FileSink, "webhook": WebhookSink}
+_SINK_TARGETS = {"command": "command", "file": "path", "webhook": "url"}
+
+
+def sinks_from_settings(configs):
+    """Build sinks from the "notifications" setting, a list of
+    {"type": "command" | "file" | "webhook", "command" | "path" | "url": ..., ...}.
+    """
+    sinks = []
+    for config in configs or []:
+        try:
+            kind = config["type"]
+            options = {key: config[key] for key in ("timeout", "retries", "max_pending", "name") if key in config}
+            sinks.append(_SINK_TYPES[kind](config[_SINK_TARGETS[kind]], **options))
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Failed to set up notification {config!r}: {e}")
+    return sinks
+
+
+class Notifier:
+    """Fans events out to sinks without ever blocking the caller.
+
+    notify() only appends to each sink's bounded queue; when a queue is full
+    the oldest event is dropped and counted. A dispatcher thread waits
+    `batch_window` seconds after the first event so that timers finishing
+    together go out as one batch per sink, then hands each sink's batch to a
+    pool of `workers` threads. A sink has at most one batch in flight, so a
+    hung sink ties up one worker and its own queue, never the others.
+    """
+
+    def __init__(self, sinks, workers=4, batch_window=0.05, max_batch=100, retry_delay=0.5):
+        self.sinks = list(sinks)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.retry_delay = retry_delay
+        self._pending = {sink: deque() for sink in self.sinks}
+        self._busy = set()
+        self._cond = threading.Condition()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Notifier")
+        self._thread = None
+        self._closed = False
+
+    def notify(self, event):
+        if not self.sinks:
+            return
+        with self._cond:
+            if self._closed:
+                return
+            for sink, pending in self._pending.items():
+                if len(pending) >= sink.max_pending:
+                    pending.popleft()
+                    sink.dropped += 1
+                pending.append(event)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._dispatch_loop, name="NotifierDispatch", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def close(self, timeout=1.0):
+        """Deliver what is queued for up to `timeout` seconds, then stop."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while any(self._pending.values()) or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            self._closed = True
+            self._cond.notify_all()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _ready(self):
+        return [sink for sink, pending in self._pending.items() if pending and sink not in self._busy]
+
+    def _dispatch_loop(self):
+        while True:
+            with self._cond:
+                while not self._closed and not self._ready():
+                    self._cond.wait()
+                if self._closed:
+                    return
+            # Let the rest of a burst arrive before cutting batches.
+            time.sleep(self.batch_window)
+            with self._cond:
+                if self._closed:
+                    return
+                for sink in self._ready():
+                    pending = self._pending[sink]
+                    batch = [pending.popleft() for _ in range(min(len(pending), self.max_batch))]
+                    self._busy.add(sink)
+                    self._pool.submit(self._deliver, sink, batch)
+
+    def _deliver(self, sink, batch):
+        try:
+            for attempt in range(sink.retries + 1):
+                try:
+                    sink.send(batch)
+                    sink.sent += len(batch)
+                    return
+                except Exception as e:
+                    if attempt == sink.retries:
+                        sink.failed += len(batch)
+                        print(f"Failed to notify {sink.name}: {e}")
+                    else:
+                        time.sleep(self.retry_delay * 2 ** attempt)
+        finally:
+            with self._cond:
+                self._busy.discard(sink)
+                self._cond.notify_all()
@@ -1,48 +1,203 @@
+from collections import deque
 from pathlib import Path
+import atexit
+import copy
+import hashlib
 import json
+import math
+import os
+import threading
+import time
+
+from .file_watcher import FileWatcher
 
 DEFAULT_SETTINGS = {
     "tick_volume": 0.5,
     "alarm_volume": 0.5,
     "tick_sound_path": None,
     "alarm_sound_path": None,
-    "appearance_mode": "System"
+    "appearance_mode": "System",
+    "sound_cache_mb": 64,
+    "background_ticks": False,
+    "high_resolution": False,
+    "refresh_rate": 60,
+    "software_mixer": True,
+    "stream_threshold_mb": 4,
+    "sound_folders": [],
+    "normalize_loudness": False,
+    "loudness_target_db": -20.0,
+    "notifications": []
+}
+
+APPEARANCE_MODES = ("Light", "Dark", "System")
+# Allowed range per numeric setting; see _is_valid().
+_RANGES = {
+    "tick_volume": (0.0, 1.0),
+    "alarm_volume": (0.0, 1.0),
+    "sound_cache_mb": (0, math.inf),
+    "refresh_rate": (1, 1000),
+    "stream_threshold_mb": (0, math.inf),
+    "loudness_target_db": (-70.0, 0.0),
 }
 
+# Data kept under the settings rather than preferences: "Reset to defaults"
+# leaves these alone (the recurring alarms from AlarmScheduler).
+KEPT_ON_CLEAR = ("alarms", "alarms_checked_at")
+
+
+def _is_valid(key, value):
+    """Whether `value` has the type (and range) the app expects for a default setting."""
+    default = DEFAULT_SETTINGS[key]
+    if key == "appearance_mode":
+        return value in APPEARANCE_MODES
+    if isinstance(default, bool):
+        return isinstance(value, bool)
+    if isinstance(default, (int, float)):
+        kinds = int if isinstance(default, int) else (int, float)
+        if isinstance(value, bool) or not isinstance(value, kinds):
+            return False
+        low, high = _RANGES[key]
+        return low <= value <= high
+    if default is None:
+        return value is None or isinstance(value, str)
+    if key == "sound_folders":
+        return isinstance(value, list) and all(isinstance(folder, str) for folder in value)
+    return isinstance(value, type(default))
+
+
+def _checked(data):
+    """`data` with any malformed default setting put back to its default."""
+    for key, value in data.items():
+        if key in DEFAULT_SETTINGS and not _is_valid(key, value):
+            print(f"Ignoring invalid setting {key}={value!r}; using {DEFAULT_SETTINGS[key]!r}")
+            data[key] = copy.deepcopy(DEFAULT_SETTINGS[key])
+    return data
+
+
 class SettingsManager:
-    def __init__(self, settings_path):
-        self.settings_path = settings_path
+    def __init__(self, settings_path, write_behind=False, debounce=0.5, max_delay=2.0):
+        self.settings_path = Path(settings_path)
         self.settings = {}
+        # With write_behind, set() only marks the settings dirty and a background
+        # thread writes them once changes stop for `debounce` seconds (or at the
+        # latest `max_delay` seconds after the first unsaved change).
+        self.write_behind = write_behind
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._dirty_since = 0.0
+        self._flush_at = 0.0
+        self._writer = None
+        self._closed = False
+        # Hashes of the last few versions of the file read or written here,
+        # so watch() can tell the app's own writes from edits made by
+        # something else, even when it only sees an older write after a
+        # newer one has already been made (e.g. while a slider is dragged).
+        self._known_hashes = deque(maxlen=8)
+        self._watcher = None
         self.load()
         self._ensure_defaults()
+        if write_behind:
+            atexit.register(self.close)
 
     def load(self):
         if self.settings_path.exists():
             try:
-                with open(self.settings_path, "r") as f:
-                    self.settings = json.load(f)
+                raw = self.settings_path.read_bytes()
+                self._known_hashes.append(hashlib.sha256(raw).digest())
+                self.settings = json.loads(raw)
+                if not isinstance(self.settings, dict):
+                    raise ValueError("expected a JSON object")
             except Exception:
                 self.settings = {}
+            _checked(self.settings)
         else:
             self.settings = {}
 
-    def save(self):
+    def watch(self, on_change):
+        """Pick up edits made to the file by anything else while the app runs.
+
+        `on_change(changed)` is called from a background thread with just
+        the keys whose values differ, after they've been applied here. A key
+        deleted from the file goes back to its default, or is dropped (and
+        reported as None) if it has none.
+        """
+        self._watcher = FileWatcher(self.settings_path, lambda: self._reload(on_change))
+        self._watcher.start()
+
+    def _reload(self, on_change):
+        try:
+            raw = self.settings_path.read_bytes()
+        except OSError:
+            return
+        digest = hashlib.sha256(raw).digest()
+        with self._cond:
+            if digest in self._known_hashes:
+                return
+            self._known_hashes.append(digest)
         try:
-            with open(self.settings_path, "w") as f:
-                json.dump(self.settings, f, indent=4)
-        except Exception as e:
-            print(f"Failed to save settings: {e}")
+            data = json.loads(raw)
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object")
+        except ValueError as e:
+            print(f"Failed to reload settings: {e}")
+            return
+        # As on load(): a value of the wrong type falls back to its default
+        # instead of reaching float() or a label on the Tk thread.
+        _checked(data)
+        with self._cond:
+            changed = {key: value for key, value in data.items() if key not in self.settings or self.settings[key] != value}
+            restored = {
+                key: copy.deepcopy(value) for key, value in DEFAULT_SETTINGS.items()
+                if key not in data and self.settings.get(key) != value
+            }
+            removed = [key for key in self.settings if key not in data and key not in DEFAULT_SETTINGS]
+            for key in removed:
+                del self.settings[key]
+            changed.update(restored)
+            self.settings.update(changed)
+            changed.update(dict.fromkeys(removed))
+        if changed:
+            on_change(changed)
+
+    def save(self):
+        with self._write_lock:
+            with self._cond:
+                data = json.dumps(self.settings, indent=4)
+                self._dirty = False
+            try:
+                self._write_atomic(data)
+            except Exception as e:
+                print(f"Failed to save settings: {e}")
+
+    def flush(self):
+        if self._dirty:
+            self.save()
+
+    def close(self):
+        if self._watcher is not None:
+            self._watcher.close()
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self.flush()
 
     def get(self, key, default=None):
         return self.settings.get(key, default)
 
     def set(self, key, value):
-        self.settings[key] = value
-        self.save()
-    
+        with self._cond:
+            self.settings[key] = value
+        self._changed()
+
     def clear(self):
-        self.settings = DEFAULT_SETTINGS.copy()
-        self.save()
+        with self._cond:
+            kept = {key: self.settings[key] for key in KEPT_ON_CLEAR if key in self.settings}
+            self.settings = DEFAULT_SETTINGS.copy()
+            self.settings.update(kept)
+        self._changed()
 
     def _ensure_defaults(self):
         changed = False
@@ -52,3 +207,46 @@ class SettingsManager:
                 changed = True
         if changed:
             self.save()
+
+    def _write_atomic(self, data):
+        # Readers only ever see the old file or the complete new one.
+        tmp_path = self.settings_path.with_name(self.settings_path.name + ".tmp")
+        encoded = data.encode()
+        with self._cond:
+            self._known_hashes.append(hashlib.sha256(encoded).digest())
+        with open(tmp_path, "wb") as f:
+            f.write(encoded)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.settings_path)
+
+    # --- Write-behind ---
+    def _changed(self):
+        if not self.write_behind or self._closed:
+            self.save()
+            return
+        with self._cond:
+            now = time.monotonic()
+            if not self._dirty:
+                self._dirty = True
+                self._dirty_since = now
+            self._flush_at = min(now + self.debounce, self._dirty_since + self.max_delay)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_behind_loop, name="SettingsWriter", daemon=True)
+                self._writer.start()
+            self._cond.notify()
+
+    def _write_behind_loop(self):
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if not self._dirty:
+                        self._cond.wait()
+                        continue
+                    delay = self._flush_at - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if self._closed:
+                    return
+            self.save()
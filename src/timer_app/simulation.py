@@ -0,0 +1,159 @@
+"""Fast-forward simulation of the timer engine on a virtual clock.
+
+    python -m timer_app.simulation --timers 5000 --days 2
+
+Starts thousands of timers, pauses and resumes some of them, runs days of
+simulated time in seconds of real time and checks every tick count, the
+finish order and the "Ends at" / "Finished at" label times exactly. Exits
+with status 1 if anything is off. Headless like cli.py.
+"""
+import argparse
+from collections import defaultdict
+import random
+import sys
+import time
+
+from .clock import VirtualClock
+from .timer_engine import TimerEngine
+from .timer_logic import TimerLogic
+
+LABEL_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class Simulation:
+    """A TimerEngine driven step by step from a VirtualClock, on one thread."""
+
+    def __init__(self, start=None):
+        self.clock = VirtualClock(start)
+        self.engine = TimerEngine(on_tick=self._on_tick, on_finish=self._on_finish, clock=self.clock)
+        self.ticks = defaultdict(list)
+        self.finished = []
+
+    def _on_tick(self, name, h, m, s):
+        self.ticks[name].append(h * 3600 + m * 60 + s)
+
+    def _on_finish(self, name):
+        self.finished.append((name, self.clock.monotonic(), self.clock.now()))
+
+    def at(self, seconds, func):
+        """Run `func` when the simulated clock reaches `seconds`."""
+        self.clock.after(None, int(round((seconds - self.clock.monotonic()) * 1000)), func)
+
+    def step(self, limit=None):
+        """Jump to the next deadline or scheduled call and run it; False when idle."""
+        candidates = [t for t in (self.engine.next_deadline(), self.clock.next_call()) if t is not None]
+        if not candidates or (limit is not None and min(candidates) > limit):
+            return False
+        self.clock.advance_to(max(self.clock.monotonic(), min(candidates)))
+        self.engine.run_pending()
+        return True
+
+    def run(self, until=None):
+        while self.step(until):
+            pass
+        if until is not None and until > self.clock.monotonic():
+            self.clock.advance_to(until)
+
+
+def run_check(timers=5000, ticking=50, days=2.0, seed=0):
+    """Simulate and cross-check; returns a report dict with any errors found.
+
+    `ticking` timers count down under two hours with every tick delivered,
+    a third of them paused and resumed once; the rest run quiet (as while
+    the window is hidden) for up to `days`, waking only to finish.
+    """
+    rng = random.Random(seed)
+    sim = Simulation()
+    expected = {}
+    labels = {}
+    errors = []
+
+    def start(name, total, quiet, pause=None):
+        timer = sim.engine.start(name, total)
+        labels[name] = timer.end_datetime.strftime(LABEL_FORMAT)
+        if quiet:
+            sim.engine.set_quiet(name, True)
+        if pause:
+            pause_at, pause_for = pause
+            sim.at(sim.clock.monotonic() + pause_at, lambda: sim.engine.pause(name))
+
+            def resume():
+                sim.engine.resume(name)
+                labels[name] = sim.engine.get(name).end_datetime.strftime(LABEL_FORMAT)
+            sim.at(sim.clock.monotonic() + pause_at + pause_for, resume)
+
+    for index in range(timers):
+        name = f"t{index}"
+        ticks = index < ticking
+        started = rng.randrange(3600 * 1000) / 1000
+        total = rng.randint(1, 7200) if ticks else rng.randint(1, int(days * 86400))
+        pause = None
+        if ticks and index % 3 == 0 and total > 2:
+            pause = (rng.randrange(1000, total * 1000) / 1000, rng.randrange(1, 600 * 1000) / 1000)
+        expected[name] = (started + total + (pause[1] if pause else 0), total, ticks)
+        sim.at(started, lambda name=name, total=total, ticks=ticks, pause=pause: start(name, total, not ticks, pause))
+
+    # The main timer through TimerLogic, as TimerPage drives it.
+    logic_ticks = []
+    logic = TimerLogic(on_tick=lambda h, m, s: logic_ticks.append((h, m, s)), engine=sim.engine, name="main")
+    sim.at(10, lambda: logic.start(90))
+    sim.at(40.5, logic.pause)
+    sim.at(100.5, logic.resume)
+
+    started = time.perf_counter()
+    sim.run()
+    elapsed = time.perf_counter() - started
+
+    finish_times = [at for _, at, _ in sim.finished]
+    if finish_times != sorted(finish_times):
+        errors.append("timers finished out of order")
+    finished = {name: (at, now) for name, at, now in sim.finished}
+    for name, (end, total, ticks) in expected.items():
+        if name not in finished:
+            errors.append(f"{name} never finished")
+            continue
+        at, now = finished[name]
+        if abs(at - end) > 1e-6:
+            errors.append(f"{name} finished at {at:.3f}s, expected {end:.3f}s")
+        if now.strftime(LABEL_FORMAT) != labels[name]:
+            errors.append(f"{name} finished at {now:{LABEL_FORMAT}}, label said {labels[name]}")
+        want = list(range(total, -1, -1)) if ticks else [0]
+        if sim.ticks[name] != want:
+            errors.append(f"{name} ticked {len(sim.ticks[name])} times, expected {len(want)}")
+    if len(logic_ticks) != 91 or logic_ticks[-1] != (0, 0, 0) or logic.clock.monotonic() < 160:
+        errors.append(f"main timer ticked {len(logic_ticks)} times, expected 91")
+    if logic._is_running:
+        errors.append("main timer still running")
+
+    return {
+        "timers": timers + 1,
+        "ticks": sum(len(ticks) for ticks in sim.ticks.values()),
+        "simulated_seconds": sim.clock.monotonic(),
+        "elapsed": elapsed,
+        "errors": errors,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m timer_app.simulation", description=__doc__.splitlines()[0])
+    parser.add_argument("--timers", type=int, default=5000)
+    parser.add_argument("--ticking", type=int, default=50, help="How many of them tick every second.")
+    parser.add_argument("--days", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report = run_check(args.timers, args.ticking, args.days, args.seed)
+    print(
+        f"{report['timers']} timers, {report['ticks']} ticks, "
+        f"{report['simulated_seconds'] / 86400:.2f} days simulated in {report['elapsed']:.2f} s"
+    )
+    for error in report["errors"][:20]:
+        print(error)
+    if report["errors"]:
+        print(f"{len(report['errors'])} errors")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
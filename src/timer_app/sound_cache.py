@@ -0,0 +1,160 @@
+from collections import OrderedDict
+from pathlib import Path
+import hashlib
+import mmap
+import os
+import pygame
+from .loudness import normalized_pcm
+
+
+class SoundCache:
+    """Decoded PCM keyed by file content and mixer format.
+
+    Recently used buffers are kept in memory up to `max_bytes` (LRU). When a
+    `cache_dir` is given, every decode is also written there and memory-mapped
+    on later runs, so a sound is decoded at most once per mixer format.
+    Loudness-normalized copies are cached the same way under their own key,
+    so a file is normalized at most once per target level. The files on disk
+    are kept under `max_disk_bytes` too: a hit touches the file, and the least
+    recently used ones are deleted on startup and after every write.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=64 * 1024 * 1024, max_disk_bytes=256 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._digests = {}
+        # Decodes of sounds no longer used pile up across runs otherwise.
+        self._trim_disk()
+
+    def load(self, path, normalize_to=None):
+        """Sound for `path`; with `normalize_to` (dBFS), scaled to that loudness."""
+        if normalize_to is not None:
+            return self._load_normalized(path, normalize_to)
+        key = self.key_for(path)
+        buffer = self._cached(key)
+        if buffer is None:
+            sound = pygame.mixer.Sound(str(path))
+            buffer = sound.get_raw()
+            self._write_to_disk(key, buffer)
+            self._remember(key, buffer)
+            return sound
+        return pygame.mixer.Sound(buffer=buffer)
+
+    def _load_normalized(self, path, target_db):
+        key = self.key_for(path, f"-norm{target_db:g}")
+        buffer = self._cached(key)
+        if buffer is None:
+            frequency, _, channels = pygame.mixer.get_init()
+            source = self.load(path).get_raw()
+            buffer = normalized_pcm(source, frequency, channels, target_db)
+            self._write_to_disk(key, buffer)
+            self._remember(key, buffer)
+        return pygame.mixer.Sound(buffer=buffer)
+
+    def _cached(self, key):
+        buffer = self._entries.get(key)
+        if buffer is not None:
+            self._entries.move_to_end(key)
+            return buffer
+        buffer = self._map_from_disk(key)
+        if buffer is not None:
+            self._remember(key, buffer)
+        return buffer
+
+    def key_for(self, path, suffix=""):
+        frequency, size, channels = pygame.mixer.get_init()
+        return f"{self._digest(path)}-{frequency}-{size}-{channels}{suffix}"
+
+    def clear(self):
+        self._entries.clear()
+        self._size = 0
+
+    def _digest(self, path):
+        # Hashing is skipped while the file's size and mtime are unchanged.
+        path = Path(path).resolve()
+        stat = path.stat()
+        memo_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        digest = self._digests.get(memo_key)
+        if digest is None:
+            # In chunks rather than hashlib.file_digest(), which needs Python 3.11.
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+            self._digests[memo_key] = digest
+        return digest
+
+    def _remember(self, key, buffer):
+        size = len(buffer)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = buffer
+        self._size += size
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def _cache_file(self, key):
+        return self.cache_dir / f"{key}.pcm"
+
+    def _map_from_disk(self, key):
+        if self.cache_dir is None:
+            return None
+        path = self._cache_file(key)
+        try:
+            with open(path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            # The modification time orders the files for _trim_disk().
+            os.utime(path)
+        except OSError:
+            pass
+        return buffer
+
+    def _write_to_disk(self, key, buffer):
+        if self.cache_dir is None or len(buffer) > self.max_disk_bytes:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            target = self._cache_file(key)
+            tmp_path = target.with_name(target.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(buffer)
+            os.replace(tmp_path, target)
+        except OSError as e:
+            print(f"Failed to write sound cache: {e}")
+            return
+        self._trim_disk(keep=target)
+
+    def _trim_disk(self, keep=None):
+        """Delete the least recently used cache files until the rest fit in max_disk_bytes."""
+        if self.cache_dir is None:
+            return
+        files = []
+        total = 0
+        try:
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".pcm") and entry.is_file():
+                    stat = entry.stat()
+                    files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return
+        keep = str(keep) if keep is not None else None
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                # Windows won't delete a file that is still mapped.
+                continue
+            total -= size
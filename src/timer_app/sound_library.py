@@ -0,0 +1,278 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import threading
+import wave
+
+from .config import AUDIO_DIR, SOUND_INDEX, PREVIEW_DIR
+
+SOUND_EXTENSIONS = {".mp3", ".wav", ".ogg"}
+PREVIEW_SECONDS = 3.0
+
+# MPEG audio sample rates by version bits (1 = MPEG2.5, 2 = MPEG2, 3 = MPEG1).
+_MP3_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+
+class SoundInfo:
+    __slots__ = (
+        "path", "kind", "size", "mtime_ns", "duration", "sample_rate", "channels",
+        "peak", "rms", "preview", "error"
+    )
+
+    def __init__(self, path, kind, size, mtime_ns, duration=0.0, sample_rate=None, channels=None,
+                 peak=0.0, rms=0.0, preview=None, error=None):
+        self.path = path
+        self.kind = kind
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.duration = duration
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.peak = peak
+        self.rms = rms
+        self.preview = preview
+        self.error = error
+
+    @property
+    def name(self):
+        return Path(self.path).name
+
+    @property
+    def valid(self):
+        return self.error is None
+
+    @property
+    def peak_db(self):
+        return 20 * math.log10(self.peak) if self.peak > 0 else float("-inf")
+
+    @property
+    def rms_db(self):
+        return 20 * math.log10(self.rms) if self.rms > 0 else float("-inf")
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{key: data.get(key) for key in cls.__slots__})
+
+
+class SoundLibrary:
+    """Index of the sounds in the bundled and user-added folders.
+
+    Each file is decoded once, in a worker process, to record its duration,
+    native format, peak/RMS level and a short preview clip. The index is
+    stored keyed by path and checked against size and mtime, so a rescan
+    only decodes new or changed files and the picker can list everything
+    straight from disk at startup.
+    """
+
+    def __init__(self, folders=(), index_path=SOUND_INDEX, preview_dir=PREVIEW_DIR, max_workers=None):
+        self.folders = [
+            (AUDIO_DIR / "tick_sounds", "tick"),
+            (AUDIO_DIR / "alarm_sounds", "alarm"),
+        ] + [(Path(folder), "user") for folder in folders]
+        self.index_path = Path(index_path)
+        self.preview_dir = Path(preview_dir)
+        self.max_workers = max_workers
+        self.entries = {}
+        self._lock = threading.Lock()
+        self._scan_thread = None
+        self.load()
+
+    def load(self):
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            entries = {path: SoundInfo.from_dict(info) for path, info in data.items()}
+        except (OSError, ValueError, TypeError) as e:
+            if self.index_path.exists():
+                print(f"Failed to load sound index: {e}")
+            entries = {}
+        with self._lock:
+            self.entries = entries
+
+    def save(self):
+        with self._lock:
+            data = {path: info.to_dict() for path, info in self.entries.items()}
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"Failed to save sound index: {e}")
+
+    def add_folder(self, folder):
+        folder = Path(folder)
+        if all(existing != folder for existing, _ in self.folders):
+            self.folders.append((folder, "user"))
+
+    def search(self, query="", kind=None, limit=None):
+        """Valid sounds whose file name contains every word of `query`, by name."""
+        words = query.lower().split()
+        with self._lock:
+            entries = list(self.entries.values())
+        matches = [
+            info for info in entries
+            if info.valid and (kind is None or info.kind == kind)
+            and all(word in info.name.lower() for word in words)
+        ]
+        matches.sort(key=lambda info: info.name.lower())
+        return matches[:limit] if limit else matches
+
+    def scan(self):
+        """Bring the index up to date; returns how many files were (re)analyzed."""
+        found = {}
+        for folder, kind in self.folders:
+            try:
+                paths = [path for path in folder.iterdir() if path.suffix.lower() in SOUND_EXTENSIONS]
+            except OSError:
+                continue
+            for path in paths:
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                found[str(path.resolve())] = (kind, stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            current = dict(self.entries)
+        entries = {}
+        work = []
+        for path, (kind, size, mtime_ns) in found.items():
+            info = current.get(path)
+            if info is not None and info.size == size and info.mtime_ns == mtime_ns:
+                info.kind = kind
+                entries[path] = info
+            else:
+                work.append((path, kind, size, mtime_ns))
+
+        for path, info in current.items():
+            if path not in found and info.preview:
+                try:
+                    Path(info.preview).unlink()
+                except OSError:
+                    pass
+
+        if work:
+            self.preview_dir.mkdir(parents=True, exist_ok=True)
+            # spawn rather than fork: the GUI process has Tk and audio threads running.
+            context = multiprocessing.get_context("spawn")
+            workers = min(len(work), self.max_workers or os.cpu_count() or 1)
+            with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker) as pool:
+                results = pool.map(
+                    _analyze,
+                    [path for path, _, _, _ in work],
+                    [str(self._preview_path(path)) for path, _, _, _ in work]
+                )
+                for (path, kind, size, mtime_ns), result in zip(work, results):
+                    entries[path] = SoundInfo(path, kind, size, mtime_ns, **result)
+
+        with self._lock:
+            self.entries = entries
+        if work or len(entries) != len(current):
+            self.save()
+        return len(work)
+
+    def scan_async(self, on_done=None):
+        """Rescan on a background thread; `on_done(changed)` is called from that thread."""
+        if self._scan_thread is not None and self._scan_thread.is_alive():
+            return
+
+        def run():
+            try:
+                changed = self.scan()
+            except Exception as e:
+                print(f"Failed to index sounds: {e}")
+                return
+            if on_done:
+                on_done(changed)
+
+        self._scan_thread = threading.Thread(target=run, name="SoundIndexer", daemon=True)
+        self._scan_thread.start()
+
+    def _preview_path(self, path):
+        return self.preview_dir / (hashlib.sha1(path.encode("utf-8")).hexdigest() + ".wav")
+
+
+# --- Worker process ---
+def _init_worker():
+    # Decoding needs an initialised mixer, but never a sound card.
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    import pygame
+    pygame.mixer.init(44100, -16, 2)
+
+
+def _analyze(path, preview_path):
+    import numpy as np
+    import pygame
+
+    try:
+        sound = pygame.mixer.Sound(path)
+        rate, _, channels = pygame.mixer.get_init()
+        raw = sound.get_raw()
+        samples = np.frombuffer(raw[:len(raw) - len(raw) % (2 * channels)], dtype=np.int16)
+        samples = samples.reshape(-1, channels)
+        if not len(samples):
+            raise ValueError("no audio")
+        levels = samples.astype(np.float32) / 32768.0
+        peak = float(np.abs(levels).max())
+        rms = float(np.sqrt(np.mean(np.square(levels))))
+
+        # The preview starts at the first sound above -40 dBFS, not at leading silence.
+        audible = np.flatnonzero(np.abs(levels).max(axis=1) > 0.01)
+        start = int(audible[0]) if len(audible) else 0
+        clip = samples[start:start + int(rate * PREVIEW_SECONDS)]
+        with wave.open(preview_path, "wb") as preview:
+            preview.setnchannels(channels)
+            preview.setsampwidth(2)
+            preview.setframerate(rate)
+            preview.writeframes(clip.tobytes())
+
+        native_rate, native_channels = _probe_format(path)
+        return {
+            "duration": len(samples) / rate,
+            "sample_rate": native_rate or rate,
+            "channels": native_channels or channels,
+            "peak": peak,
+            "rms": rms,
+            "preview": preview_path,
+        }
+    except Exception as e:
+        return {"error": str(e) or type(e).__name__}
+
+
+def _probe_format(path):
+    """(sample_rate, channels) from the file header, or (None, None) if unknown."""
+    suffix = Path(path).suffix.lower()
+    try:
+        if suffix == ".wav":
+            with wave.open(path, "rb") as wav:
+                return wav.getframerate(), wav.getnchannels()
+        with open(path, "rb") as f:
+            head = f.read(64 * 1024)
+    except (OSError, EOFError, wave.Error):
+        return None, None
+
+    if suffix == ".ogg":
+        index = head.find(b"\x01vorbis")
+        if index >= 0 and len(head) >= index + 16:
+            return int.from_bytes(head[index + 12:index + 16], "little"), head[index + 11]
+    elif suffix == ".mp3":
+        offset = 0
+        if head.startswith(b"ID3") and len(head) >= 10:
+            size = head[6:10]
+            offset = 10 + (size[0] << 21 | size[1] << 14 | size[2] << 7 | size[3])
+        for i in range(offset, len(head) - 4):
+            if head[i] == 0xFF and head[i + 1] & 0xE0 == 0xE0:
+                version = (head[i + 1] >> 3) & 0x03
+                rate_index = (head[i + 2] >> 2) & 0x03
+                if version in _MP3_RATES and rate_index < 3:
+                    channels = 1 if head[i + 3] >> 6 == 3 else 2
+                    return _MP3_RATES[version][rate_index], channels
+    return None, None
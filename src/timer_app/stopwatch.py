@@ -0,0 +1,53 @@
+import time
+
+
+def format_precise(seconds):
+    """HH:MM:SS.mmm, truncated rather than rounded so the display never runs ahead."""
+    millis = int(max(0.0, seconds) * 1000)
+    total_seconds, millis = divmod(millis, 1000)
+    hours, rest = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours:02}:{minutes:02}:{seconds:02}.{millis:03}"
+
+
+class Stopwatch:
+    """Counts up with perf_counter resolution; laps are (lap time, total) pairs."""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.laps = []
+        self._started_at = None
+        self._accumulated = 0.0
+        self._last_lap_total = 0.0
+
+    @property
+    def running(self):
+        return self._started_at is not None
+
+    def elapsed(self, now=None):
+        if self._started_at is None:
+            return self._accumulated
+        now = self.clock() if now is None else now
+        return self._accumulated + now - self._started_at
+
+    def start(self):
+        if self._started_at is None:
+            self._started_at = self.clock()
+
+    def stop(self):
+        if self._started_at is not None:
+            self._accumulated = self.elapsed()
+            self._started_at = None
+
+    def lap(self):
+        total = self.elapsed()
+        lap = (total - self._last_lap_total, total)
+        self._last_lap_total = total
+        self.laps.append(lap)
+        return lap
+
+    def reset(self):
+        self.laps = []
+        self._started_at = None
+        self._accumulated = 0.0
+        self._last_lap_total = 0.0
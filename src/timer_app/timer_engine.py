@@ -0,0 +1,330 @@
+import heapq
+import itertools
+import math
+import threading
+from datetime import timedelta
+
+from .clock import SYSTEM_CLOCK
+from .journal import MAX_NAME_BYTES
+
+
+def _check_timer(name, total_seconds):
+    # A timer only finishes when its countdown reaches exactly 0.
+    if total_seconds <= 0:
+        raise ValueError(f"a timer needs a positive duration, got {total_seconds!r}")
+    if len(name.encode("utf-8")) > MAX_NAME_BYTES:
+        raise ValueError(f"timer name is longer than {MAX_NAME_BYTES} bytes")
+
+
+class EngineTimer:
+    __slots__ = (
+        "name", "total_seconds", "start", "started_at", "tick", "end_datetime", "on_tick", "on_finish", "clock",
+        "cancelled", "paused_at", "quiet", "generation", "last_deadline", "last_lateness", "max_lateness"
+    )
+
+    def __init__(self, name, total_seconds, start, on_tick, on_finish, clock=SYSTEM_CLOCK):
+        self.name = name
+        self.total_seconds = total_seconds
+        self.start = start
+        # Wall-clock start, for the history.
+        self.started_at = clock.time()
+        self.tick = 0
+        self.clock = clock
+        self.end_datetime = clock.now() + timedelta(seconds=total_seconds)
+        self.on_tick = on_tick
+        self.on_finish = on_finish
+        self.cancelled = False
+        self.paused_at = None
+        # A quiet timer skips its per-second ticks and only wakes the engine to finish.
+        self.quiet = False
+        self.generation = 0
+        self.last_deadline = start
+        self.last_lateness = 0.0
+        self.max_lateness = 0.0
+
+    @property
+    def deadline(self):
+        return self.start + self.tick
+
+    @property
+    def end_deadline(self):
+        return self.start + self.total_seconds
+
+    @property
+    def next_deadline(self):
+        return self.end_deadline if self.quiet else self.deadline
+
+    @property
+    def paused(self):
+        return self.paused_at is not None
+
+    def remaining(self, now=None):
+        if self.paused_at is not None:
+            now = self.paused_at
+        elif now is None:
+            now = self.clock.monotonic()
+        return max(0.0, self.end_deadline - now)
+
+
+class TimerEngine:
+    """Runs any number of named countdowns on one scheduler thread.
+
+    Ticks sit in a deadline heap (O(log n) start); cancel and pause just mark
+    the entry (O(1)) and wake the scheduler so it never sleeps on a dead deadline.
+    All times come from `clock`; on a clock.VirtualClock there is no thread,
+    and run_pending() delivers whatever is due after the clock is advanced.
+    """
+
+    def __init__(self, on_tick=None, on_finish=None, journal=None, clock=SYSTEM_CLOCK, history=None):
+        self.on_tick = on_tick or (lambda name, h, m, s: None)
+        self.on_finish = on_finish or (lambda name: None)
+        self.journal = journal
+        self.history = history
+        self.clock = clock
+        # Bumped whenever the set of timers or their paused state changes.
+        self.version = 0
+        self._timers = {}
+        self._heap = []
+        self._stale = 0
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def start(self, name, total_seconds, on_tick=None, on_finish=None):
+        _check_timer(name, total_seconds)
+        with self._cond:
+            if name in self._timers:
+                return None
+            timer = EngineTimer(name, total_seconds, self.clock.monotonic(), on_tick, on_finish, self.clock)
+            # Journaled before the timer exists, so if that fails nothing has changed.
+            if self.journal:
+                self.journal.record_start(name, total_seconds, timer.end_datetime.timestamp())
+            self._timers[name] = timer
+            self.version += 1
+            self._push(timer)
+            self._ensure_thread()
+            self._cond.notify()
+        return timer
+
+    def restore(self, name, total_seconds, remaining, paused=False, on_tick=None, on_finish=None):
+        """Re-create a timer that has `remaining` seconds left, e.g. from a replayed journal."""
+        _check_timer(name, total_seconds)
+        with self._cond:
+            if name in self._timers:
+                return None
+            now = self.clock.monotonic()
+            elapsed = total_seconds - remaining
+            timer = EngineTimer(name, total_seconds, now - elapsed, on_tick, on_finish, self.clock)
+            timer.tick = min(total_seconds, math.ceil(elapsed))
+            timer.started_at -= elapsed
+            timer.end_datetime = self.clock.now() + timedelta(seconds=remaining)
+            self._timers[name] = timer
+            self.version += 1
+            if paused:
+                timer.paused_at = now
+            else:
+                self._push(timer)
+                self._ensure_thread()
+                self._cond.notify()
+        return timer
+
+    def cancel(self, name):
+        with self._cond:
+            timer = self._timers.pop(name, None)
+            if timer is None:
+                return False
+            timer.cancelled = True
+            self.version += 1
+            if timer.paused_at is None:
+                self._discard_entry()
+            if self.journal:
+                self._record(self.journal.record_cancel, name)
+            if self.history:
+                self._record(
+                    self.history.record, name, timer.total_seconds, timer.started_at, self.clock.time(),
+                    timer.total_seconds - timer.remaining(), cancelled=True
+                )
+        return True
+
+    def pause(self, name):
+        with self._cond:
+            timer = self._timers.get(name)
+            if timer is None or timer.paused_at is not None:
+                return False
+            timer.paused_at = self.clock.monotonic()
+            timer.generation += 1
+            self.version += 1
+            self._discard_entry()
+            if self.journal:
+                self._record(self.journal.record_pause, name, timer.remaining())
+        return True
+
+    def resume(self, name):
+        with self._cond:
+            timer = self._timers.get(name)
+            if timer is None or timer.paused_at is None:
+                return False
+            now = self.clock.monotonic()
+            timer.start += now - timer.paused_at
+            timer.paused_at = None
+            self.version += 1
+            timer.end_datetime = self.clock.now() + timedelta(seconds=timer.remaining(now))
+            self._push(timer)
+            self._cond.notify()
+            if self.journal:
+                self._record(self.journal.record_resume, name, timer.end_datetime.timestamp())
+        return True
+
+    def set_quiet(self, name, quiet):
+        """Stop (or restart) the per-second ticks of `name`; it still finishes on time.
+
+        Leaving quiet mode delivers one catch-up tick right away, since the
+        ticks missed in between are dropped rather than replayed.
+        """
+        with self._cond:
+            timer = self._timers.get(name)
+            if timer is None or timer.quiet == quiet:
+                return False
+            timer.quiet = quiet
+            if timer.paused_at is None:
+                timer.generation += 1
+                self._discard_entry()
+                self._push(timer)
+        return True
+
+    def get(self, name):
+        return self._timers.get(name)
+
+    def names(self):
+        with self._cond:
+            return list(self._timers)
+
+    def snapshot(self):
+        """Return (version, timers) as one consistent view, in start order."""
+        with self._cond:
+            return self.version, list(self._timers.values())
+
+    def __len__(self):
+        return len(self._timers)
+
+    def __contains__(self, name):
+        return name in self._timers
+
+    def _push(self, timer):
+        heapq.heappush(self._heap, (timer.next_deadline, next(self._seq), timer.generation, timer))
+
+    @staticmethod
+    def _is_stale(entry):
+        timer = entry[3]
+        return timer.cancelled or entry[2] != timer.generation
+
+    def _discard_entry(self):
+        self._stale += 1
+        if self._stale > 64 and self._stale > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if not self._is_stale(entry)]
+            heapq.heapify(self._heap)
+            self._stale = 0
+        self._cond.notify()
+
+    def next_deadline(self):
+        """The earliest time anything is due, or None with nothing scheduled."""
+        with self._cond:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def run_pending(self):
+        """Deliver every tick and finish that is due now. For manual clocks."""
+        with self._cond:
+            due = self._pop_due(self.clock.monotonic())
+        self._dispatch(due)
+
+    def _ensure_thread(self):
+        if self._thread is None and not self.clock.manual:
+            self._thread = threading.Thread(target=self._run, name="TimerEngine", daemon=True)
+            self._thread.start()
+
+    def _drop_stale(self):
+        while self._heap and self._is_stale(self._heap[0]):
+            heapq.heappop(self._heap)
+            self._stale -= 1
+
+    def _next_due(self):
+        """Pop every timer whose deadline has passed, waiting until one has."""
+        with self._cond:
+            while True:
+                self._drop_stale()
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                now = self.clock.monotonic()
+                deadline = self._heap[0][0]
+                if now < deadline:
+                    self._cond.wait(deadline - now)
+                    continue
+                return self._pop_due(now)
+
+    def _pop_due(self, now):
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_stale(entry):
+                self._stale -= 1
+                continue
+            due.append(self._advance(entry[3], now))
+        return due
+
+    def _advance(self, timer, now):
+        # Ticks we slept through entirely are dropped instead of replayed;
+        # a quiet timer is only ever woken for its end deadline.
+        missed = timer.total_seconds - timer.tick if timer.quiet else int(now - timer.deadline)
+        if missed:
+            timer.tick = min(timer.tick + missed, timer.total_seconds)
+        timer.last_deadline = timer.deadline
+        timer.last_lateness = now - timer.deadline
+        timer.max_lateness = max(timer.max_lateness, timer.last_lateness)
+
+        remaining = timer.total_seconds - timer.tick
+        finished = remaining == 0
+        if finished:
+            del self._timers[timer.name]
+            self.version += 1
+            if self.journal:
+                self._record(self.journal.record_finish, timer.name)
+            if self.history:
+                self._record(
+                    self.history.record, timer.name, timer.total_seconds, timer.started_at, self.clock.time(),
+                    timer.total_seconds, overrun=max(0.0, timer.last_lateness)
+                )
+        else:
+            timer.tick += 1
+            self._push(timer)
+        return timer, remaining, finished
+
+    @staticmethod
+    def _record(func, *args, **kwargs):
+        # The journal and history only queue records, but a failure there must
+        # never stop the scheduler thread or leave a timer half finished.
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            print(f"Failed to record timer event: {e}")
+
+    def _run(self):
+        while True:
+            try:
+                self._dispatch(self._next_due())
+            except Exception as e:
+                print(f"Timer scheduler error: {e}")
+
+    def _dispatch(self, due):
+        for timer, remaining, finished in due:
+            if timer.cancelled:
+                continue
+            hours, rest = divmod(remaining, 3600)
+            minutes, seconds = divmod(rest, 60)
+            try:
+                (timer.on_tick or self.on_tick)(timer.name, hours, minutes, seconds)
+                if finished:
+                    (timer.on_finish or self.on_finish)(timer.name)
+            except Exception as e:
+                print(f"Timer callback for {timer.name!r} failed: {e}")
@@ -1,31 +1,101 @@
-import time
-import threading
+from .timer_engine import TimerEngine
 
 class TimerLogic:
-    def __init__(self, on_tick=None, on_finish=None):
+    def __init__(self, on_tick=None, on_finish=None, engine=None, name="main", clock=None):
         self.on_tick = on_tick or (lambda h, m, s: None)
         self.on_finish = on_finish or (lambda: None)
+        if engine is None:
+            engine = TimerEngine(clock=clock) if clock is not None else TimerEngine()
+        self.engine = engine
+        self.name = name
         self._is_running = False
-        self._thread = None
+        self._timer = None
+        # Bumped on every start/cancel so callbacks already in flight for an
+        # earlier run are recognised and dropped.
+        self.run_id = 0
+
+    @property
+    def end_datetime(self):
+        return self._timer.end_datetime if self._timer else None
+
+    @property
+    def clock(self):
+        return self.engine.clock
+
+    @property
+    def last_deadline(self):
+        return self._timer.last_deadline if self._timer else None
+
+    @property
+    def last_lateness(self):
+        return self._timer.last_lateness if self._timer else 0.0
+
+    @property
+    def max_lateness(self):
+        return self._timer.max_lateness if self._timer else 0.0
+
+    @property
+    def is_paused(self):
+        return self._is_running and self._timer is not None and self._timer.paused
+
+    def remaining(self):
+        """Seconds left as a float, for displays finer than the once-a-second ticks."""
+        return self._timer.remaining() if self._is_running and self._timer else 0.0
 
     def start(self, total_seconds):
         if self._is_running:
             return
+        run = self._new_run()
+        try:
+            self._timer = self.engine.start(self.name, total_seconds, **run)
+        except ValueError:
+            self._is_running = False
+            raise
+
+    def restore(self, total_seconds, remaining, paused=False):
+        if self._is_running:
+            return
+        run = self._new_run()
+        try:
+            self._timer = self.engine.restore(self.name, total_seconds, remaining, paused=paused, **run)
+        except ValueError:
+            self._is_running = False
+            raise
+
+    def _new_run(self):
+        # Clear out whatever is left of the previous run before reusing the name.
+        self.engine.cancel(self.name)
+        self.run_id += 1
+        run_id = self.run_id
         self._is_running = True
-        self._thread = threading.Thread(target=self._run, args=(total_seconds,), daemon=True)
-        self._thread.start()
+        return {
+            "on_tick": lambda name, h, m, s: self._handle_tick(run_id, h, m, s),
+            "on_finish": lambda name: self._handle_finish(run_id)
+        }
 
-    def stop(self):
+    def pause(self):
+        return self._is_running and self.engine.pause(self.name)
+
+    def resume(self):
+        return self._is_running and self.engine.resume(self.name)
+
+    def set_quiet(self, quiet):
+        """Skip the per-second ticks (the finish still arrives), e.g. while the window is hidden."""
+        return self._is_running and self.engine.set_quiet(self.name, quiet)
+
+    def cancel(self):
+        self.run_id += 1
         self._is_running = False
+        self.engine.cancel(self.name)
 
-    def _run(self, total_seconds):
-        for remaining in range(total_seconds, -1, -1):
-            if not self._is_running:
-                break
-            hours, remainder = divmod(remaining, 3600)
-            minutes, seconds = divmod(remainder, 60)
+    def stop(self):
+        self.cancel()
+
+    def _handle_tick(self, run_id, hours, minutes, seconds):
+        if run_id == self.run_id:
             self.on_tick(hours, minutes, seconds)
-            time.sleep(1)
-        if self._is_running:
+
+    def _handle_finish(self, run_id):
+        if run_id == self.run_id:
+            self._is_running = False
             self.on_finish()
-        self._is_running = False
@@ -0,0 +1,155 @@
+import customtkinter
+from datetime import datetime
+from ..alarm_scheduler import MAX_MISSED_COUNT
+
+UPCOMING_ROWS = 50
+REFRESH_MS = 30000
+
+
+class AlarmPage(customtkinter.CTkFrame):
+    """Add and remove recurring alarms; lists the next ones to ring."""
+
+    def __init__(self, parent, alarm_scheduler, audio_manager, switch_to_timer, missed=()):
+        super().__init__(parent)
+        self.alarm_scheduler = alarm_scheduler
+        self.audio_manager = audio_manager
+        self.switch_to_timer = switch_to_timer
+        self._after_id = None
+        self.configure(fg_color="transparent")
+
+        self._build_ui()
+
+        self.grid_rowconfigure(2, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.show_missed(missed)
+        self._refresh()
+
+    def show_missed(self, missed):
+        if missed:
+            names = ", ".join(
+                f"{alarm.name} ({count}{'+' if count >= MAX_MISSED_COUNT else ''}x)" for alarm, count in missed
+            )
+            self.status_var.set(f"Missed while closed: {names}")
+
+    def _button(self, parent, text, command):
+        return customtkinter.CTkButton(
+            parent,
+            height=40,
+            corner_radius=10,
+            border_spacing=10,
+            fg_color="transparent",
+            hover_color=("gray70", "gray30"),
+            text_color=("gray10", "gray90"),
+            text=text,
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            command=command
+        )
+
+    def _build_ui(self):
+        header = customtkinter.CTkFrame(self, fg_color="transparent")
+        header.grid(row=0, column=0, sticky="ew")
+        header.grid_columnconfigure(1, weight=1)
+        self.back_button = self._button(header, "Back", self.switch_to_timer)
+        self.back_button.grid(row=0, column=0, padx=20, pady=20, sticky="w")
+        self.stop_button = self._button(header, "Stop alarm", self._stop_alarm)
+        self.stop_button.configure(state="disabled")
+        self.stop_button.grid(row=0, column=2, padx=20, pady=20, sticky="e")
+
+        form = customtkinter.CTkFrame(self, fg_color="transparent")
+        form.grid(row=1, column=0, padx=20, sticky="ew")
+        form.grid_columnconfigure(1, weight=1)
+        self.name_entry = customtkinter.CTkEntry(form, width=160, placeholder_text="Name")
+        self.name_entry.grid(row=0, column=0, padx=(0, 10), pady=10)
+        self.rule_entry = customtkinter.CTkEntry(
+            form, placeholder_text="weekdays 07:00, every 25m or */15 9-17 * * 1-5"
+        )
+        self.rule_entry.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="ew")
+        self.rule_entry.bind("<Return>", lambda event: self._add_alarm())
+        self._button(form, "Add", self._add_alarm).grid(row=0, column=2, padx=(0, 10), pady=10)
+        self._button(form, "Remove", self._remove_alarm).grid(row=0, column=3, pady=10)
+
+        self.upcoming_box = customtkinter.CTkTextbox(
+            self,
+            font=customtkinter.CTkFont(family="Courier", size=16),
+            state="disabled"
+        )
+        self.upcoming_box.grid(row=2, column=0, padx=20, pady=10, sticky="nsew")
+
+        self.status_var = customtkinter.StringVar(value="")
+        self.status_label = customtkinter.CTkLabel(
+            self,
+            textvariable=self.status_var,
+            font=customtkinter.CTkFont(size=12),
+            text_color=("gray50", "gray80")
+        )
+        self.status_label.grid(row=3, column=0, padx=20, pady=(0, 20), sticky="w")
+
+    # --- Page visibility (called by App) ---
+    def on_show(self):
+        self._refresh()
+
+    def on_hide(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+
+    def alarm_fired(self, name):
+        """Called on the Tk thread when `name` starts ringing."""
+        self.status_var.set(f"{name} rang at {datetime.now().strftime('%H:%M')}")
+        self.stop_button.configure(state="normal")
+        if self.winfo_ismapped():
+            self._refresh()
+
+    # --- Controls ---
+    def _add_alarm(self):
+        name = self.name_entry.get().strip()
+        rule = self.rule_entry.get().strip()
+        if not name or not rule:
+            self.status_var.set("Enter a name and a schedule")
+            return
+        try:
+            alarm = self.alarm_scheduler.add(name, rule)
+        except ValueError as e:
+            self.status_var.set(str(e))
+            return
+        self.rule_entry.delete(0, "end")
+        if alarm.next_fire is None:
+            self.status_var.set(f"{name} never rings")
+        else:
+            self.status_var.set(f"{name} rings next {self._format_time(alarm.next_fire)}")
+        self._refresh()
+
+    def _remove_alarm(self):
+        name = self.name_entry.get().strip()
+        if self.alarm_scheduler.remove(name):
+            self.status_var.set(f"Removed {name}")
+            self._refresh()
+        else:
+            self.status_var.set(f"No alarm called {name!r}")
+
+    def _stop_alarm(self):
+        self.audio_manager.stop_alarm()
+        self.stop_button.configure(state="disabled")
+
+    def _refresh(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+        # Only the next few are listed, however many alarms there are.
+        upcoming = self.alarm_scheduler.upcoming(UPCOMING_ROWS)
+        lines = [
+            f"{self._format_time(alarm.next_fire):<18}{alarm.name:<20}{alarm.text}"
+            for alarm in upcoming
+        ]
+        hidden = len(self.alarm_scheduler) - len(upcoming)
+        if hidden > 0:
+            lines.append(f"... and {hidden} more")
+        self.upcoming_box.configure(state="normal")
+        self.upcoming_box.delete("1.0", "end")
+        self.upcoming_box.insert("end", "\n".join(lines) if lines else "No alarms yet")
+        self.upcoming_box.configure(state="disabled")
+        self._after_id = self.after(REFRESH_MS, self._refresh)
+
+    @staticmethod
+    def _format_time(timestamp):
+        return datetime.fromtimestamp(timestamp).strftime("%a %d %b %H:%M")
@@ -0,0 +1,73 @@
+import customtkinter
+
+DIGITS = "0123456789"
+
+
+class DigitDisplay(customtkinter.CTkCanvas, customtkinter.CTkAppearanceModeBaseClass):
+    """The big HH:MM:SS countdown, drawn as one canvas text item per character.
+
+    Every digit sits in a cell as wide as the widest digit, so a cell never
+    moves when its neighbours change: show() only touches the cells whose
+    character changed, and Tk repaints just those cells' boxes rather than
+    laying out and redrawing the whole line as an entry does. The colour is
+    applied to all cells through their shared tag. A plain canvas isn't
+    themed, so the background comes from the CTk theme and both are redone
+    whenever the appearance mode changes.
+    """
+
+    def __init__(self, master, font, text_color, min_width=600):
+        super().__init__(master, highlightthickness=0)
+        customtkinter.CTkAppearanceModeBaseClass.__init__(self)
+        self.configure(bg=self._apply_appearance_mode(customtkinter.ThemeManager.theme["CTk"]["fg_color"]))
+        self.font = font
+        self.min_width = min_width
+        self.color = text_color
+        self._cells = []
+        self._text = ""
+        # Measured once; the cells are laid out from these.
+        self._digit_width = max(font.measure(digit) for digit in DIGITS)
+        self._height = font.metrics("linespace")
+
+    @property
+    def text(self):
+        return self._text
+
+    def show(self, text):
+        if len(text) != len(self._cells):
+            self._build_cells(text)
+            return
+        previous = self._text
+        self._text = text
+        for index, char in enumerate(text):
+            if char != previous[index]:
+                self.itemconfigure(self._cells[index], text=char)
+
+    def set_color(self, color):
+        """Recolour every cell; `color` is a (light, dark) pair like text_color."""
+        if color == self.color:
+            return
+        self.color = color
+        self.itemconfigure("cell", fill=self._apply_appearance_mode(color))
+
+    def destroy(self):
+        customtkinter.CTkAppearanceModeBaseClass.destroy(self)
+        super().destroy()
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self.configure(bg=self._apply_appearance_mode(customtkinter.ThemeManager.theme["CTk"]["fg_color"]))
+        self.itemconfigure("cell", fill=self._apply_appearance_mode(self.color))
+
+    def _build_cells(self, text):
+        self.delete("cell")
+        widths = [self._digit_width if char in DIGITS else self.font.measure(char) for char in text]
+        width = max(self.min_width, sum(widths))
+        self.configure(width=width, height=self._height)
+        fill = self._apply_appearance_mode(self.color)
+        x = (width - sum(widths)) / 2
+        self._cells = []
+        for char, cell_width in zip(text, widths):
+            self._cells.append(self.create_text(
+                x + cell_width / 2, 0, anchor="n", text=char, font=self.font, fill=fill, tags="cell"))
+            x += cell_width
+        self._text = text
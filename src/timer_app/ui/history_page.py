@@ -0,0 +1,90 @@
+import customtkinter
+from datetime import datetime, timedelta
+import math
+
+DAYS_SHOWN = 14
+RECENT_RUNS = 100
+BAR_WIDTH = 30
+
+
+class HistoryPage(customtkinter.CTkFrame):
+    """Time counted down per day, how late timers rang, and the latest runs."""
+
+    def __init__(self, parent, history, switch_to_timer):
+        super().__init__(parent)
+        self.history = history
+        self.switch_to_timer = switch_to_timer
+        self.configure(fg_color="transparent")
+
+        self._build_ui()
+
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure((0, 1), weight=1)
+
+    def _build_ui(self):
+        self.back_button = customtkinter.CTkButton(
+            self,
+            height=40,
+            corner_radius=10,
+            border_spacing=10,
+            fg_color="transparent",
+            hover_color=("gray70", "gray30"),
+            text_color=("gray10", "gray90"),
+            text="Back",
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            command=self.switch_to_timer
+        )
+        self.back_button.grid(row=0, column=0, padx=20, pady=20, sticky="w")
+
+        self.summary_box = self._textbox()
+        self.summary_box.grid(row=1, column=0, padx=(20, 10), pady=(0, 20), sticky="nsew")
+        self.runs_box = self._textbox()
+        self.runs_box.grid(row=1, column=1, padx=(10, 20), pady=(0, 20), sticky="nsew")
+
+    def _textbox(self):
+        return customtkinter.CTkTextbox(
+            self,
+            font=customtkinter.CTkFont(family="Courier", size=14),
+            state="disabled"
+        )
+
+    # --- Page visibility (called by App) ---
+    def on_show(self):
+        # Both summaries come from the per-day rollups, so this stays
+        # quick however long the history gets.
+        since = (datetime.now() - timedelta(days=DAYS_SHOWN - 1)).replace(hour=0, minute=0, second=0)
+        days = self.history.daily_totals(since=since.timestamp())
+        lines = [f"Last {DAYS_SHOWN} days", ""]
+        longest = max((counted for _, _, _, counted in days), default=0) or 1
+        for day, runs, cancelled, counted in days:
+            bar = "#" * math.ceil(BAR_WIDTH * counted / longest)
+            lines.append(f"{day[5:]}  {counted / 3600:5.1f} h  {bar}")
+        if not days:
+            lines.append("No timers yet")
+
+        lines += ["", "How late timers rang", ""]
+        for bound, count in self.history.overrun_distribution():
+            if count:
+                label = f"<= {bound * 1000:g} ms" if bound is not None else "longer"
+                lines.append(f"{label:>12}  {count}")
+        self._set_text(self.summary_box, lines)
+
+        runs = [
+            f"{datetime.fromtimestamp(run['started']):%d %b %H:%M}  {run['label'][:16]:<16} "
+            f"{self._format_seconds(run['counted']):>8}{'  cancelled' if run['cancelled'] else ''}"
+            for run in self.history.runs(newest_first=True, limit=RECENT_RUNS)
+        ]
+        self._set_text(self.runs_box, runs or ["No timers yet"])
+
+    @staticmethod
+    def _set_text(box, lines):
+        box.configure(state="normal")
+        box.delete("1.0", "end")
+        box.insert("end", "\n".join(lines))
+        box.configure(state="disabled")
+
+    @staticmethod
+    def _format_seconds(seconds):
+        hours, rest = divmod(int(seconds), 3600)
+        minutes, seconds = divmod(rest, 60)
+        return f"{hours}:{minutes:02}:{seconds:02}"
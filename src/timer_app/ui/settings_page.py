@@ -2,8 +2,12 @@ import customtkinter
 from tkinter import filedialog, messagebox
 from pathlib import Path
 from ..config import AUDIO_DIR, TICK_SOUND, ALARM_SOUND
+from ..sound_library import SoundLibrary
 import threading
 
+REFRESH_RATES = (30, 60, 120, 144)
+LIBRARY_ROWS = 50
+
 
 class SettingsPage(customtkinter.CTkFrame):
     def __init__(self, parent, audio_manager, settings_manager, switch_to_timer):
@@ -11,7 +15,13 @@ class SettingsPage(customtkinter.CTkFrame):
         self.audio_manager = audio_manager
         self.settings_manager = settings_manager
         self.switch_to_timer = switch_to_timer
+        # Listed from the stored index right away; the rescan only decodes what changed.
+        self.sound_library = SoundLibrary(self.settings_manager.get("sound_folders", []) or [])
+        self._library_rows = []
         self._build_ui()
+        self._build_library()
+        self._refresh_library()
+        self._rescan_library()
         
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
@@ -93,6 +103,45 @@ class SettingsPage(customtkinter.CTkFrame):
         )
         self.alarm_select_button.grid(row=5, column=0, columnspan=2, padx=20, pady=10, sticky="we")
 
+        self.background_ticks_switch = customtkinter.CTkSwitch(
+            self.settings_frame,
+            text="Tick while minimized",
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            command=self._toggle_background_ticks
+        )
+        self.background_ticks_switch.grid(row=6, column=0, padx=20, pady=(30, 10))
+        if self.settings_manager.get("background_ticks", False):
+            self.background_ticks_switch.select()
+
+        self.normalize_switch = customtkinter.CTkSwitch(
+            self.settings_frame,
+            text="Even out loudness",
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            command=self._toggle_normalize
+        )
+        self.normalize_switch.grid(row=6, column=1, padx=20, pady=(30, 10))
+        if self.settings_manager.get("normalize_loudness", False):
+            self.normalize_switch.select()
+
+        self.high_resolution_switch = customtkinter.CTkSwitch(
+            self.settings_frame,
+            text="Show milliseconds",
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            command=self._toggle_high_resolution
+        )
+        self.high_resolution_switch.grid(row=7, column=0, padx=20, pady=10)
+        if self.settings_manager.get("high_resolution", False):
+            self.high_resolution_switch.select()
+
+        self.refresh_rate_option = customtkinter.CTkOptionMenu(
+            self.settings_frame,
+            values=[f"{fps} fps" for fps in REFRESH_RATES],
+            command=self._change_refresh_rate,
+            font=customtkinter.CTkFont(size=12, weight="bold")
+        )
+        self.refresh_rate_option.grid(row=7, column=1, padx=20, pady=10)
+        self.refresh_rate_option.set(f"{self.settings_manager.get('refresh_rate', 60)} fps")
+
         self.appearance_option = customtkinter.CTkOptionMenu(
             self,
             values=["Light", "Dark", "System"],
@@ -130,15 +179,154 @@ class SettingsPage(customtkinter.CTkFrame):
         )
         self.back_button.grid(row=1, column=0, padx=20, pady=20, sticky="w")
 
+    def _build_library(self):
+        self.library_frame = customtkinter.CTkFrame(self, fg_color="transparent")
+        self.library_frame.grid(row=0, column=2, padx=20, pady=20, sticky="ns")
+        self.library_frame.grid_rowconfigure(3, weight=1)
+
+        self.library_label = customtkinter.CTkLabel(
+            self.library_frame,
+            text="Sound Library",
+            corner_radius=10,
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            fg_color=("gray50", "gray30")
+        )
+        self.library_label.grid(row=0, column=0, padx=10, pady=(0, 10), columnspan=2)
+
+        self.library_target = customtkinter.CTkOptionMenu(
+            self.library_frame,
+            values=["Alarm", "Tick"],
+            command=lambda choice: self._refresh_library(),
+            font=customtkinter.CTkFont(size=12, weight="bold")
+        )
+        self.library_target.grid(row=1, column=0, padx=10, pady=5, sticky="we")
+        self.library_target.set("Alarm")
+
+        self.add_folder_button = customtkinter.CTkButton(
+            self.library_frame,
+            text="Add Folder",
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            command=self._add_sound_folder
+        )
+        self.add_folder_button.grid(row=1, column=1, padx=10, pady=5)
+
+        self.library_search_var = customtkinter.StringVar()
+        self.library_search_var.trace_add("write", lambda *args: self._refresh_library())
+        self.library_search = customtkinter.CTkEntry(
+            self.library_frame,
+            textvariable=self.library_search_var,
+            placeholder_text="Search sounds"
+        )
+        self.library_search.grid(row=2, column=0, padx=10, pady=5, columnspan=2, sticky="we")
+
+        self.library_list = customtkinter.CTkScrollableFrame(self.library_frame, width=320, height=300)
+        self.library_list.grid(row=3, column=0, padx=10, pady=5, columnspan=2, sticky="nsew")
+        self.library_list.grid_columnconfigure(1, weight=1)
+
+        self.library_status_var = customtkinter.StringVar(value="")
+        self.library_status = customtkinter.CTkLabel(
+            self.library_frame,
+            textvariable=self.library_status_var,
+            font=customtkinter.CTkFont(size=12),
+            text_color=("gray50", "gray80")
+        )
+        self.library_status.grid(row=4, column=0, padx=10, pady=(5, 0), columnspan=2)
+
+    def _library_row(self, index):
+        # Rows are created on first use and then reused for every search.
+        while len(self._library_rows) <= index:
+            row = len(self._library_rows)
+            preview = customtkinter.CTkButton(
+                self.library_list, width=30, text="\u25B6", fg_color="transparent",
+                hover_color=("gray70", "gray30"), text_color=("gray10", "gray90")
+            )
+            select = customtkinter.CTkButton(
+                self.library_list, anchor="w", fg_color="transparent",
+                hover_color=("gray70", "gray30"), text_color=("gray10", "gray90"),
+                font=customtkinter.CTkFont(size=12)
+            )
+            preview.grid(row=row, column=0, padx=(0, 5), pady=2)
+            select.grid(row=row, column=1, pady=2, sticky="we")
+            self._library_rows.append((preview, select))
+        return self._library_rows[index]
+
+    def _refresh_library(self):
+        matches = self.sound_library.search(self.library_search_var.get(), limit=LIBRARY_ROWS)
+        for index, info in enumerate(matches):
+            preview, select = self._library_row(index)
+            preview.configure(
+                command=lambda path=info.preview: path and self.audio_manager.play_preview(path)
+            )
+            select.configure(
+                text=f"{info.name}  {info.duration:.1f}s  {info.peak_db:.0f} dB",
+                command=lambda path=info.path: self._select_library_sound(path)
+            )
+            preview.grid()
+            select.grid()
+        for preview, select in self._library_rows[len(matches):]:
+            preview.grid_remove()
+            select.grid_remove()
+        if not self.library_status_var.get().startswith("Indexing"):
+            self.library_status_var.set(f"{len(self.sound_library.entries)} sounds")
+
+    def _rescan_library(self):
+        self.library_status_var.set("Indexing sounds...")
+
+        def done(changed):
+            # Called on the indexer thread.
+            self.after(0, lambda: (self.library_status_var.set(""), self._refresh_library()))
+
+        self.sound_library.scan_async(done)
+
+    def _select_library_sound(self, path):
+        target = self.library_target.get()
+        try:
+            if target == "Tick":
+                self.audio_manager.change_tick_sound(path)
+            else:
+                self.audio_manager.change_alarm_sound(path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load sound:\n{e}")
+            return
+        self.library_status_var.set(f"{target} sound set to {Path(path).name}")
+
+    def _add_sound_folder(self):
+        folder = filedialog.askdirectory(title="Add Sound Folder")
+        if not folder:
+            return
+        folders = list(self.settings_manager.get("sound_folders", []) or [])
+        if folder not in folders:
+            folders.append(folder)
+            self.settings_manager.set("sound_folders", folders)
+        self.sound_library.add_folder(folder)
+        self._rescan_library()
+
+    def settings_changed(self, changed):
+        """Show settings that were edited outside the app."""
+        if "tick_volume" in changed:
+            self.tick_slider.set(self.audio_manager.tick_volume)
+        if "alarm_volume" in changed:
+            self.alarm_slider.set(self.audio_manager.alarm_volume)
+        for key, switch in (
+            ("background_ticks", self.background_ticks_switch),
+            ("normalize_loudness", self.normalize_switch),
+            ("high_resolution", self.high_resolution_switch)
+        ):
+            if key in changed and changed[key]:
+                switch.select()
+            elif key in changed:
+                switch.deselect()
+        if "refresh_rate" in changed:
+            self.refresh_rate_option.set(f"{changed['refresh_rate']} fps")
+        if "appearance_mode" in changed:
+            self.appearance_option.set(customtkinter.get_appearance_mode())
+
     def _set_tick_volume(self, value):
+        # AudioManager persists the value itself.
         self.audio_manager.set_tick_volume(value)
-        self.settings_manager.set("tick_volume", value)
-        self.settings_manager.save()
 
     def _set_alarm_volume(self, value):
         self.audio_manager.set_alarm_volume(value)
-        self.settings_manager.set("alarm_volume", value)
-        self.settings_manager.save()
 
     def _test_tick_sound(self):
         self.audio_manager.play_tick()
@@ -158,8 +346,6 @@ class SettingsPage(customtkinter.CTkFrame):
         if file_path:
             try:
                 self.audio_manager.change_tick_sound(file_path)
-                self.settings_manager.set("tick_sound_path", str(Path(file_path).resolve()))
-                self.settings_manager.save()
                 messagebox.showinfo("Tick Sound Changed", f"Tick sound set to:\n{Path(file_path).name}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load tick sound:\n{e}")
@@ -174,12 +360,24 @@ class SettingsPage(customtkinter.CTkFrame):
         if file_path:
             try:
                 self.audio_manager.change_alarm_sound(file_path)
-                self.settings_manager.set("alarm_sound_path", str(Path(file_path).resolve()))
-                self.settings_manager.save()
                 messagebox.showinfo("Alarm Sound Changed", f"Alarm sound set to:\n{Path(file_path).name}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load alarm sound:\n{e}")
 
+    def _toggle_background_ticks(self):
+        self.settings_manager.set("background_ticks", bool(self.background_ticks_switch.get()))
+
+    def _toggle_normalize(self):
+        self.settings_manager.set("normalize_loudness", bool(self.normalize_switch.get()))
+        self.audio_manager.reload_sounds()
+
+    def _toggle_high_resolution(self):
+        # Picked up by the next countdown that starts.
+        self.settings_manager.set("high_resolution", bool(self.high_resolution_switch.get()))
+
+    def _change_refresh_rate(self, choice):
+        self.settings_manager.set("refresh_rate", int(choice.split()[0]))
+
     def _change_appearance_mode(self, mode):
         """Update and save appearance mode globally."""
         if mode not in ["Light", "Dark", "System"]:
@@ -190,7 +388,6 @@ class SettingsPage(customtkinter.CTkFrame):
     def _reset_to_defaults(self):
         if messagebox.askyesno("Reset Settings", "Are you sure you want to reset all settings to defaults?"):
             self.settings_manager.clear()
-            self.settings_manager.save()
 
             default_tick_volume = 0.5
             default_alarm_volume = 0.5
@@ -204,6 +401,10 @@ class SettingsPage(customtkinter.CTkFrame):
 
             self.tick_slider.set(default_tick_volume)
             self.alarm_slider.set(default_alarm_volume)
+            self.background_ticks_switch.deselect()
+            self.normalize_switch.deselect()
+            self.high_resolution_switch.deselect()
+            self.refresh_rate_option.set("60 fps")
 
             self.appearance_option.set("System")
             customtkinter.set_appearance_mode("System")
@@ -0,0 +1,120 @@
+import customtkinter
+from ..frame_pacer import FramePacer
+from ..stopwatch import Stopwatch, format_precise
+
+
+class StopwatchPage(customtkinter.CTkFrame):
+    def __init__(self, parent, settings_manager, switch_to_timer, histogram=None):
+        super().__init__(parent)
+        self.settings_manager = settings_manager
+        self.switch_to_timer = switch_to_timer
+        self.stopwatch = Stopwatch()
+        self.pacer = FramePacer(self, self._render, histogram=histogram)
+        self._shown_text = None
+        self.configure(fg_color="transparent")
+
+        self._build_ui()
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+    def _build_ui(self):
+        self.stopwatch_frame = customtkinter.CTkFrame(self, fg_color="transparent")
+        self.stopwatch_frame.grid(row=0, column=0)
+        self.stopwatch_frame.grid_columnconfigure((0, 1, 2), weight=1)
+
+        self.time_var = customtkinter.StringVar(value=format_precise(0))
+        self.time_label = customtkinter.CTkLabel(
+            self.stopwatch_frame,
+            textvariable=self.time_var,
+            font=customtkinter.CTkFont(family="Courier", size=110, weight="bold"),
+            text_color=("gray30", "white")
+        )
+        self.time_label.grid(row=0, column=0, padx=20, pady=20, columnspan=3)
+
+        self.start_button = self._button("Start", self._toggle_running)
+        self.start_button.grid(row=1, column=0, padx=10, pady=10)
+        self.lap_button = self._button("Lap", self._lap)
+        self.lap_button.configure(state="disabled")
+        self.lap_button.grid(row=1, column=1, padx=10, pady=10)
+        self.reset_button = self._button("Reset", self._reset)
+        self.reset_button.grid(row=1, column=2, padx=10, pady=10)
+
+        self.laps_box = customtkinter.CTkTextbox(
+            self.stopwatch_frame,
+            height=200,
+            width=420,
+            font=customtkinter.CTkFont(family="Courier", size=16),
+            state="disabled"
+        )
+        self.laps_box.grid(row=2, column=0, padx=20, pady=20, columnspan=3)
+
+        self.back_button = self._button("Back to Timer", self.switch_to_timer, parent=self)
+        self.back_button.grid(row=1, column=0, padx=20, pady=20, sticky="w")
+
+    def _button(self, text, command, parent=None):
+        return customtkinter.CTkButton(
+            parent or self.stopwatch_frame,
+            height=40,
+            corner_radius=10,
+            border_spacing=10,
+            fg_color="transparent",
+            hover_color=("gray70", "gray30"),
+            text_color=("gray10", "gray90"),
+            text=text,
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            command=command
+        )
+
+    # --- Page visibility (called by App) ---
+    def on_show(self):
+        if self.stopwatch.running:
+            self._start_pacer()
+
+    def on_hide(self):
+        # Only the rendering stops; the stopwatch keeps counting.
+        self.pacer.stop()
+
+    def _start_pacer(self):
+        self.pacer.set_fps(self.settings_manager.get("refresh_rate", 60))
+        self.pacer.start()
+
+    # --- Controls ---
+    def _toggle_running(self):
+        if self.stopwatch.running:
+            self.stopwatch.stop()
+            self.pacer.stop()
+            self._render()
+            self.start_button.configure(text="Start")
+            self.lap_button.configure(state="disabled")
+        else:
+            self.stopwatch.start()
+            self._start_pacer()
+            self.start_button.configure(text="Stop")
+            self.lap_button.configure(state="normal")
+
+    def _lap(self):
+        if not self.stopwatch.running:
+            return
+        lap_time, total = self.stopwatch.lap()
+        line = f"Lap {len(self.stopwatch.laps):>3}   {format_precise(lap_time)}   {format_precise(total)}\n"
+        self.laps_box.configure(state="normal")
+        self.laps_box.insert("end", line)
+        self.laps_box.see("end")
+        self.laps_box.configure(state="disabled")
+
+    def _reset(self):
+        self.stopwatch.reset()
+        self.pacer.stop()
+        self._render()
+        self.start_button.configure(text="Start")
+        self.lap_button.configure(state="disabled")
+        self.laps_box.configure(state="normal")
+        self.laps_box.delete("1.0", "end")
+        self.laps_box.configure(state="disabled")
+
+    def _render(self):
+        text = format_precise(self.stopwatch.elapsed())
+        if text != self._shown_text:
+            self._shown_text = text
+            self.time_var.set(text)
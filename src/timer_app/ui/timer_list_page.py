@@ -0,0 +1,224 @@
+import customtkinter
+import numpy as np
+
+ROW_HEIGHT = 32
+REFRESH_MS = 200
+DIM_COLOR = ("gray45", "gray60")
+
+
+class TimerListPage(customtkinter.CTkFrame):
+    """Every timer on the engine, in a list that only draws the rows in view.
+
+    The canvas holds a fixed pool of text items, one row per visible line,
+    which are re-pointed at whichever timers are scrolled into view. Remaining
+    times for all timers are worked out in one NumPy pass per frame, and an
+    item is only reconfigured when its text actually changed.
+    """
+
+    def __init__(self, parent, timer_engine, switch_to_timer):
+        super().__init__(parent)
+        self.timer_engine = timer_engine
+        self.switch_to_timer = switch_to_timer
+        self.configure(fg_color="transparent")
+
+        # Engine snapshot, rebuilt only when timer_engine.version moves.
+        self._version = None
+        self._names = []
+        self._ends = np.empty(0)
+        self._paused = np.empty(0, dtype=bool)
+        self._paused_remaining = np.empty(0)
+
+        self._rows = []
+        self._row_text = []
+        self._first_row = 0
+        self._scroll_span = None
+        self._summary = None
+        self._after_id = None
+
+        self._build_ui()
+
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+    def _build_ui(self):
+        header = customtkinter.CTkFrame(self, fg_color="transparent")
+        header.grid(row=0, column=0, columnspan=2, sticky="ew")
+        header.grid_columnconfigure(1, weight=1)
+
+        self.back_button = customtkinter.CTkButton(
+            header,
+            height=40,
+            corner_radius=10,
+            border_spacing=10,
+            fg_color="transparent",
+            hover_color=("gray70", "gray30"),
+            text_color=("gray10", "gray90"),
+            text="Back",
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            command=self.switch_to_timer
+        )
+        self.back_button.grid(row=0, column=0, padx=20, pady=20, sticky="w")
+
+        self.summary_var = customtkinter.StringVar(value="")
+        self.summary_label = customtkinter.CTkLabel(
+            header,
+            textvariable=self.summary_var,
+            font=customtkinter.CTkFont(size=16),
+            text_color=("gray50", "gray80")
+        )
+        self.summary_label.grid(row=0, column=1, padx=20, pady=20, sticky="e")
+
+        # A plain canvas isn't themed; its colours follow the appearance mode
+        # through _set_appearance_mode().
+        self.canvas = customtkinter.CTkCanvas(
+            self,
+            bg=self._apply_appearance_mode(customtkinter.ThemeManager.theme["CTk"]["fg_color"]),
+            highlightthickness=0
+        )
+        self.canvas.grid(row=1, column=0, padx=(20, 0), pady=(0, 20), sticky="nsew")
+
+        self.scrollbar = customtkinter.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, padx=(0, 20), pady=(0, 20), sticky="ns")
+
+        self.name_font = customtkinter.CTkFont(size=16)
+        self.time_font = customtkinter.CTkFont(family="Courier", size=18, weight="bold")
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda event: self._scroll_to(self._first_row - 3))
+        self.canvas.bind("<Button-5>", lambda event: self._scroll_to(self._first_row + 3))
+        self._build_rows(self.canvas.winfo_height(), self.canvas.winfo_width())
+
+    # --- Row pool ---
+    def _build_rows(self, height, width):
+        self.canvas.delete("row")
+        count = max(1, height // ROW_HEIGHT + 1)
+        text_color = self._apply_appearance_mode(customtkinter.ThemeManager.theme["CTkLabel"]["text_color"])
+        dim_color = self._apply_appearance_mode(DIM_COLOR)
+        self._rows = []
+        for row in range(count):
+            y = row * ROW_HEIGHT + ROW_HEIGHT // 2
+            self._rows.append((
+                self.canvas.create_text(
+                    10, y, anchor="w", text="", font=self.name_font, fill=text_color, tags=("row", "text")),
+                self.canvas.create_text(
+                    width - 110, y, anchor="e", text="", font=self.time_font, fill=text_color, tags=("row", "text")),
+                self.canvas.create_text(
+                    width - 10, y, anchor="e", text="", font=self.name_font, fill=dim_color, tags=("row", "dim")),
+            ))
+        self._row_text = [["", "", ""] for _ in self._rows]
+        self._scroll_span = None
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self.canvas.configure(bg=self._apply_appearance_mode(customtkinter.ThemeManager.theme["CTk"]["fg_color"]))
+        self.canvas.itemconfigure(
+            "text", fill=self._apply_appearance_mode(customtkinter.ThemeManager.theme["CTkLabel"]["text_color"]))
+        self.canvas.itemconfigure("dim", fill=self._apply_appearance_mode(DIM_COLOR))
+
+    def _on_configure(self, event):
+        self._build_rows(event.height, event.width)
+        self._draw_rows()
+
+    # --- Scrolling ---
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._scroll_to(round(float(amount) * len(self._names)))
+        elif unit == "pages":
+            self._scroll_to(self._first_row + int(amount) * (len(self._rows) - 1))
+        else:
+            self._scroll_to(self._first_row + int(amount))
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120, macOS small deltas.
+        steps = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self._scroll_to(self._first_row - steps * 3)
+
+    def _clamp_row(self, first_row):
+        last_start = max(0, len(self._names) - len(self._rows) + 1)
+        return min(max(0, first_row), last_start)
+
+    def _scroll_to(self, first_row):
+        first_row = self._clamp_row(first_row)
+        if first_row != self._first_row:
+            self._first_row = first_row
+            self._draw_rows()
+
+    # --- Page visibility (called by App) ---
+    def on_show(self):
+        if self._after_id is None:
+            self._refresh()
+
+    def on_hide(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _refresh(self):
+        self._draw_rows()
+        self._after_id = self.after(REFRESH_MS, self._refresh)
+
+    def _sync_snapshot(self):
+        if self.timer_engine.version == self._version:
+            return
+        self._version, timers = self.timer_engine.snapshot()
+        count = len(timers)
+        self._names = [timer.name for timer in timers]
+        self._ends = np.fromiter((timer.end_deadline for timer in timers), dtype=float, count=count)
+        # paused_at is read once per timer so a concurrent resume can't split the pair.
+        paused_at = np.fromiter(
+            (np.nan if timer.paused_at is None else timer.paused_at for timer in timers),
+            dtype=float, count=count
+        )
+        self._paused = ~np.isnan(paused_at)
+        self._paused_remaining = np.where(self._paused, self._ends - paused_at, 0.0)
+        self._first_row = self._clamp_row(self._first_row)
+
+    def _draw_rows(self):
+        self._sync_snapshot()
+        now = self.timer_engine.clock.monotonic()
+        remaining = np.where(self._paused, self._paused_remaining, self._ends - now)
+        remaining = np.ceil(np.clip(remaining, 0, None)).astype(np.int64)
+        hours, rest = np.divmod(remaining, 3600)
+        minutes, seconds = np.divmod(rest, 60)
+
+        count = len(self._names)
+        first = self._first_row
+        stop = min(count, first + len(self._rows))
+        visible = zip(
+            self._names[first:stop],
+            hours[first:stop].tolist(),
+            minutes[first:stop].tolist(),
+            seconds[first:stop].tolist(),
+            self._paused[first:stop].tolist()
+        )
+        for row, (name, h, m, s, paused) in enumerate(visible):
+            self._set_row(row, (name, f"{h:02}:{m:02}:{s:02}", "Paused" if paused else ""))
+        for row in range(stop - first, len(self._rows)):
+            self._set_row(row, ("", "", ""))
+
+        if count:
+            paused_count = int(self._paused.sum())
+            running = np.flatnonzero(~self._paused)
+            summary = f"{count} timers, {paused_count} paused"
+            if running.size:
+                next_index = running[np.argmin(remaining[running])]
+                summary += (f", next ends in {hours[next_index]:02}:"
+                            f"{minutes[next_index]:02}:{seconds[next_index]:02}")
+        else:
+            summary = "No timers running"
+        if summary != self._summary:
+            self._summary = summary
+            self.summary_var.set(summary)
+
+        span = (first / count, stop / count) if count else (0.0, 1.0)
+        if span != self._scroll_span:
+            self._scroll_span = span
+            self.scrollbar.set(*span)
+
+    def _set_row(self, row, texts):
+        previous = self._row_text[row]
+        for column, text in enumerate(texts):
+            if previous[column] != text:
+                previous[column] = text
+                self.canvas.itemconfigure(self._rows[row][column], text=text)
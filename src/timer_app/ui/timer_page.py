@@ -1,14 +1,30 @@
 import customtkinter
 import re
-from datetime import datetime, timedelta
+from datetime import datetime
+from ..frame_pacer import FramePacer
+from .digit_display import DigitDisplay
+
+RUNNING_COLOR = ("gray30", "white")
+FLASH_COLOR = ("red", "red")
 
 class TimerPage(customtkinter.CTkFrame):
-    def __init__(self, parent, audio_manager, timer_logic, switch_to_settings):
+    def __init__(self, parent, audio_manager, timer_logic, switch_to_settings, switch_to_timers=None,
+                 switch_to_stopwatch=None, settings_manager=None, frame_histogram=None, switch_to_alarms=None,
+                 switch_to_history=None):
         super().__init__(parent)
         self.audio_manager = audio_manager
         self.timer_logic = timer_logic
         self.switch_to_settings = switch_to_settings
+        self.switch_to_timers = switch_to_timers
+        self.switch_to_stopwatch = switch_to_stopwatch
+        self.switch_to_alarms = switch_to_alarms
+        self.switch_to_history = switch_to_history
+        self.settings_manager = settings_manager
         self._building = False
+        # With the "high_resolution" setting a countdown shows milliseconds,
+        # redrawn by the pacer instead of by the once-a-second ticks.
+        self.precise = False
+        self.pacer = FramePacer(self, self._render_precise, histogram=frame_histogram)
         self.configure(fg_color="transparent")
 
         self._build_ui()
@@ -37,6 +53,27 @@ class TimerPage(customtkinter.CTkFrame):
         self.time_entry.grid(row=0, column=0, padx=20, pady=20, columnspan=2, sticky="n")
         self.time_var.set("00:00:00")
 
+        # Stands in for the entry while a countdown runs, so a tick redraws
+        # only the digits that changed.
+        self.display = DigitDisplay(
+            self.timer_frame,
+            font=self.time_entry.cget("font"),
+            text_color=("white", "white")
+        )
+        self.display.grid(row=0, column=0, padx=20, pady=20, columnspan=2, sticky="n")
+        self.display.grid_remove()
+        self.display.show("00:00:00")
+
+        self.millis_var = customtkinter.StringVar(value=".000")
+        self.millis_label = customtkinter.CTkLabel(
+            self.timer_frame,
+            textvariable=self.millis_var,
+            font=customtkinter.CTkFont(size=60, weight="bold"),
+            text_color=("gray30", "white")
+        )
+        self.millis_label.grid(row=0, column=2, padx=(0, 20), pady=45, sticky="s")
+        self.millis_label.grid_remove()
+
         self.time_entry.bind("<Return>", lambda event: self._toggle_timer())
 
         self.end_label_var = customtkinter.StringVar(value="")
@@ -62,6 +99,21 @@ class TimerPage(customtkinter.CTkFrame):
         )
         self.start_button.grid(row=1, column=0, padx=20, pady=10, columnspan=2)
 
+        self.pause_button = customtkinter.CTkButton(
+            self.timer_frame,
+            height=40,
+            corner_radius=10,
+            border_spacing=10,
+            fg_color="transparent",
+            hover_color=("gray70", "gray30"),
+            text_color=("gray10", "gray90"),
+            text="Pause",
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            state="disabled",
+            command=self._toggle_pause
+        )
+        self.pause_button.grid(row=2, column=0, padx=20, pady=(0, 10), columnspan=2)
+
         self.settings_button = customtkinter.CTkButton(
             self,
             height=40,
@@ -76,6 +128,29 @@ class TimerPage(customtkinter.CTkFrame):
         )
         self.settings_button.grid(row=1, column=0, padx=20, pady=20, sticky="w")
 
+        self.nav_frame = customtkinter.CTkFrame(self, fg_color="transparent")
+        self.nav_frame.grid(row=1, column=0, padx=20, pady=20, sticky="e")
+        for text, command in (
+            ("History", self.switch_to_history),
+            ("Alarms", self.switch_to_alarms),
+            ("Stopwatch", self.switch_to_stopwatch),
+            ("All timers", self.switch_to_timers)
+        ):
+            if command is None:
+                continue
+            customtkinter.CTkButton(
+                self.nav_frame,
+                height=40,
+                corner_radius=10,
+                border_spacing=10,
+                fg_color="transparent",
+                hover_color=("gray70", "gray30"),
+                text_color=("gray10", "gray90"),
+                text=text,
+                font=customtkinter.CTkFont(size=12, weight="bold"),
+                command=command
+            ).pack(side="left", padx=(10, 0))
+
     #----------Dynamic Formatting Handler----------
     def _on_time_change(self, *args):
         if self._building:
@@ -119,30 +194,120 @@ class TimerPage(customtkinter.CTkFrame):
                 )
                 self.audio_manager.stop_alarm()
                 self._clear_end_label()
+                self.millis_label.grid_remove()
 
             else:
                 h, m, s = self._parse_time_entry()
                 total_seconds = h * 3600 + m * 60 + s
                 if total_seconds > 0:
-                    end_dt = datetime.now() + timedelta(seconds=total_seconds)
-                    self._set_end_label_for_datetime(end_dt)
-
                     self.timer_logic.start(total_seconds)
-                    self.start_button.configure(text="Stop")
-                    self.time_entry.configure(
-                        text_color=("white", "white"),
-                        state="disabled"
-                    )
-                    self.focus_set()
+                    hours, rest = divmod(total_seconds, 3600)
+                    self.show_time(hours, *divmod(rest, 60))
+                    self._show_running()
         else:
             self.timer_logic.stop()
+            self.pacer.stop()
             self.start_button.configure(text="Reset")
-            self.time_entry.configure(
-                text_color=("gray50", "gray70"),
-                state="normal"
-            )
+            self.pause_button.configure(text="Pause", state="disabled")
+            self._show_entry(("gray50", "gray70"))
             self._clear_end_label()
 
+    def start_countdown(self, total_seconds):
+        """Start the main countdown from outside the page, e.g. a forwarded command line."""
+        if self.timer_logic._is_running or total_seconds <= 0:
+            return
+        self.audio_manager.stop_alarm()
+        self.timer_logic.start(total_seconds)
+        hours, rest = divmod(total_seconds, 3600)
+        self.timer_restored(hours, *divmod(rest, 60))
+
+    def _show_running(self):
+        if self.timer_logic.is_paused:
+            self.end_label_var.set("Paused")
+            self.pause_button.configure(text="Resume", state="normal")
+        else:
+            self._set_end_label_for_datetime(self.timer_logic.end_datetime)
+            self.pause_button.configure(text="Pause", state="normal")
+        self.start_button.configure(text="Stop")
+        self.time_entry.configure(state="disabled")
+        self.time_entry.grid_remove()
+        self.display.set_color(("white", "white"))
+        self.display.grid()
+        self.focus_set()
+        self._start_precise()
+
+    def _start_precise(self):
+        self.precise = bool(self.settings_manager and self.settings_manager.get("high_resolution", False))
+        if not self.precise:
+            self.millis_label.grid_remove()
+            return
+        self.pacer.set_fps(self.settings_manager.get("refresh_rate", 60))
+        self.millis_label.grid()
+        self._render_precise()
+        if not self.timer_logic.is_paused:
+            self.pacer.start()
+
+    def _render_precise(self):
+        remaining = self.timer_logic.remaining()
+        whole = int(remaining)
+        hours, rest = divmod(whole, 3600)
+        minutes, seconds = divmod(rest, 60)
+        text = f"{hours:02}:{minutes:02}:{seconds:02}"
+        if text != self.display.text:
+            self.show_time(hours, minutes, seconds)
+        millis = f".{int((remaining - whole) * 1000):03}"
+        if millis != self.millis_var.get():
+            self.millis_var.set(millis)
+
+    # --- Page visibility (called by App) ---
+    def on_show(self):
+        if self.precise and self.timer_logic._is_running and not self.timer_logic.is_paused:
+            self.pacer.start()
+
+    def on_hide(self):
+        self.pacer.stop()
+
+    def timer_restored(self, h, m, s):
+        """Show a countdown started outside the page (restored from the journal or forwarded)."""
+        self.show_time(h, m, s)
+        self._show_running()
+
+    def show_time(self, h, m, s):
+        """Set the displayed time without the tick sound and colouring of update_display."""
+        text = f"{h:02}:{m:02}:{s:02}"
+        self.display.show(text)
+        if self.timer_logic._is_running:
+            return
+        self._building = True
+        self.time_var.set(text)
+        self._building = False
+
+    def _show_entry(self, text_color):
+        """Swap the countdown display back for the editable entry, showing the same time."""
+        self._building = True
+        self.time_var.set(self.display.text)
+        self._building = False
+        self.display.grid_remove()
+        self.time_entry.configure(text_color=text_color, state="normal")
+        self.time_entry.grid()
+
+    def _toggle_pause(self):
+        if not self.timer_logic._is_running:
+            return
+        if self.timer_logic.is_paused:
+            self.timer_logic.resume()
+            self._set_end_label_for_datetime(self.timer_logic.end_datetime)
+            self.pause_button.configure(text="Pause")
+            if self.precise:
+                self.pacer.start()
+        else:
+            self.timer_logic.pause()
+            self.end_label_var.set("Paused")
+            self.pause_button.configure(text="Resume")
+            if self.precise:
+                self.pacer.stop()
+                self._render_precise()
+
     # --- Time Parsing Helper ---
     def _parse_time_entry(self):
         text = self.time_var.get()
@@ -156,23 +321,28 @@ class TimerPage(customtkinter.CTkFrame):
             return 0, 0, 0
 
     def update_display(self, h, m, s):
-        self.time_var.set(f"{h:02}:{m:02}:{s:02}")
+        if not self.pacer.running:
+            self.display.show(f"{h:02}:{m:02}:{s:02}")
         self.audio_manager.play_tick()
 
         total_seconds = h * 3600 + m * 60 + s
         if total_seconds < 60:
-            current_color = self.time_entry.cget("text_color")
-            new_color = ("red", "red") if current_color != ("red", "red") else ("gray30", "white")
-            self.time_entry.configure(text_color=new_color)
+            # Flash by recolouring the digits; the layout stays as it is.
+            self.display.set_color(FLASH_COLOR if self.display.color != FLASH_COLOR else RUNNING_COLOR)
         else:
-            self.time_entry.configure(text_color=("gray30", "white"))
+            self.display.set_color(RUNNING_COLOR)
 
     def timer_finished(self):
         """Called automatically when the timer ends."""
         self.timer_logic._is_running = False
+        if self.precise:
+            self.pacer.stop()
+            self.show_time(0, 0, 0)
+            self.millis_var.set(".000")
         self.start_button.configure(text="Reset")
-        self.time_entry.configure(state="normal", text_color=("gray30", "white"))
-        finish_dt = datetime.now()
+        self.pause_button.configure(text="Pause", state="disabled")
+        self._show_entry(RUNNING_COLOR)
+        finish_dt = self.timer_logic.clock.now()
         self.end_label_var.set(f"Finished at {finish_dt.strftime('%H:%M:%S')}")
 
     def _set_end_label_for_datetime(self, dt: datetime):
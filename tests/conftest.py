@@ -0,0 +1,11 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import stubs  # noqa: E402
+
+# No display or sound card needed: the benchmarks' stand-ins replace customtkinter and pygame.
+stubs.install(force=True)
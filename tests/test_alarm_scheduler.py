@@ -0,0 +1,53 @@
+import threading
+import time
+
+from timer_app.alarm_scheduler import MAX_MISSED_COUNT, AlarmScheduler, parse_rule
+
+
+class Settings(dict):
+    def set(self, key, value):
+        self[key] = value
+
+
+def stepped_count(rule, start, end):
+    count = 0
+    fire = rule.next_after(start)
+    while fire is not None and fire <= end and count < MAX_MISSED_COUNT:
+        count += 1
+        fire = rule.next_after(fire)
+    return count
+
+
+def test_cron_count_matches_stepping_through_fire_times():
+    now = time.time()
+    for text in ("30 7 * * mon-fri", "*/15 9-17 * * *", "0 0 29 2 *", "5,10 3 1,15 * sun", "0 */2 * * sat-sun"):
+        rule = parse_rule(text, anchor=now)
+        for start, span in ((now - 40 * 86400, 40 * 86400), (now - 3 * 86400 + 17, 86400), (now - 3600, 59)):
+            assert rule.count_between(start, start + span) == stepped_count(rule, start, start + span), text
+
+
+def test_missed_count_stops_at_limit():
+    now = time.time()
+    rule = parse_rule("* * * * *", anchor=now)
+    assert rule.count_between(now - 86400, now) == MAX_MISSED_COUNT
+    assert rule.count_between(now - 600, now) == 10
+
+
+def test_alarm_added_during_background_load_is_kept():
+    now = time.time()
+    settings = Settings(
+        alarms=[{"name": f"a{i}", "rule": "* * * * *", "created": now - 2 * 86400} for i in range(200)],
+        alarms_checked_at=now - 86400,
+    )
+    scheduler = AlarmScheduler(settings)
+    loaded = threading.Event()
+    result = []
+    scheduler.load_in_background(lambda missed: (result.append(missed), loaded.set()))
+    scheduler.add("new", "every 1h")
+    assert loaded.wait(10)
+    scheduler.close()
+
+    assert len(result[0]) == 200
+    assert all(count == MAX_MISSED_COUNT for _, count in result[0])
+    assert len(scheduler) == 201
+    assert {alarm["name"] for alarm in settings["alarms"]} == {f"a{i}" for i in range(200)} | {"new"}
@@ -0,0 +1,45 @@
+import pytest
+
+from timer_app import control
+from timer_app.control import MAX_NAME_LENGTH, ControlServer
+from timer_app.timer_engine import TimerEngine
+
+pytestmark = pytest.mark.skipif(not control.is_supported(), reason="needs Unix sockets")
+
+
+def make_server(forwarded=None):
+    engine = TimerEngine()
+    server = ControlServer(engine, path="unused", on_forward=forwarded.append if forwarded is not None else None,
+                           reserved_names=("main",))
+    return server, engine
+
+
+@pytest.mark.parametrize("name", ["x" * (MAX_NAME_LENGTH + 1), "a\nb", "", "   ", 5, None])
+def test_start_rejects_bad_names(name):
+    server, engine = make_server()
+    reply = server.handle({"cmd": "start", "name": name, "seconds": 5})
+    assert reply["ok"] is False
+    assert len(engine) == 0
+
+
+@pytest.mark.parametrize("request_", [1, "ping", [], {"cmd": "start", "name": "a", "seconds": 1e400},
+                                      {"cmd": "start", "name": "a", "seconds": -3}])
+def test_bad_requests_get_error_replies(request_):
+    server, engine = make_server()
+    assert server.handle(request_)["ok"] is False
+    assert len(engine) == 0
+
+
+def test_forward_reports_what_it_could_not_do():
+    forwarded = []
+    server, engine = make_server(forwarded)
+    assert server.handle({"cmd": "forward", "argv": ["banana"]})["ok"] is False
+    assert server.handle({"cmd": "forward", "argv": "25m"})["ok"] is False
+    assert server.handle({"cmd": "forward", "argv": ["25m"]}) == {"ok": True}
+
+    engine.start("main", 100)
+    reply = server.handle({"cmd": "forward", "argv": ["5m"]})
+    assert reply["ok"] is False
+    assert "already running" in reply["error"]
+    assert forwarded == [["25m"]]
+    engine.cancel("main")
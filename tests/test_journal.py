@@ -0,0 +1,63 @@
+import random
+import threading
+import time
+
+import pytest
+
+from timer_app.journal import MAX_NAME_BYTES, TimerJournal
+from timer_app.timer_engine import TimerEngine
+
+
+def state(entries):
+    return {name: (entry.total_seconds, entry.end_time, entry.paused_remaining) for name, entry in entries.items()}
+
+
+def test_replay_matches_memory_after_concurrent_appends_and_compaction(tmp_path):
+    journal = TimerJournal(tmp_path / "timers.journal", compact_every=50)
+    journal.replay()
+
+    def append(seed):
+        rng = random.Random(seed)
+        for i in range(2000):
+            name = f"t{seed}-{rng.randrange(20)}"
+            event = rng.randrange(4)
+            if event == 0:
+                journal.record_start(name, 100, 1e9 + i)
+            elif event == 1:
+                journal.record_pause(name, 5.0)
+            elif event == 2:
+                journal.record_resume(name, 2e9 + i)
+            else:
+                journal.record_cancel(name)
+
+    threads = [threading.Thread(target=append, args=(seed,)) for seed in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    expected = state(journal.entries)
+    journal.close()
+
+    assert state(TimerJournal(tmp_path / "timers.journal").replay()) == expected
+
+
+def test_overlong_name_changes_nothing_and_engine_keeps_running(tmp_path):
+    journal = TimerJournal(tmp_path / "timers.journal")
+    journal.replay()
+    engine = TimerEngine(journal=journal)
+    finished = []
+    engine.start("short", 1, on_finish=finished.append)
+
+    with pytest.raises(ValueError):
+        engine.start("x" * (MAX_NAME_BYTES + 1), 5)
+    with pytest.raises(ValueError):
+        journal.record_start("x" * (MAX_NAME_BYTES + 1), 5, 0.0)
+
+    assert engine.names() == ["short"]
+    assert list(journal.entries) == ["short"]
+    deadline = time.monotonic() + 5
+    while not finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert finished == ["short"]
+    journal.close()
+    assert TimerJournal(tmp_path / "timers.journal").replay() == {}
@@ -0,0 +1,18 @@
+import pytest
+
+from timer_app.notifications import CommandSink, FileSink, sinks_from_settings
+
+
+@pytest.mark.parametrize("command", ["", "   ", []])
+def test_empty_command_is_rejected(command):
+    with pytest.raises(ValueError, match="empty command"):
+        CommandSink(command)
+
+
+def test_bad_sink_is_skipped(tmp_path, capsys):
+    sinks = sinks_from_settings([
+        {"type": "command", "command": " "},
+        {"type": "file", "path": str(tmp_path / "events.log")},
+    ])
+    assert [type(sink) for sink in sinks] == [FileSink]
+    assert "empty command" in capsys.readouterr().out
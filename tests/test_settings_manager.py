@@ -0,0 +1,33 @@
+import json
+
+from timer_app.settings_manager import DEFAULT_SETTINGS, SettingsManager
+
+
+def write(path, data):
+    path.write_text(json.dumps(data))
+
+
+def test_invalid_values_on_load_fall_back_to_defaults(tmp_path):
+    path = tmp_path / "user_settings.json"
+    write(path, {"tick_volume": "loud", "refresh_rate": None, "appearance_mode": "Neon", "alarm_volume": 0.25})
+    manager = SettingsManager(path)
+    assert manager.get("tick_volume") == DEFAULT_SETTINGS["tick_volume"]
+    assert manager.get("refresh_rate") == DEFAULT_SETTINGS["refresh_rate"]
+    assert manager.get("appearance_mode") == DEFAULT_SETTINGS["appearance_mode"]
+    assert manager.get("alarm_volume") == 0.25
+
+
+def test_external_edit_with_bad_values_reports_defaults(tmp_path):
+    path = tmp_path / "user_settings.json"
+    manager = SettingsManager(path)
+    manager.set("refresh_rate", 120)
+    manager.set("tick_volume", 0.8)
+    settings = json.loads(path.read_text())
+    settings.update(refresh_rate="fast", tick_volume=7, alarm_volume=0.1, high_resolution=1, sound_folders=[3])
+    write(path, settings)
+
+    reported = []
+    manager._reload(reported.append)
+    assert reported == [{"refresh_rate": 60, "tick_volume": 0.5, "alarm_volume": 0.1}]
+    assert manager.get("high_resolution") is False
+    assert manager.get("sound_folders") == []
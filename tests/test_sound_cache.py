@@ -0,0 +1,47 @@
+import time
+
+from timer_app.sound_cache import SoundCache
+
+# The pygame stand-in "decodes" a file to ten copies of its bytes.
+DECODED_SIZE = 1000
+
+
+def make_sounds(tmp_path, names):
+    paths = {}
+    for name in names:
+        paths[name] = tmp_path / f"{name}.wav"
+        paths[name].write_bytes(name.encode() * 100)
+    return paths
+
+
+def cached_files(cache_dir):
+    return sorted(path.name for path in cache_dir.glob("*.pcm"))
+
+
+def test_disk_cache_evicts_least_recently_used_files(tmp_path):
+    sounds = make_sounds(tmp_path, "abc")
+    cache_dir = tmp_path / "cache"
+    cache = SoundCache(cache_dir, max_disk_bytes=2 * DECODED_SIZE)
+    keys = {name: cache.key_for(path) for name, path in sounds.items()}
+    cache.load(sounds["a"])
+    time.sleep(0.05)
+    cache.load(sounds["b"])
+    time.sleep(0.05)
+    # A hit from disk in a later run counts as a use.
+    SoundCache(cache_dir, max_disk_bytes=2 * DECODED_SIZE).load(sounds["a"])
+    time.sleep(0.05)
+    cache.load(sounds["c"])
+    assert cached_files(cache_dir) == sorted(f"{keys[name]}.pcm" for name in "ac")
+
+
+def test_disk_cache_is_trimmed_on_startup(tmp_path):
+    sounds = make_sounds(tmp_path, "abc")
+    cache_dir = tmp_path / "cache"
+    cache = SoundCache(cache_dir)
+    for path in sounds.values():
+        cache.load(path)
+        time.sleep(0.05)
+    assert len(cached_files(cache_dir)) == 3
+
+    SoundCache(cache_dir, max_disk_bytes=DECODED_SIZE)
+    assert cached_files(cache_dir) == [f"{cache.key_for(sounds['c'])}.pcm"]
@@ -0,0 +1,35 @@
+import customtkinter
+import pytest
+
+from timer_app.timer_engine import TimerEngine
+from timer_app.ui.digit_display import DigitDisplay
+from timer_app.ui.timer_list_page import DIM_COLOR, TimerListPage
+
+
+@pytest.fixture
+def light_mode():
+    customtkinter.set_appearance_mode("Light")
+    yield
+    customtkinter.set_appearance_mode("Light")
+
+
+def test_canvases_follow_appearance_mode(light_mode):
+    background = customtkinter.ThemeManager.theme["CTk"]["fg_color"]
+    text_color = customtkinter.ThemeManager.theme["CTkLabel"]["text_color"]
+    page = TimerListPage(customtkinter.CTk(), TimerEngine(), lambda: None)
+    display = DigitDisplay(customtkinter.CTk(), customtkinter.CTkFont(size=150), ("gray30", "white"))
+    display.show("00:05:00")
+    assert page.canvas.cget("bg") == background[0]
+    assert display.cget("bg") == background[0]
+
+    customtkinter.set_appearance_mode("Dark")
+    assert page.canvas.cget("bg") == background[1]
+    assert page.canvas.item_options["text"]["fill"] == text_color[1]
+    assert page.canvas.item_options["dim"]["fill"] == DIM_COLOR[1]
+    assert display.cget("bg") == background[1]
+    assert display.item_options["cell"]["fill"] == "white"
+
+    display.destroy()
+    customtkinter.set_appearance_mode("Light")
+    assert page.canvas.item_options["text"]["fill"] == text_color[0]
+    assert display.cget("bg") == background[1]
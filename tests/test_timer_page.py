@@ -0,0 +1,90 @@
+import threading
+import time
+
+import customtkinter
+
+from timer_app.timer_engine import TimerEngine
+from timer_app.timer_logic import TimerLogic
+from timer_app.ui.timer_page import TimerPage
+
+CYCLES = 5000
+
+
+class FakeAudio:
+    def play_tick(self): pass
+    def stop_alarm(self): pass
+
+
+def make_page():
+    engine = TimerEngine()
+    logic = TimerLogic(engine=engine)
+    page = TimerPage(customtkinter.CTk(), FakeAudio(), logic, lambda: None)
+    return page, logic, engine
+
+
+def enter_time(page, text):
+    page.time_var.set(text)
+
+
+def test_start_stop_cycles_leave_one_timer_and_one_thread():
+    page, logic, engine = make_page()
+    threads = threading.active_count()
+    # Bounded by TimerEngine._discard_entry compaction: at most 64 stale
+    # entries, or half the heap, on top of the live one.
+    heap_limit = 2 * 65
+
+    for cycle in range(CYCLES):
+        enter_time(page, "000130")
+        page._toggle_timer()  # Start
+        assert logic._is_running
+        assert len(engine) == 1
+        assert page.start_button.cget("text") == "Stop"
+        assert page.pause_button.cget("state") == "normal"
+        assert page.end_label_var.get().startswith("Ends at")
+
+        if cycle % 3 == 0:
+            page._toggle_pause()
+            assert logic.is_paused
+            assert page.end_label_var.get() == "Paused"
+            page._toggle_pause()
+            assert not logic.is_paused
+            assert page.pause_button.cget("text") == "Pause"
+
+        page._toggle_timer()  # Stop
+        assert not logic._is_running
+        assert len(engine) == 0
+        assert page.start_button.cget("text") == "Reset"
+        assert page.pause_button.cget("state") == "disabled"
+        assert page.end_label_var.get() == ""
+
+        page._toggle_timer()  # Reset
+        assert page.start_button.cget("text") == "Start"
+        assert page.time_var.get() == "00:00:00"
+
+        assert len(engine._heap) <= heap_limit
+        # Only the engine's one scheduler thread, however many runs there were.
+        assert threading.active_count() <= threads + 1
+
+
+def test_rapid_restarts_only_tick_the_latest_run():
+    page, logic, engine = make_page()
+    ticks = []
+    logic.on_tick = lambda h, m, s: ticks.append((logic.run_id, h, m, s))
+
+    for _ in range(CYCLES):
+        enter_time(page, "000002")
+        page._toggle_timer()
+        page._toggle_timer()
+        page._toggle_timer()
+    enter_time(page, "000002")
+    page._toggle_timer()
+    final_run = logic.run_id
+
+    deadline = time.monotonic() + 5
+    while logic._is_running and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert not logic._is_running
+    assert len(engine) == 0
+    # A tick left over from any of the stopped runs would show up here.
+    assert [tick[1:] for tick in ticks if tick[0] == final_run] == [(0, 0, 2), (0, 0, 1), (0, 0, 0)]